@@ -14,11 +14,15 @@
     INTRO = ""
 
 import asyncio
+import bisect
 import datetime
+import heapq
 import logging
+import pathlib
 import re
+import time
 import traceback
-from collections import Counter
+from collections import Counter, deque
 from colorama import Fore
 from dataclasses import dataclass
 from io import BytesIO, TextIOWrapper
@@ -38,6 +42,7 @@
 _: Translator = Translator("ConsoleLogs", __file__)
 
 LATEST_LOG_RE = re.compile(r"latest(?:-part(?P<part>\d+))?\.log")
+READ_CHUNK_SIZE = 1 << 20  # The logs files are read by chunks of 1 MiB.
 CONSOLE_LOG_RE = re.compile(
     r"^\[(?P<time_str>.*?)\] \[(?P<level>.*?)\] (?P<logger_name>.*?): (?P<message>.*)"
 )
@@ -65,7 +70,7 @@ async def convert(self, ctx: commands.Context, argument: str) -> int:
 
 @dataclass(frozen=False)
 class ConsoleLog:
-    id: int
+    id: typing.Optional[int]  # `None` for the streamed logs, not read from the files.
     time: datetime.datetime
     time_timestamp: int
     time_str: str
@@ -84,7 +89,7 @@ def __str__(self, with_ansi: bool = False, with_extra_break_line: bool = True) -
             return self.message
         BREAK_LINE = "\n"
         if not with_ansi:
-            return f"#{self.id} [{self.time_str}] {self.level} [{self.logger_name}] {self.message}{BREAK_LINE if self.exc_info is not None else ''}{BREAK_LINE if with_extra_break_line and self.exc_info is not None else ''}{self.exc_info if self.exc_info is not None else ''}"
+            return f"{f'#{self.id} ' if self.id is not None else ''}[{self.time_str}] {self.level} [{self.logger_name}] {self.message}{BREAK_LINE if self.exc_info is not None else ''}{BREAK_LINE if with_extra_break_line and self.exc_info is not None else ''}{self.exc_info if self.exc_info is not None else ''}"
         levels_colors = {
             "CRITICAL": Fore.RED,
             "ERROR": Fore.RED,
@@ -95,7 +100,317 @@ def __str__(self, with_ansi: bool = False, with_extra_break_line: bool = True) -
             "NODE": Fore.MAGENTA,
         }
         level_color = levels_colors.get(self.level, Fore.MAGENTA)
-        return f"{Fore.CYAN}#{self.id} {Fore.BLACK}[{self.time_str}] {level_color}{self.level} {Fore.WHITE}[{Fore.MAGENTA}{self.logger_name}{Fore.WHITE}] {Fore.WHITE}{self.message.split(BREAK_LINE)[0]}{Fore.RESET}{BREAK_LINE if self.exc_info is not None else ''}{BREAK_LINE if with_extra_break_line and self.exc_info is not None else ''}{self.exc_info if self.exc_info is not None else ''}"
+        return f"{Fore.CYAN}{f'#{self.id} ' if self.id is not None else ''}{Fore.BLACK}[{self.time_str}] {level_color}{self.level} {Fore.WHITE}[{Fore.MAGENTA}{self.logger_name}{Fore.WHITE}] {Fore.WHITE}{self.message.split(BREAK_LINE)[0]}{Fore.RESET}{BREAK_LINE if self.exc_info is not None else ''}{BREAK_LINE if with_extra_break_line and self.exc_info is not None else ''}{self.exc_info if self.exc_info is not None else ''}"
+
+
+class ConsoleLogsReader:
+    """Tail the `latest*.log` files, parsing only the bytes appended since the last read.
+
+    The offsets are remembered by inode, so a file renamed by the rotation (`latest.log` to
+    `latest-part1.log`...) isn't parsed again. Only the last `max_entries` parsed logs are kept in
+    memory, indexed by level and by logger name (posting lists in id order), with their timestamps
+    for time range lookups.
+
+    `aread` runs the files reading and parsing in a worker thread, and skips it if no file changed
+    (same inodes, sizes and modification times). The indexes are only updated in the event loop, so
+    the lookups never see them half updated.
+    """
+
+    def __init__(self, logs_path: pathlib.Path, max_entries: int = 20_000) -> None:
+        self.logs_path: pathlib.Path = logs_path
+        self.max_entries: int = max_entries
+        self.intro: typing.Optional[str] = None
+
+        # The evicted logs are only removed from the lists by batches, `_start` is the first kept.
+        self._console_logs: typing.List[ConsoleLog] = []
+        self._timestamps: typing.List[int] = []
+        self._start: int = 0
+        self._by_level: typing.Dict[str, typing.Deque[ConsoleLog]] = {}
+        self._by_logger: typing.Dict[str, typing.Deque[ConsoleLog]] = {}
+
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._files_key: typing.Optional[typing.Tuple[typing.Tuple[int, int, int], ...]] = None
+        self._offsets: typing.Dict[int, int] = {}  # inode: offset
+        self._last_id: int = 0
+        self._last_time: typing.Optional[typing.Tuple[str, datetime.datetime]] = None
+        self._last_console_log: typing.Optional[ConsoleLog] = None
+        self._intro_console_log: typing.Optional[ConsoleLog] = None
+
+    def set_intro(self, intro: str) -> None:
+        self.intro = intro
+        if self._intro_console_log is not None:
+            self._intro_console_log.message = intro
+
+    @property
+    def console_logs(self) -> typing.List[ConsoleLog]:
+        return self._console_logs[self._start :]
+
+    def __len__(self) -> int:
+        return len(self._console_logs) - self._start
+
+    def _append(self, console_log: ConsoleLog) -> None:
+        self._console_logs.append(console_log)
+        self._timestamps.append(console_log.time_timestamp)
+        self._by_level.setdefault(console_log.level, deque()).append(console_log)
+        self._by_logger.setdefault(console_log.logger_name, deque()).append(console_log)
+        if len(self) > self.max_entries:
+            evicted_console_log = self._console_logs[self._start]
+            self._start += 1
+            # The evicted log is the oldest, so the first one of its posting lists.
+            for index, key in (
+                (self._by_level, evicted_console_log.level),
+                (self._by_logger, evicted_console_log.logger_name),
+            ):
+                index[key].popleft()
+                if not index[key]:
+                    del index[key]
+            if self._start >= self.max_entries:
+                del self._console_logs[: self._start]
+                del self._timestamps[: self._start]
+                self._start = 0
+
+    def get(self, id: int) -> typing.Optional[ConsoleLog]:
+        # The ids are consecutive.
+        if not len(self) or id < (first_id := self._console_logs[self._start].id):
+            return None
+        index = self._start + id - first_id
+        return self._console_logs[index] if index < len(self._console_logs) else None
+
+    def since(self, timestamp: int) -> typing.List[ConsoleLog]:
+        """Get the logs strictly after the provided timestamp."""
+        return self._console_logs[
+            bisect.bisect_right(self._timestamps, timestamp, lo=self._start) :
+        ]
+
+    def loggers(self, logger_name: str) -> typing.List[str]:
+        """Get the logger and its children, like `red` for `red.core`."""
+        return [
+            name
+            for name in self._by_logger
+            if name == logger_name or name.startswith(f"{logger_name}.")
+        ]
+
+    def query(
+        self,
+        level: typing.Optional[str] = None,
+        logger_name: typing.Optional[str] = None,
+        ids: typing.Optional[typing.List[int]] = None,
+        search: typing.Optional[str] = None,
+        regex: bool = False,
+    ) -> typing.List[ConsoleLog]:
+        if ids is not None:
+            candidates = [
+                console_log for id in sorted(set(ids)) if (console_log := self.get(id)) is not None
+            ]
+        else:
+            # Start from the smallest posting list, the other filters are checked on it.
+            postings = []
+            if level is not None:
+                postings.append(list(self._by_level.get(level, ())))
+            if logger_name is not None:
+                postings.append(
+                    list(
+                        heapq.merge(
+                            *(self._by_logger[name] for name in self.loggers(logger_name)),
+                            key=lambda console_log: console_log.id,
+                        )
+                    )
+                )
+            candidates = min(postings, key=len) if postings else self.console_logs
+        if logger_name is not None:
+            loggers = set(self.loggers(logger_name))
+        if search is not None:
+            pattern = re.compile(search if regex else re.escape(search), flags=re.IGNORECASE)
+        return [
+            console_log
+            for console_log in candidates
+            if (level is None or console_log.level == level)
+            and (logger_name is None or console_log.logger_name in loggers)
+            and (
+                search is None
+                or pattern.search(console_log.message) is not None
+                or (
+                    console_log.exc_info is not None
+                    and pattern.search(console_log.exc_info) is not None
+                )
+            )
+        ]
+
+    def stats(self) -> typing.Tuple[int, int, typing.Dict[str, int]]:
+        """Get the number of logs, the number of loggers and the number of logs by level."""
+        return (
+            len(self),
+            len(self._by_logger),
+            {level: len(console_logs) for level, console_logs in self._by_level.items()},
+        )
+
+    def read(self) -> typing.List[ConsoleLog]:
+        """Blocking version of `aread`, don't use it in the event loop."""
+        for console_log in self._read_files():
+            self._append(console_log)
+        return self.console_logs
+
+    async def aread(self) -> typing.List[ConsoleLog]:
+        async with self._lock:
+            for console_log in await asyncio.to_thread(self._read_files):
+                self._append(console_log)
+        return self.console_logs
+
+    def _read_files(self) -> typing.Deque[ConsoleLog]:
+        """Parse the new lines of the files, without touching the indexes (thread safe)."""
+        # Thanks to Tobotimus for this part!
+        console_logs_files = sorted(
+            [
+                (path, path.stat())
+                for path in self.logs_path.iterdir()
+                if LATEST_LOG_RE.match(path.name) is not None
+            ],
+            key=lambda file: int(LATEST_LOG_RE.match(file[0].name)["part"] or 0),
+        )
+        files_key = tuple(
+            (stat.st_ino, stat.st_size, stat.st_mtime_ns) for __, stat in console_logs_files
+        )
+        if files_key == self._files_key:
+            return deque()
+        # Only the logs which would be kept by the ring are kept while parsing.
+        new_console_logs = deque(maxlen=self.max_entries)
+        offsets = {}
+        for console_logs_file, stat in console_logs_files:
+            offset = self._offsets.get(stat.st_ino, 0)
+            if stat.st_size < offset:  # Truncated file, or inode reused by a new file.
+                offset = 0
+            if stat.st_size > offset:
+                with console_logs_file.open(mode="rb") as f:
+                    f.seek(offset)
+                    remaining = stat.st_size - offset
+                    partial_line = b""
+                    while remaining > 0 and (chunk := f.read(min(READ_CHUNK_SIZE, remaining))):
+                        remaining -= len(chunk)
+                        data = partial_line + chunk
+                        # Only complete lines are parsed, the last one is completed by the next
+                        # chunk, or will be read later.
+                        end = data.rfind(b"\n") + 1
+                        partial_line = data[end:]
+                        offset += end
+                        for console_log_line in (
+                            data[:end].decode("utf-8", errors="replace").splitlines()
+                        ):
+                            self._parse_line(
+                                console_log_line.strip(), new_console_logs=new_console_logs
+                            )
+            offsets[stat.st_ino] = offset
+        self._offsets = offsets
+        self._files_key = files_key
+        return new_console_logs
+
+    def _parse_time(self, time_str: str) -> datetime.datetime:
+        # Consecutive logs are often in the same second.
+        if self._last_time is None or self._last_time[0] != time_str:
+            self._last_time = (
+                time_str,
+                datetime.datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S"),
+            )
+        return self._last_time[1]
+
+    def _parse_line(
+        self, console_log_line: str, new_console_logs: typing.Deque[ConsoleLog]
+    ) -> None:
+        if (match := re.match(CONSOLE_LOG_RE, console_log_line)) is None:
+            if (last_console_log := self._last_console_log) is None:
+                return
+            if last_console_log.exc_info is None:
+                last_console_log.exc_info = ""
+            last_console_log.exc_info += f"\n{CogsUtils.replace_var_paths(console_log_line)}"
+            last_console_log.exc_info = last_console_log.exc_info.strip()
+            return
+        kwargs = match.groupdict()
+        time = self._parse_time(kwargs["time_str"])
+        kwargs["time"] = time
+        kwargs["time_timestamp"] = int(time.timestamp())
+        kwargs["message"] = kwargs["message"].strip()
+        if not kwargs["message"]:
+            return
+        kwargs["message"] += (
+            "."
+            if not kwargs["message"].endswith((".", "!", "?"))
+            and kwargs["message"][0] == kwargs["message"][0].upper()
+            else ""
+        )
+        kwargs["exc_info"] = None  # Maybe next lines...
+        self._last_id += 1
+        console_log = ConsoleLog(id=self._last_id, **kwargs)
+        new_console_logs.append(console_log)
+        self._last_console_log = console_log
+
+        # Add Red INTRO.
+        if (
+            self._intro_console_log is None
+            and console_log.logger_name == "red"
+            and console_log.message == "Connected to Discord. Getting ready..."
+        ):
+            self._last_id += 1
+            self._intro_console_log = ConsoleLog(
+                id=self._last_id,
+                time=console_log.time,
+                time_timestamp=console_log.time_timestamp,
+                time_str=console_log.time_str,
+                level="INFO",
+                logger_name="red",
+                message=self.intro or "",
+                exc_info=None,
+                display_without_informations=True,
+            )
+            new_console_logs.append(self._intro_console_log)
+
+
+class ConsoleLogsHandler(logging.Handler):
+    """Push the log records into an asyncio queue, from any thread, for the streaming mode."""
+
+    # The messages sent by the streaming mode would be logged again by these loggers.
+    IGNORED_LOGGERS: typing.Tuple[str, ...] = ("discord.http", "discord.webhook")
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, queue: "asyncio.Queue[ConsoleLog]"
+    ) -> None:
+        super().__init__(level=logging.NOTSET)
+        self.loop: asyncio.AbstractEventLoop = loop
+        self.queue: "asyncio.Queue[ConsoleLog]" = queue
+        self._formatter: logging.Formatter = logging.Formatter()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if record.levelno < logging.WARNING and record.name.startswith(self.IGNORED_LOGGERS):
+            return
+        try:
+            # The record is converted now, because its arguments could be modified later.
+            time = datetime.datetime.fromtimestamp(record.created).replace(microsecond=0)
+            message = record.getMessage().strip()
+            if not message:
+                return
+            console_log = ConsoleLog(
+                id=None,
+                time=time,
+                time_timestamp=int(time.timestamp()),
+                time_str=time.strftime("%Y-%m-%d %H:%M:%S"),
+                level=record.levelname,
+                logger_name=record.name,
+                message=message,
+                exc_info=CogsUtils.replace_var_paths(
+                    self._formatter.formatException(record.exc_info)
+                )
+                if record.exc_info
+                else None,
+            )
+            self.loop.call_soon_threadsafe(self._put, console_log)
+        except RuntimeError:  # Closed loop.
+            pass
+        except Exception:
+            self.handleError(record)
+
+    def _put(self, console_log: ConsoleLog) -> None:
+        try:
+            self.queue.put_nowait(console_log)
+        except asyncio.QueueFull:
+            pass
 
 
 @cog_i18n(_)
@@ -123,13 +438,33 @@ def __init__(self, bot: Red) -> None:
             ignored_cogs=[],
         )
 
+        self.config.register_global(
+            streaming=False,
+            streaming_flush_interval=5,  # seconds
+        )
+
         self.RED_INTRO: str = None
         self._last_console_log_sent_timestamp: int = None
+        self._streaming_queue: "asyncio.Queue[ConsoleLog]" = asyncio.Queue(maxsize=10_000)
+        self._streaming_handler: typing.Optional[ConsoleLogsHandler] = None
+        self._streaming_task: typing.Optional[asyncio.Task] = None
+        self._streaming_pending: typing.Dict[
+            int, typing.Deque[typing.Tuple[typing.Optional[discord.Embed], typing.Optional[str]]]
+        ] = {}
+        # Token bucket by channel: (available messages, last refill).
+        self._streaming_tokens: typing.Dict[int, typing.Tuple[float, float]] = {}
+        self.console_logs_reader: ConsoleLogsReader = ConsoleLogsReader(
+            logs_path=data_manager.core_data_path() / "logs"
+        )
 
     async def cog_load(self) -> None:
         await super().cog_load()
         asyncio.create_task(self.load())
 
+    async def cog_unload(self) -> None:
+        self.stop_streaming()
+        await super().cog_unload()
+
     async def load(self) -> None:
         await self.bot.wait_until_red_ready()
         self.RED_INTRO: str = INTRO
@@ -166,6 +501,7 @@ async def load(self) -> None:
         self.RED_INTRO += (
             f"\nLoaded {len(self.bot.cogs)} cogs with {len(self.bot.commands)} commands"
         )
+        self.console_logs_reader.set_intro(self.RED_INTRO)
 
         self._last_console_log_sent_timestamp: int = int(
             datetime.datetime.now(tz=datetime.timezone.utc).timestamp()
@@ -178,76 +514,84 @@ async def load(self) -> None:
                 minutes=1,
             )
         )
+        if await self.config.streaming():
+            await self.start_streaming()
 
-    @property
-    def console_logs(self) -> typing.List[ConsoleLog]:
-        # Thanks to Tobotimus for this part!
-        console_logs_files = sorted(
-            [
-                path
-                for path in (data_manager.core_data_path() / "logs").iterdir()
-                if LATEST_LOG_RE.match(path.name) is not None
-            ],
-            key=lambda x: x.name,
+    async def start_streaming(self) -> None:
+        if self._streaming_handler is not None:
+            return
+        self._streaming_handler = ConsoleLogsHandler(
+            loop=asyncio.get_running_loop(), queue=self._streaming_queue
         )
-        if not console_logs_files:
-            return []
-        console_logs_lines = []
-        for console_logs_file in console_logs_files:
-            with console_logs_file.open(mode="rt") as f:
-                console_logs_lines.extend([line.strip() for line in f.readlines()])
-
-        # Parse logs.
-        console_logs = []
-        for console_log_line in console_logs_lines:
-            if (match := re.match(CONSOLE_LOG_RE, console_log_line)) is None:
-                if not console_logs:
-                    continue
-                if console_logs[-1].exc_info is None:
-                    console_logs[-1].exc_info = ""
-                console_logs[-1].exc_info += f"\n{CogsUtils.replace_var_paths(console_log_line)}"
-                console_logs[-1].exc_info = console_logs[-1].exc_info.strip()
-                continue
-            kwargs = match.groupdict()
-            time = datetime.datetime.strptime(kwargs["time_str"], "%Y-%m-%d %H:%M:%S")
-            kwargs["time"] = time
-            kwargs["time_timestamp"] = int(time.timestamp())
-            kwargs["message"] = kwargs["message"].strip()
-            if not kwargs["message"]:
-                continue
-            kwargs["message"] += (
-                "."
-                if not kwargs["message"].endswith((".", "!", "?"))
-                and kwargs["message"][0] == kwargs["message"][0].upper()
-                else ""
-            )
-            kwargs["exc_info"] = None  # Maybe next lines...
-            console_logs.append(ConsoleLog(id=0, **kwargs))
+        logging.getLogger().addHandler(self._streaming_handler)
+        red_logger = logging.getLogger("red")
+        if not red_logger.propagate:
+            red_logger.addHandler(self._streaming_handler)
+        self._streaming_task = asyncio.create_task(self.stream_console_logs())
 
-        # Add Red INTRO.
-        if red_ready_console_log := discord.utils.get(
-            console_logs, logger_name="red", message="Connected to Discord. Getting ready..."
-        ):
-            console_logs.insert(
-                console_logs.index(red_ready_console_log) + 1,
-                ConsoleLog(
-                    id=0,
-                    time=red_ready_console_log.time,
-                    time_timestamp=red_ready_console_log.time_timestamp,
-                    time_str=red_ready_console_log.time_str,
-                    level="INFO",
-                    logger_name="red",
-                    message=self.RED_INTRO,
-                    exc_info=None,
-                    display_without_informations=True,
-                ),
-            )
+    def stop_streaming(self) -> None:
+        if self._streaming_handler is not None:
+            logging.getLogger().removeHandler(self._streaming_handler)
+            logging.getLogger("red").removeHandler(self._streaming_handler)
+            self._streaming_handler = None
+        if self._streaming_task is not None:
+            self._streaming_task.cancel()
+            self._streaming_task = None
+        self._streaming_pending = {}
+        self._streaming_tokens = {}
+        # Don't send the logs already streamed again with the files polling.
+        self._last_console_log_sent_timestamp = int(
+            datetime.datetime.now(tz=datetime.timezone.utc).timestamp()
+        )
 
-        # Update ID.
-        for id, console_log in enumerate(console_logs, start=1):
-            console_log.id = id
+    async def stream_console_logs(self) -> None:
+        while True:
+            await asyncio.sleep(await self.config.streaming_flush_interval())
+            try:
+                await self._flush_streamed_console_logs()
+            except Exception as e:
+                self.logger.error("Error when flushing the streamed console logs.", exc_info=e)
 
-        return console_logs
+    async def _flush_streamed_console_logs(self) -> None:
+        console_logs = []
+        while not self._streaming_queue.empty():
+            console_logs.append(self._streaming_queue.get_nowait())
+        destinations = await self.get_console_logs_destinations()
+        if console_logs:
+            console_logs_to_send = self.get_console_logs_to_send(console_logs)
+            for channel, settings in destinations.items():
+                pending = self._streaming_pending.setdefault(channel.id, deque(maxlen=100))
+                for embed, pages in self.filter_console_logs_to_send(
+                    console_logs_to_send, settings=settings
+                ):
+                    if embed is not None:
+                        pending.append((embed, None))
+                    pending.extend((None, page) for page in pages)
+        # Rate limit aware: Discord allows 5 messages every 5 seconds in a channel, so a token is
+        # refilled every second, up to 5. The next messages are kept for the next flushes.
+        for channel_id, pending in list(self._streaming_pending.items()):
+            channel = discord.utils.get(destinations, id=channel_id)
+            if channel is None:
+                del self._streaming_pending[channel_id]
+                self._streaming_tokens.pop(channel_id, None)
+                continue
+            now = time.monotonic()
+            tokens, last_refill = self._streaming_tokens.get(channel_id, (5, now))
+            tokens = min(5, tokens + (now - last_refill))
+            while pending and tokens >= 1:
+                tokens -= 1
+                embed, content = pending.popleft()
+                try:
+                    await channel.send(content=content, embed=embed)
+                except discord.HTTPException as e:
+                    self.logger.error(
+                        f"Error when streaming the console logs in {channel.id}.", exc_info=e
+                    )
+                    break
+            self._streaming_tokens[channel_id] = (tokens, now)
+
+    async def get_console_logs(self) -> typing.List[ConsoleLog]:
+        return await self.console_logs_reader.aread()
 
     async def send_console_logs(
         self,
@@ -259,19 +603,18 @@ async def send_console_logs(
         logger_name: typing.Optional[str] = None,
         view: typing.Optional[int] = -1,
         lines_break: int = 2,
+        search: typing.Optional[str] = None,
+        regex: bool = False,
     ) -> None:
-        console_logs = self.console_logs
-        console_logs_to_display = [
-            console_log
-            for console_log in console_logs
-            if (level is None or console_log.level == level)
-            and (
-                logger_name is None
-                or ".".join(console_log.logger_name.split(".")[: len(logger_name.split("."))])
-                == logger_name
+        await self.console_logs_reader.aread()
+        try:
+            console_logs_to_display = self.console_logs_reader.query(
+                level=level, logger_name=logger_name, ids=ids, search=search, regex=regex
+            )
+        except re.error as e:
+            raise commands.UserFeedbackCheckFailure(
+                _("Invalid regex pattern: {error}").format(error=e)
             )
-            and (ids is None or console_log.id in ids)
-        ]
         if not console_logs_to_display:
             raise commands.UserFeedbackCheckFailure(_("No logs to display."))
         console_logs_to_display_str = [
@@ -284,13 +627,14 @@ async def send_console_logs(
             for console_log in console_logs_to_display
         ]
         levels = ["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG", "TRACE", "NODE"]
+        total_logs, total_loggers, total_levels = self.console_logs_reader.stats()
         total_stats = [
-            f"{len(console_logs)} logs",
-            f"{len({console_log.logger_name for console_log in console_logs})} loggers",
+            f"{total_logs} logs",
+            f"{total_loggers} loggers",
             *[
                 f"{stat[1]} {stat[0]}"
                 for stat in sorted(
-                    Counter([console_log.level for console_log in console_logs]).items(),
+                    total_levels.items(),
                     key=lambda x: levels.index(x[0]) if x[0] in levels else 10,
                 )
             ],
@@ -469,10 +813,20 @@ async def view(
             view=index,
         )
 
+    @consolelogs.command()
+    async def search(self, ctx: commands.Context, *, query: str) -> None:
+        """Search the console logs messages and tracebacks, with a case insensitive text."""
+        await self.send_console_logs(ctx, view=None, search=query)
+
+    @consolelogs.command()
+    async def searchregex(self, ctx: commands.Context, *, pattern: str) -> None:
+        """Search the console logs messages and tracebacks, with a case insensitive regex."""
+        await self.send_console_logs(ctx, view=None, search=pattern, regex=True)
+
     @consolelogs.command(aliases=["listloggers"])
     async def stats(self, ctx: commands.Context) -> None:
         """Display the stats for the bot logs since the bot start."""
-        console_logs = self.console_logs
+        console_logs = await self.get_console_logs()
         console_logs_for_each_logger = {"Global Stats": console_logs}
         for console_log in console_logs:
             if console_log.logger_name not in console_logs_for_each_logger:
@@ -557,6 +911,29 @@ async def removechannel(
         await self.config.channel(channel).clear()
         await ctx.send(_("Errors logging disabled in {channel.mention}.").format(channel=channel))
 
+    @consolelogs.command()
+    async def streaming(
+        self,
+        ctx: commands.Context,
+        state: bool,
+        flush_interval: typing.Optional[commands.Range[int, 1, 60]] = None,
+    ) -> None:
+        """Stream the console logs in real time to the channels, instead of reading the files every minute.
+
+        **Parameters:**
+        - `state`: Enable or disable the streaming mode.
+        - `flush_interval`: The number of seconds between two sendings of the streamed logs. Default is 5 seconds.
+        """
+        await self.config.streaming.set(state)
+        if flush_interval is not None:
+            await self.config.streaming_flush_interval.set(flush_interval)
+        if state:
+            await self.start_streaming()
+            await ctx.send(_("Console logs streaming enabled."))
+        else:
+            self.stop_streaming()
+            await ctx.send(_("Console logs streaming disabled."))
+
     @consolelogs.command(hidden=True)
     async def getdebugloopsstatus(self, ctx: commands.Context) -> None:
         """Get an embed to check loops status."""
@@ -699,8 +1076,13 @@ async def on_command_error(
             for page in pages:
                 await channel.send(page)
 
-    async def check_console_logs(self) -> None:
-        destinations = {
+    async def get_console_logs_destinations(
+        self,
+    ) -> typing.Dict[
+        typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+        typing.Dict[str, typing.Any],
+    ]:
+        return {
             channel: settings
             for channel_id, settings in (await self.config.all_channels()).items()
             if settings["enabled"]
@@ -708,17 +1090,15 @@ async def check_console_logs(self) -> None:
             and (channel := self.bot.get_channel(channel_id)) is not None
             and channel.permissions_for(channel.guild.me).send_messages
         }
-        if not destinations:
-            return
-        console_logs = self.console_logs
+
+    def get_console_logs_to_send(
+        self, console_logs: typing.List[ConsoleLog]
+    ) -> typing.List[typing.Tuple[typing.Optional[discord.Embed], typing.List[str]]]:
         console_logs_to_send: typing.List[
             typing.Tuple[typing.Optional[discord.Embed], typing.List[str]]
         ] = []
         pages_to_send: typing.List[str] = []
         for console_log in console_logs:
-            if self._last_console_log_sent_timestamp >= console_log.time_timestamp:
-                continue
-            self._last_console_log_sent_timestamp = console_log.time_timestamp
             pages_to_send.append(console_log.__str__(with_ansi=False, with_extra_break_line=False))
             if (
                 console_log.level in ("CRITICAL", "ERROR")
@@ -774,13 +1154,38 @@ async def check_console_logs(self) -> None:
                 )
             )
             pages_to_send = []
+        return console_logs_to_send
 
+    def filter_console_logs_to_send(
+        self,
+        console_logs_to_send: typing.List[
+            typing.Tuple[typing.Optional[discord.Embed], typing.List[str]]
+        ],
+        settings: typing.Dict[str, typing.Any],
+    ) -> typing.List[typing.Tuple[typing.Optional[discord.Embed], typing.List[str]]]:
+        return [
+            (embed, pages)
+            for embed, pages in console_logs_to_send
+            if (embed is not None and settings["dpy_ignored_exceptions"])
+            or (embed is None and settings["full_console"])
+        ]
+
+    async def check_console_logs(self) -> None:
+        if self._streaming_handler is not None:
+            return
+        destinations = await self.get_console_logs_destinations()
+        if not destinations:
+            return
+        await self.console_logs_reader.aread()
+        console_logs = self.console_logs_reader.since(self._last_console_log_sent_timestamp)
+        if not console_logs:
+            return
+        self._last_console_log_sent_timestamp = console_logs[-1].time_timestamp
+        console_logs_to_send = self.get_console_logs_to_send(console_logs)
         for channel, settings in destinations.items():
-            for embed, pages in console_logs_to_send:
-                if embed is not None and not settings["dpy_ignored_exceptions"]:
-                    continue
-                elif embed is None and not settings["full_console"]:
-                    continue
+            for embed, pages in self.filter_console_logs_to_send(
+                console_logs_to_send, settings=settings
+            ):
                 if embed is not None:
                     await channel.send(embed=embed)
                 for page in pages:
@@ -26,7 +26,7 @@ async def on_dashboard_cog_add(self, dashboard_cog: commands.Cog) -> None:
 
     @dashboard_page(name=None, description="Display the console logs.", is_owner=True)
     async def rpc_callback(self, **kwargs) -> typing.Dict[str, typing.Any]:
-        console_logs = self.console_logs
+        console_logs = await self.get_console_logs()
         source = """
             {% for console_log in console_logs %}
                 {{ console_log|highlight("python") }}
@@ -1,4 +1,4 @@
-from AAA3A_utils import Cog, Settings  # isort:skip
+from AAA3A_utils import Cog, Menu, Settings  # isort:skip
 from redbot.core import commands, Config  # isort:skip
 from redbot.core.bot import Red  # isort:skip
 from redbot.core.i18n import Translator, cog_i18n  # isort:skip
@@ -11,6 +11,7 @@
 # import importlib
 # import sys
 from fernet import Fernet
+from redbot.core.utils.chat_formatting import box, humanize_number, pagify
 
 from .rpc import DashboardRPC
 
@@ -426,3 +427,71 @@ async def set_secret_button(
         view._message = await ctx.send(
             _("Click on the button below to set a secret for Discord OAuth."), view=view
         )
+
+    @setdashboard.command()
+    async def stats(self, ctx: commands.Context, handler: typing.Optional[str] = None) -> None:
+        """Show the RPC handlers metrics (calls, latencies and payload sizes), or the profiles of the slow calls of a handler.
+
+        Third parties pages are named `third_party:<third_party>/<page>`.
+        """
+        if handler is not None:
+            if not (profiles := self.rpc.metrics.profiles.get(handler)):
+                raise commands.UserFeedbackCheckFailure(
+                    _(
+                        "No slow call profiled for this handler. Use `{prefix}setdashboard rpcprofiling` to enable the profiling."
+                    ).format(prefix=ctx.clean_prefix)
+                )
+            pages = []
+            for timestamp, duration, profile in reversed(profiles):
+                for page in pagify(profile, page_length=1800):
+                    pages.append(
+                        f"**{handler}** - <t:{int(timestamp)}:R> - {duration:.1f}ms"
+                        + box(page, lang="py")
+                    )
+            await Menu(pages=pages).start(ctx)
+            return
+        if not (stats := self.rpc.metrics.get_stats()):
+            raise commands.UserFeedbackCheckFailure(_("No RPC call recorded yet."))
+        cache_stats = self.rpc.third_parties_handler.get_cache_stats()
+        description = ""
+        for name, handler_stats in stats.items():
+            description += (
+                f"\n\n---------- {name} ----------"
+                f"\n• {humanize_number(handler_stats['calls'])} calls ({humanize_number(handler_stats['errors'])} errors)"
+                f"\n• {handler_stats['average_time']:.1f}ms average, {handler_stats['max_time']:.1f}ms max"
+                f"\n• {round(handler_stats['average_payload_size'] or 0)} bytes average payload, {handler_stats['max_payload_size']} bytes max (sampled)"
+                f"\n• {', '.join(f'{bucket}: {count}' for bucket, count in handler_stats['histogram'].items() if count)}"
+            )
+            if handler_stats["slow_calls_profiled"]:
+                description += f"\n• {handler_stats['slow_calls_profiled']} slow calls profiled"
+            if (
+                name.startswith("third_party:")
+                and (page_cache_stats := cache_stats.get(name[len("third_party:") :])) is not None
+            ):
+                description += f"\n• {page_cache_stats['hit_rate']:.0%} cache hit rate ({page_cache_stats['hits']} hits, {page_cache_stats['misses']} misses)"
+        await Menu(pages=list(pagify(description, page_length=1000)), lang="py").start(ctx)
+
+    @setdashboard.command()
+    async def statsreset(self, ctx: commands.Context) -> None:
+        """Reset the metrics of all the RPC handlers and the stats of the third parties pages cache."""
+        self.rpc.metrics.reset()
+        self.rpc.third_parties_handler.cache_stats.clear()
+        await ctx.send(_("RPC metrics reset."))
+
+    @setdashboard.command()
+    async def rpcprofiling(
+        self, ctx: commands.Context, threshold: commands.Range[int, 0, None]
+    ) -> None:
+        """Profile with cProfile the RPC calls slower than a threshold in milliseconds, `0` to disable.
+
+        The profiles are kept in memory until the cog is reloaded, and are displayed with `[p]setdashboard stats <handler>`.
+        """
+        self.rpc.metrics.profiling_threshold = threshold or None
+        if threshold:
+            await ctx.send(
+                _("The RPC calls slower than {threshold}ms will be profiled.").format(
+                    threshold=threshold
+                )
+            )
+        else:
+            await ctx.send(_("RPC profiling disabled."))
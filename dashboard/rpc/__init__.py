@@ -17,7 +17,7 @@
 from .default_cogs import DashboardRPC_DefaultCogs
 from .pagination import Pagination
 from .third_parties import DashboardRPC_ThirdParties
-from .utils import rpc_check
+from .utils import RPCMetrics, rpc_check
 from .webhooks import DashboardRPC_Webhooks
 
 # Credits:
@@ -36,6 +36,8 @@ def __init__(self, bot: Red, cog: commands.Cog) -> None:
         # To make sure that both RPC server and client are on the same "version".
         self.version: int = random.randint(1, 10000)
 
+        self.metrics: RPCMetrics = RPCMetrics()
+
         # Initialize RPC handlers.
         self.bot.register_rpc_handler(self.check_version)
         self.bot.register_rpc_handler(self.get_data)
@@ -52,6 +54,7 @@ def __init__(self, bot: Red, cog: commands.Cog) -> None:
         self.bot.register_rpc_handler(self.get_bot_settings)
         self.bot.register_rpc_handler(self.set_bot_settings)
         self.bot.register_rpc_handler(self.set_custom_pages)
+        self.bot.register_rpc_handler(self.get_rpc_stats)
 
         # Initialize handlers.
         self.handlers: typing.Dict[str, typing.Any] = {}
@@ -66,16 +69,40 @@ def __init__(self, bot: Red, cog: commands.Cog) -> None:
         self.invite_url: str = None
         self.owner: str = None
         self.cogs_infos_cache: typing.Dict[str, typing.Dict[str, str]] = {}
-        self.guilds_cache: typing.Dict[
-            int,
-            typing.Dict[
-                typing.Literal["guilds", "time"], typing.Union[typing.List[typing.Dict], int]
-            ],
+        # The guilds of the dashboard users (filled on first request, then kept up to date by the
+        # members/guilds events) and their role level in each guild (with a TTL, because Red's
+        # admin/mod roles can be edited without any event).
+        self.users_guilds: typing.Dict[int, typing.Set[int]] = {}
+        self.users_guilds_roles: typing.Dict[
+            typing.Tuple[int, int],
+            typing.Tuple[typing.Optional[typing.Literal["OWNER", "ADMIN", "MOD"]], float],
         ] = {}
+        self.bot.add_listener(self.on_member_join)
+        self.bot.add_listener(self.on_member_remove)
+        self.bot.add_listener(self.on_member_update)
+        self.bot.add_listener(self.on_guild_join)
+        self.bot.add_listener(self.on_guild_remove)
+        self.bot.add_listener(self.on_guild_update)
+        self.bot.add_listener(self.on_guild_role_update)
+        # The serialized commands tree, rebuilt only when a cog or a command is added/removed.
+        self.commands_version: int = 0
+        self.commands_cache: typing.Optional[typing.Dict[str, typing.Dict[str, typing.Any]]] = None
+        self._commands_fingerprint: typing.Optional[typing.Tuple[int, int]] = None
+        self.bot.add_listener(self.invalidate_commands_cache, name="on_cog_add")
+        self.bot.add_listener(self.invalidate_commands_cache, name="on_cog_remove")
 
     def unload(self) -> None:
         if hasattr(self.bot, "dashboard_url"):
             delattr(self.bot, "dashboard_url")
+        self.bot.remove_listener(self.invalidate_commands_cache, name="on_cog_add")
+        self.bot.remove_listener(self.invalidate_commands_cache, name="on_cog_remove")
+        self.bot.remove_listener(self.on_member_join)
+        self.bot.remove_listener(self.on_member_remove)
+        self.bot.remove_listener(self.on_member_update)
+        self.bot.remove_listener(self.on_guild_join)
+        self.bot.remove_listener(self.on_guild_remove)
+        self.bot.remove_listener(self.on_guild_update)
+        self.bot.remove_listener(self.on_guild_role_update)
         self.bot.unregister_rpc_handler(self.check_version)
         self.bot.unregister_rpc_handler(self.get_data)
         self.bot.unregister_rpc_handler(self.get_variables)
@@ -91,6 +118,7 @@ def unload(self) -> None:
         self.bot.unregister_rpc_handler(self.get_bot_settings)
         self.bot.unregister_rpc_handler(self.set_bot_settings)
         self.bot.unregister_rpc_handler(self.set_custom_pages)
+        self.bot.unregister_rpc_handler(self.get_rpc_stats)
         for handler in self.handlers.values():
             handler.unload()
 
@@ -98,6 +126,13 @@ def unload(self) -> None:
     async def check_version(self) -> typing.Dict[str, int]:
         return {"version": self.bot.get_cog("Dashboard").rpc.version}
 
+    @rpc_check()
+    async def get_rpc_stats(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        return {
+            "handlers": self.metrics.get_stats(),
+            "third_parties_cache": self.third_parties_handler.get_cache_stats(),
+        }
+
     @rpc_check()
     async def get_data(self) -> typing.Dict[str, typing.Any]:
         data = await self.cog.config.webserver()
@@ -134,10 +169,22 @@ async def get_variables(
         self,
         only_bot_variables: bool = False,
         host_port: typing.Optional[typing.Tuple[str, int]] = None,
+        commands_etag: typing.Optional[str] = None,
     ) -> typing.Dict[str, typing.Any]:
         variables = await self.get_bot_variables()
         variables.update(third_parties=await self.third_parties_handler.get_third_parties())
-        variables.update(commands={} if only_bot_variables else await self.get_commands())
+        if only_bot_variables:
+            variables.update(commands={})
+        elif commands_etag is not None:
+            # The web side already has the commands tree with this ETag, don't send it again.
+            commands_infos = await self.get_commands(etag=commands_etag)
+            variables.update(
+                commands=commands_infos["commands"],
+                commands_etag=commands_infos["etag"],
+                commands_not_modified=commands_infos["not_modified"],
+            )
+        else:
+            variables.update(commands=await self.get_commands())
         if host_port is not None:
             redirect_uri = await self.cog.config.webserver.core.redirect_uri()
             host, port = host_port
@@ -278,8 +325,46 @@ async def build_cmd_list(
                     final += await self.build_cmd_list(command.commands, details=False)
         return final
 
+    async def invalidate_commands_cache(self, *args, **kwargs) -> None:
+        self.commands_version += 1
+        self.commands_cache = None
+
+    @property
+    def commands_etag(self) -> str:
+        # The RPC version changes with each load, so an old ETag is never valid after a reload.
+        return f"{self.version}-{self.commands_version}"
+
     @rpc_check()
     async def get_commands(
+        self, etag: typing.Optional[str] = None
+    ) -> typing.Dict[
+        str,
+        typing.Dict[
+            str, typing.Union[str, typing.List[typing.Dict[str, typing.Union[str, typing.List]]]]
+        ],
+    ]:
+        """Get the serialized commands tree.
+
+        If `etag` is provided, the result is `{"etag": ..., "not_modified": ..., "commands": ...}`,
+        and `commands` is `None` if the tree didn't change since this ETag.
+        """
+        # Commands added/removed without a cog being added/removed (`bot.add_command`...).
+        fingerprint = (len(self.bot.cogs), len(self.bot.all_commands))
+        if fingerprint != self._commands_fingerprint:
+            self._commands_fingerprint = fingerprint
+            await self.invalidate_commands_cache()
+        if self.commands_cache is None:
+            self.commands_cache = await self.build_commands()
+        if etag is None:
+            return self.commands_cache
+        not_modified = etag == self.commands_etag
+        return {
+            "etag": self.commands_etag,
+            "not_modified": not_modified,
+            "commands": None if not_modified else self.commands_cache,
+        }
+
+    async def build_commands(
         self,
     ) -> typing.Dict[
         str,
@@ -364,24 +449,33 @@ async def get_user_guilds(
             # Bot doesn't even find user using bot.get_user, might as well spare all the data processing and return.
             return {"guilds": [], "total": 0, "per_page": 10, "pages": 0, "page": 1}
         is_owner = user.id in self.bot.owner_ids
+        if user_id not in self.users_guilds:
+            self.users_guilds[user_id] = {guild.id for guild in user.mutual_guilds}
+        # The levels included by each filter, like the guild owner for the `admin` filter.
+        roles_levels = ["OWNER", "ADMIN", "MOD"]
         guilds = []
-        if filter is None and user_id in self.guilds_cache:
-            cached = self.guilds_cache[user_id]
-            if (cached["time"] + 60) > time.time():
-                guilds = cached["guilds"]
-            else:
-                del self.guilds_cache[user_id]
-
-        if not guilds:
-            # This could take a while.
-            async for guild in AsyncIter(
-                sorted(
-                    self.bot.guilds,
-                    key=lambda guild: (guild.owner.id != user_id, guild.name.lower()),
-                ),
-                steps=1300,
-            ):
-                guild_infos = {
+        for guild in sorted(
+            (
+                self.bot.guilds
+                if filter is None and is_owner
+                else (
+                    guild
+                    for guild_id in self.users_guilds[user_id]
+                    if (guild := self.bot.get_guild(guild_id)) is not None
+                )
+            ),
+            key=lambda guild: (guild.owner_id != user_id, guild.name.lower()),
+        ):
+            if filter is None and is_owner:
+                user_role = None
+            elif (user_role := await self.get_user_guild_role(user_id, guild)) is None:
+                continue
+            elif filter is not None:
+                if roles_levels.index(user_role) > roles_levels.index(filter.upper()):
+                    continue
+                user_role = filter.upper()
+            guilds.append(
+                {
                     "id": guild.id,
                     "name": guild.name,
                     "owner": guild.owner.display_name,
@@ -390,27 +484,9 @@ async def get_user_guilds(
                     if guild.icon is not None
                     else "https://cdn.discordapp.com/embed/avatars/1.png",
                     "icon_animated": guild.icon.is_animated() if guild.icon is not None else False,
-                    "user_role": None,
+                    "user_role": user_role,
                 }
-                if filter is None and is_owner:
-                    guilds.append(guild_infos)
-                    continue
-                member = guild.get_member(user_id)
-                if member is None:
-                    continue
-                if (filter is None or filter == "owner") and member == guild.owner:
-                    guild_infos["user_role"] = "OWNER"
-                    guilds.append(guild_infos)
-                elif (filter is None or filter == "admin") and (
-                    await self.bot.is_admin(member) or member.guild_permissions.manage_guild
-                ):
-                    guild_infos["user_role"] = "ADMIN"
-                    guilds.append(guild_infos)
-                elif (filter is None or filter == "mod") and await self.bot.is_mod(member):
-                    guild_infos["user_role"] = "MOD"
-                    guilds.append(guild_infos)
-            if filter is None:
-                self.guilds_cache[user_id] = {"guilds": guilds, "time": time.time()}
+            )
 
         if query is not None:
             query = query.strip().lower()
@@ -421,6 +497,62 @@ async def get_user_guilds(
             ]
         return Pagination.from_list(guilds, per_page=per_page, page=page).to_dict()
 
+    async def get_user_guild_role(
+        self, user_id: int, guild: discord.Guild
+    ) -> typing.Optional[typing.Literal["OWNER", "ADMIN", "MOD"]]:
+        if (cached := self.users_guilds_roles.get((user_id, guild.id))) is not None and (
+            cached[1] + 60
+        ) > time.time():
+            return cached[0]
+        member = guild.get_member(user_id)
+        if member is None:
+            user_role = None
+        elif member == guild.owner:
+            user_role = "OWNER"
+        elif await self.bot.is_admin(member) or member.guild_permissions.manage_guild:
+            user_role = "ADMIN"
+        elif await self.bot.is_mod(member):
+            user_role = "MOD"
+        else:
+            user_role = None
+        self.users_guilds_roles[(user_id, guild.id)] = (user_role, time.time())
+        return user_role
+
+    def _clear_guild_roles_cache(self, guild: discord.Guild) -> None:
+        for key in [key for key in self.users_guilds_roles if key[1] == guild.id]:
+            del self.users_guilds_roles[key]
+
+    async def on_member_join(self, member: discord.Member) -> None:
+        if member.id in self.users_guilds:
+            self.users_guilds[member.id].add(member.guild.id)
+
+    async def on_member_remove(self, member: discord.Member) -> None:
+        if member.id in self.users_guilds:
+            self.users_guilds[member.id].discard(member.guild.id)
+        self.users_guilds_roles.pop((member.id, member.guild.id), None)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        if before.roles != after.roles:
+            self.users_guilds_roles.pop((after.id, after.guild.id), None)
+
+    async def on_guild_join(self, guild: discord.Guild) -> None:
+        for user_id, guilds in self.users_guilds.items():
+            if guild.get_member(user_id) is not None:
+                guilds.add(guild.id)
+
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        for guilds in self.users_guilds.values():
+            guilds.discard(guild.id)
+        self._clear_guild_roles_cache(guild)
+
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild) -> None:
+        if before.owner_id != after.owner_id:
+            self._clear_guild_roles_cache(after)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        if before.permissions != after.permissions:
+            self._clear_guild_roles_cache(after.guild)
+
     @rpc_check()
     async def get_guild(self, user_id: int, guild_id: int, for_third_parties: bool = False):
         guild = self.bot.get_guild(guild_id)
@@ -5,7 +5,10 @@
 
 import base64
 import inspect
+import json
+import time
 import types
+from collections import OrderedDict
 
 from redbot.core.i18n import get_locale_from_guild, set_contextual_locale, set_regional_format
 from werkzeug.datastructures import ImmutableMultiDict
@@ -14,6 +17,16 @@
 from .pagination import Pagination
 from .utils import rpc_check
 
+CACHE_VARY_BY: typing.Tuple[str, ...] = (
+    "user_id",
+    "guild_id",
+    "member_id",
+    "role_id",
+    "channel_id",
+    "query",
+    "lang_code",
+)
+
 
 def dashboard_page(
     name: typing.Optional[str] = None,
@@ -24,7 +37,15 @@ def dashboard_page(
     optional_kwargs: typing.List[str] = None,
     is_owner: bool = False,
     hidden: typing.Optional[bool] = None,
+    cache_ttl: typing.Optional[int] = None,
+    cache_vary_by: typing.Tuple[str, ...] = CACHE_VARY_BY,
 ):
+    """Declare a third party page.
+
+    `cache_ttl` (in seconds) enables the responses caching of the `GET` requests. The cached
+    responses vary by the context ids, the request kwargs (`query`) and the language listed in
+    `cache_vary_by`. Cogs can invalidate them with `third_parties_handler.invalidate_cache`.
+    """
     if context_ids is None:
         context_ids = []
     if required_kwargs is None:
@@ -39,6 +60,8 @@ def decorator(func: typing.Callable):
             discord.app_commands.commands.validate_name(name)
         if not inspect.iscoroutinefunction(func):
             raise TypeError("Func must be a coroutine.")
+        if any(vary not in CACHE_VARY_BY for vary in cache_vary_by):
+            raise TypeError(f"`cache_vary_by` items must be in {CACHE_VARY_BY}.")
 
         params = {
             "name": name,
@@ -49,6 +72,8 @@ def decorator(func: typing.Callable):
             "optional_kwargs": optional_kwargs,
             "is_owner": is_owner,
             "hidden": hidden,
+            "cache_ttl": cache_ttl,
+            "cache_vary_by": tuple(cache_vary_by),
         }
         for key, value in inspect.signature(func).parameters.items():
             if value.name == "self" or value.kind in (
@@ -115,6 +140,12 @@ def __init__(self, cog: commands.Cog) -> None:
             str, typing.Dict[str, typing.Tuple[typing.Callable, typing.Dict[str, bool]]]
         ] = {}
         self.third_parties_cogs: typing.Dict[str, commands.Cog] = {}
+        # (third party, page, ((vary key, value), ...)): (expiration time, response), in LRU order.
+        self.cache: typing.OrderedDict[
+            typing.Tuple[str, str, typing.Tuple], typing.Tuple[float, typing.Dict[str, typing.Any]]
+        ] = OrderedDict()
+        self.cache_max_size: int = 1000
+        self.cache_stats: typing.Dict[str, typing.Dict[str, int]] = {}
 
         self.bot.register_rpc_handler(self.oauth_receive)
         self.bot.register_rpc_handler(self.get_third_parties)
@@ -185,8 +216,65 @@ def remove_third_party(
             del self.third_parties_cogs[name]
         except KeyError:
             pass
+        self.invalidate_cache(name)
         return self.third_parties.pop(name, None)
 
+    def invalidate_cache(
+        self,
+        third_party: typing.Union[commands.Cog, str],
+        page: typing.Optional[str] = None,
+        **context_ids: int,
+    ) -> int:
+        """Remove the cached responses of a third party, optionally only for a page and some context ids (`guild_id=...`), and return their number.
+
+        The context ids are only checked for the pages whose cache varies by them.
+        """
+        name = third_party if isinstance(third_party, str) else third_party.qualified_name
+        keys = []
+        for key in self.cache:
+            if key[0] != name or (page is not None and key[1] != page):
+                continue
+            vary = dict(key[2])
+            if any(
+                vary_key in vary and vary[vary_key] != value
+                for vary_key, value in context_ids.items()
+            ):
+                continue
+            keys.append(key)
+        for key in keys:
+            del self.cache[key]
+        return len(keys)
+
+    def get_cache_stats(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        return {
+            page: {
+                "hits": stats["hits"],
+                "misses": stats["misses"],
+                "hit_rate": stats["hits"] / (stats["hits"] + stats["misses"]),
+            }
+            for page, stats in self.cache_stats.items()
+            if stats["hits"] + stats["misses"]
+        }
+
+    def _get_cache_key(
+        self,
+        name: str,
+        page: str,
+        cache_vary_by: typing.Tuple[str, ...],
+        context_ids: typing.Dict[str, int],
+        kwargs: typing.Dict[str, typing.Any],
+        lang_code: typing.Optional[str],
+    ) -> typing.Tuple[str, str, typing.Tuple]:
+        vary = []
+        for vary_key in cache_vary_by:
+            if vary_key == "query":
+                vary.append((vary_key, json.dumps(kwargs, sort_keys=True, default=str)))
+            elif vary_key == "lang_code":
+                vary.append((vary_key, lang_code))
+            else:
+                vary.append((vary_key, context_ids.get(vary_key)))
+        return (name, page, tuple(vary))
+
     @rpc_check()
     async def oauth_receive(
         self, user_id: int, payload: typing.Dict[str, str]
@@ -341,6 +429,31 @@ async def data_receive(
         kwargs["lang_code"] = lang_code or await get_locale_from_guild(
             self.bot, guild=kwargs.get("guild")
         )
+
+        cache_key = None
+        if method != "GET":
+            # A form submission probably edits the data displayed by the third party pages.
+            self.invalidate_cache(name)
+        elif (cache_ttl := self.third_parties[name][page][1].get("cache_ttl")) is not None:
+            cache_key = self._get_cache_key(
+                name,
+                page,
+                cache_vary_by=self.third_parties[name][page][1]["cache_vary_by"],
+                context_ids=context_ids,
+                kwargs={
+                    "required_kwargs": required_kwargs,
+                    "optional_kwargs": optional_kwargs,
+                    "extra_kwargs": extra_kwargs,
+                },
+                lang_code=kwargs["lang_code"],
+            )
+            cache_stats = self.cache_stats.setdefault(f"{name}/{page}", {"hits": 0, "misses": 0})
+            if (cached := self.cache.get(cache_key)) is not None and cached[0] > time.time():
+                self.cache.move_to_end(cache_key)
+                cache_stats["hits"] += 1
+                # The page isn't called, so no form is validated and there is no extra notification.
+                return self._copy_result(cached[1], extra_notifications=[])
+            cache_stats["misses"] += 1
         set_contextual_locale(kwargs["lang_code"])
         set_regional_format(kwargs["lang_code"])
 
@@ -353,14 +466,34 @@ async def data_receive(
         ) = await get_form_class(self, third_party_cog=self.third_parties_cogs[name], **kwargs)
         kwargs["Pagination"] = Pagination
 
-        result = await self.third_parties[name][page][0](**kwargs)
+        result = await self.cog.rpc.metrics.measure(
+            f"third_party:{name}/{page}", self.third_parties[name][page][0], **kwargs
+        )
         if "web_content" in result and isinstance(result["web_content"], typing.Dict):
             for key, value in result["web_content"].items():
                 if isinstance(value, kwargs["Form"]):
                     result["web_content"][key] = str(value)
+                    cache_key = None  # The forms contain the CSRF token of the user.
                 elif isinstance(value, Pagination):
                     result["web_content"][key] = value.to_dict()
         setattr(Field, "__init__", INITIAL_INIT_FIELD)
-        result.setdefault("notifications", [])
-        result["notifications"].extend(extra_notifications)
-        return result
+        if cache_key is not None and result.get("status", 0) == 0:
+            # The cached result has its own notifications list, without the request's ones.
+            self.cache[cache_key] = (
+                time.time() + cache_ttl,
+                self._copy_result(result, extra_notifications=[]),
+            )
+            self.cache.move_to_end(cache_key)
+            while len(self.cache) > self.cache_max_size:
+                self.cache.popitem(last=False)
+        return self._copy_result(result, extra_notifications=extra_notifications)
+
+    @staticmethod
+    def _copy_result(
+        result: typing.Dict[str, typing.Any],
+        extra_notifications: typing.List[typing.Dict[str, str]],
+    ) -> typing.Dict[str, typing.Any]:
+        return {
+            **result,
+            "notifications": [*result.get("notifications", []), *extra_notifications],
+        }
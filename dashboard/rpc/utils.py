@@ -1,15 +1,136 @@
 import typing  # isort:skip
 
+import cProfile
 import functools
+import io
+import json
+import pstats
+import time
+from collections import deque
 from inspect import signature
 
 
+class RPCMetrics:
+    """Per handler calls count, latency histogram and payload sizes of the RPC handlers.
+
+    If `profiling_threshold` (in milliseconds) is set, the calls are run under cProfile, and the
+    stats of the ones slower than the threshold are kept. Only one call is profiled at a time, and
+    the stats also include the other tasks run by the event loop during the awaits of this call.
+
+    The payload sizes are sampled: only one call out of `payload_sampling` by handler is serialized
+    to measure it, so the metrics don't double the cost of the big payloads.
+    """
+
+    BUCKETS: typing.Tuple[int, ...] = (10, 50, 100, 250, 500, 1000, 2500, 5000)  # milliseconds
+
+    def __init__(self, max_profiles: int = 5, payload_sampling: int = 20) -> None:
+        self.max_profiles: int = max_profiles
+        self.payload_sampling: int = payload_sampling
+        self.profiling_threshold: typing.Optional[int] = None
+        self.handlers: typing.Dict[str, typing.Dict[str, typing.Any]] = {}
+        self.profiles: typing.Dict[str, typing.Deque[typing.Tuple[float, float, str]]] = {}
+        self._profiling: bool = False
+
+    def reset(self) -> None:
+        self.handlers.clear()
+        self.profiles.clear()
+
+    def record(
+        self, name: str, duration: float, payload_size: typing.Optional[int], error: bool = False
+    ) -> None:
+        if (handler := self.handlers.get(name)) is None:
+            handler = self.handlers[name] = {
+                "calls": 0,
+                "errors": 0,
+                "total_time": 0.0,
+                "max_time": 0.0,
+                "histogram": [0] * (len(self.BUCKETS) + 1),
+                "payload_samples": 0,
+                "total_payload_size": 0,
+                "max_payload_size": 0,
+            }
+        handler["calls"] += 1
+        handler["errors"] += error
+        handler["total_time"] += duration
+        handler["max_time"] = max(handler["max_time"], duration)
+        handler["histogram"][
+            next(
+                (i for i, bucket in enumerate(self.BUCKETS) if duration <= bucket),
+                len(self.BUCKETS),
+            )
+        ] += 1
+        if payload_size is not None:
+            handler["payload_samples"] += 1
+            handler["total_payload_size"] += payload_size
+            handler["max_payload_size"] = max(handler["max_payload_size"], payload_size)
+
+    async def measure(
+        self, name: str, func: typing.Callable[..., typing.Awaitable], *args, **kwargs
+    ) -> typing.Any:
+        profiler = None
+        if self.profiling_threshold is not None and not self._profiling:
+            self._profiling = True
+            profiler = cProfile.Profile()
+            profiler.enable()
+        start = time.perf_counter()
+        result, error = None, True
+        try:
+            result = await func(*args, **kwargs)
+            error = False
+            return result
+        finally:
+            duration = (time.perf_counter() - start) * 1000
+            if profiler is not None:
+                profiler.disable()
+                self._profiling = False
+                if self.profiling_threshold is not None and duration >= self.profiling_threshold:
+                    stream = io.StringIO()
+                    pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(25)
+                    self.profiles.setdefault(name, deque(maxlen=self.max_profiles)).append(
+                        (time.time(), duration, stream.getvalue())
+                    )
+            payload_size = None
+            if not error and (
+                (handler := self.handlers.get(name)) is None
+                or handler["calls"] % self.payload_sampling == 0
+            ):
+                try:
+                    payload_size = len(json.dumps(result, default=str))
+                except (TypeError, ValueError):
+                    pass
+            self.record(name, duration=duration, payload_size=payload_size, error=error)
+
+    def get_stats(self) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        return {
+            name: {
+                "calls": handler["calls"],
+                "errors": handler["errors"],
+                "average_time": handler["total_time"] / handler["calls"],
+                "max_time": handler["max_time"],
+                "histogram": {
+                    f"<={bucket}ms" if bucket is not None else f">{self.BUCKETS[-1]}ms": count
+                    for bucket, count in zip(self.BUCKETS + (None,), handler["histogram"])
+                },
+                "average_payload_size": (
+                    handler["total_payload_size"] / handler["payload_samples"]
+                    if handler["payload_samples"]
+                    else None
+                ),
+                "max_payload_size": handler["max_payload_size"],
+                "slow_calls_profiled": len(self.profiles.get(name, ())),
+            }
+            for name, handler in sorted(
+                self.handlers.items(), key=lambda item: item[1]["total_time"], reverse=True
+            )
+        }
+
+
 def rpc_check():
     def conditional(func):
         @functools.wraps(func)
         async def rpccheckwrapped(self, *args, **kwargs) -> typing.Dict[str, typing.Any]:
-            if self.bot.get_cog("Dashboard") is not None and self.bot.is_ready():
-                return await func(self, *args, **kwargs)
+            if (cog := self.bot.get_cog("Dashboard")) is not None and self.bot.is_ready():
+                return await cog.rpc.metrics.measure(func.__name__, func, self, *args, **kwargs)
             else:
                 return {"disconnected": True}
 
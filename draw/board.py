@@ -3,6 +3,7 @@
 import typing  # isort:skip
 import typing_extensions  # isort:skip
 
+import asyncio
 import io
 from dataclasses import dataclass
 
@@ -20,10 +21,20 @@
     PADDING,
     ROW_ICONS,
     ROW_ICONS_DICT,
+    TILE_SIZE,
     u200b,
 )  # NOQA
 
 
+def compose_tiles(tiles: np.ndarray, indexes: np.ndarray, spacing: int = 0) -> np.ndarray:
+    """Compose a grid of tiles in one pass, with transparent pixels between them."""
+    if spacing:
+        tiles = np.pad(tiles, ((0, 0), (0, spacing), (0, spacing), (0, 0)))
+    height, width = indexes.shape
+    size = tiles.shape[1]
+    return tiles[indexes].transpose(0, 2, 1, 3, 4).reshape(height * size, width * size, 4)
+
+
 @dataclass
 class Coords:
     x: int
@@ -55,10 +66,16 @@ def __init__(
 
         self.cursor_display: bool = True
 
-        self.initial_board: np.ndarray = np.full(
-            (self.height, self.width), self.background, dtype="object"
+        # The pixels are indexes in the palette of the board.
+        self.palette: typing.List[typing.Union[str, int, Color]] = []
+        self.palette_indexes: typing.Dict[
+            typing.Union[str, int, typing.Tuple[int, int, int, int]], int
+        ] = {}
+        self.pixels: np.ndarray = np.full(
+            (self.height, self.width), self.get_palette_index(self.background), dtype=np.uint16
         )
-        self.board_history: typing.List[np.ndarray] = [self.initial_board.copy()]
+        # The changes of each step, to undo and redo them: (positions, old indexes, new index).
+        self.board_history: typing.List[typing.Tuple[np.ndarray, np.ndarray, int]] = []
         self.board_index: int = 0
         self.set_attributes()
 
@@ -106,8 +123,7 @@ def __str__(self) -> str:
             f"\n{LB.join([f'{row_labels[idx]}{PADDING}{u200b.join(row)}' for idx, row in enumerate(self.board)])}"
         )
 
-    async def to_image(self) -> Image:
-        height, width = len(self.board), len(self.board[0])
+    async def to_image(self) -> Image.Image:
         cursor_rows = tuple(row for row, __ in self.cursor_coords)
         cursor_cols = tuple(col for __, col in self.cursor_coords)
         row_labels = [
@@ -119,125 +135,145 @@ async def to_image(self) -> Image:
             for idx, col in enumerate(self.col_labels)
         ]
 
-        size = 25
+        blank = np.zeros((TILE_SIZE, TILE_SIZE, 4), dtype=np.uint8)
+
+        async def get_tile(pixel: typing.Any) -> np.ndarray:
+            if pixel == "transparent":
+                return blank
+            return await self.cog.get_tile(
+                MAIN_COLORS_DICT.get(pixel, pixel), rounded=self.cursor_display
+            )
+
+        # Each pixel of the palette used by the board is resized once, then indexed by the board.
+        used = np.unique(self.pixels)
+        lookup = np.zeros(len(self.palette), dtype=np.intp)
+        lookup[used] = np.arange(len(used))
+        indexes = lookup[self.pixels]
+        tiles = np.stack([await get_tile(self.palette[index]) for index in used])
+        transparent = (
+            self.pixels == self.palette_indexes["transparent"]
+            if "transparent" in self.palette_indexes
+            else np.zeros(self.pixels.shape, dtype=bool)
+        )
+        labels = None
+        if self.cursor_display:
+            labels = (
+                await get_tile(self.cursor),
+                np.stack([await get_tile(emoji) for emoji in row_labels]),
+                np.stack([await get_tile(emoji) for emoji in col_labels]),
+            )
+        return await asyncio.to_thread(self._to_image, tiles, indexes, transparent, labels)
+
+    def _to_image(
+        self,
+        tiles: np.ndarray,
+        indexes: np.ndarray,
+        transparent: np.ndarray,
+        labels: typing.Optional[typing.Tuple[np.ndarray, np.ndarray, np.ndarray]] = None,
+    ) -> Image.Image:
+        height, width = indexes.shape
+        size = TILE_SIZE
         sp = 1 if self.cursor_display else 0
         _width = size * (width + 1) + sp * width + round(size / 4)
         _height = size * (height + 1) + sp * height + round(size / 4)
-        img: Image.Image = Image.new("RGBA", (_width, _height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        y = 0
-        for _y in range(0 if self.cursor_display else 2, height + 2):
-            if _y == 1:
-                y += round(size / 4)
-                continue
-            x = 0
-            for _x in range(0 if self.cursor_display else 2, width + 2):
-                if _x == 1:
-                    x += round(size / 4)
+        array = np.zeros((_height, _width, 4), dtype=np.uint8)
+
+        def paste(grid: np.ndarray, y: int, x: int) -> None:
+            grid = grid[: _height - y, : _width - x]
+            array[y : y + grid.shape[0], x : x + grid.shape[1]] = grid
+
+        offset = size + sp + round(size / 4) if self.cursor_display else 0
+        paste(compose_tiles(tiles, indexes, spacing=sp), offset, offset)
+        if labels is not None:
+            cursor, row_labels, col_labels = labels
+            paste(cursor, 0, 0)
+            paste(compose_tiles(row_labels, np.arange(height)[:, None], spacing=sp), offset, 0)
+            paste(compose_tiles(col_labels, np.arange(width)[None, :], spacing=sp), 0, offset)
+        img: Image.Image = Image.fromarray(array)
+
+        if self.cursor_display:
+            draw = ImageDraw.Draw(img)
+            cursor_coords = set(self.cursor_coords)
+            for row, col in np.argwhere(transparent):
+                if (row, col) in cursor_coords:
                     continue
-                # draw.rounded_rectangle((x, y, x + size, y + size), radius=3, fill=(255, 255, 255), outline=(255, 0, 0) if (_y - 2, _x - 2) in self.cursor_coords else (0, 0, 0))
-                if _x == 0 and _y == 0:
-                    cursor = self.cursor
-                    if cursor == "transparent":
-                        x += size + sp
-                        continue
-                    image: Image.Image = await self.cog.get_pixel(
-                        MAIN_COLORS_DICT.get(cursor, cursor)
-                    )
-                elif _x == 0 and _y > 1:
-                    emoji = row_labels[_y - 2]
-                    image: Image.Image = await self.cog.get_pixel(emoji)
-                elif _y == 0 and _x > 1:
-                    emoji = col_labels[_x - 2]
-                    image: Image.Image = await self.cog.get_pixel(emoji)
-                else:
-                    pixel = self.board[_y - 2, _x - 2]
-                    if pixel == "transparent":
-                        if self.cursor_display:
-                            if (_y - 2, _x - 2) in self.cursor_coords:
-                                draw.rounded_rectangle(
-                                    (x, y, x + size, y + size),
-                                    radius=3,
-                                    fill=None,
-                                    outline=(18, 18, 20, 255)
-                                    if getattr(
-                                        MAIN_COLORS_DICT.get(self.cursor, self.cursor),
-                                        "RGBA",
-                                        (0, 0, 0, 0),
-                                    )
-                                    == (0, 0, 0, 255)
-                                    else (
-                                        MAIN_COLORS_DICT.get(self.cursor, self.cursor).RGBA
-                                        if isinstance(
-                                            MAIN_COLORS_DICT.get(self.cursor, self.cursor), Color
-                                        )
-                                        and self.cursor != "transparent"
-                                        else (255, 0, 0, 255)
-                                    ),
-                                    width=2,
-                                )
-                            else:
-                                draw.rounded_rectangle(
-                                    (x, y, x + size, y + size), radius=3, outline=(0, 0, 0, 255)
-                                )
-                        x += size + sp
-                        continue
-                    image: Image.Image = await self.cog.get_pixel(
-                        MAIN_COLORS_DICT.get(pixel, pixel)
-                    )
-                image = image.resize((size, size))
-                mask = Image.new("L", image.size, 0)
-                d = ImageDraw.Draw(mask)
-                # if self.cursor_display and (_y - 2, _x - 2) in self.cursor_coords:
-                #     d.ellipse((0, 0, image.width, image.height), fill=255)
-                # else:
-                d.rounded_rectangle(
-                    (0, 0, image.width, image.height),
-                    radius=3 if self.cursor_display else 0,
-                    fill=255,
+                x, y = offset + col * (size + sp), offset + row * (size + sp)
+                draw.rounded_rectangle(
+                    (x, y, x + size, y + size), radius=3, outline=(0, 0, 0, 255)
+                )
+            cursor = MAIN_COLORS_DICT.get(self.cursor, self.cursor)
+            outline = (
+                (18, 18, 20, 255)
+                if getattr(cursor, "RGBA", (0, 0, 0, 0)) == (0, 0, 0, 255)
+                else (
+                    cursor.RGBA
+                    if isinstance(cursor, Color) and self.cursor != "transparent"
+                    else (255, 0, 0, 255)
+                )
+            )
+            for row, col in cursor_coords:
+                x, y = offset + col * (size + sp), offset + row * (size + sp)
+                draw.rounded_rectangle(
+                    (x, y, x + size, y + size), radius=3, fill=None, outline=outline, width=2
                 )
-                img.paste(image, (x, y, x + size, y + size), mask=mask)
-                if self.cursor_display and (_y - 2, _x - 2) in self.cursor_coords:
-                    draw.rounded_rectangle(
-                        (x, y, x + size, y + size),
-                        radius=3,
-                        fill=None,
-                        outline=(18, 18, 20, 255)
-                        if getattr(
-                            MAIN_COLORS_DICT.get(self.cursor, self.cursor), "RGBA", (0, 0, 0, 0)
-                        )
-                        == (0, 0, 0, 255)
-                        else (
-                            MAIN_COLORS_DICT.get(self.cursor, self.cursor).RGBA
-                            if isinstance(MAIN_COLORS_DICT.get(self.cursor, self.cursor), Color)
-                            and self.cursor != "transparent"
-                            else (255, 0, 0, 255)
-                        ),
-                        width=2,
-                    )
-                x += size + sp
-            y += size + sp
         return img
 
     async def to_file(self) -> discord.File:
         img: Image.Image = await self.to_image()
+        buffer = await asyncio.to_thread(self._to_bytes, img)
+        return discord.File(buffer, filename=f"image.{IMAGE_EXTENSION.lower()}")
+
+    def _to_bytes(self, img: Image.Image) -> io.BytesIO:
         buffer = io.BytesIO()
         img.save(buffer, format=IMAGE_EXTENSION, optimize=True)
         buffer.seek(0)
-        return discord.File(buffer, filename=f"image.{IMAGE_EXTENSION.lower()}")
+        return buffer
 
     @property
     def board(self) -> np.ndarray:
-        return self.board_history[self.board_index]
+        palette = np.empty(len(self.palette), dtype="object")
+        palette[:] = self.palette
+        return palette[self.pixels]
 
     @board.setter
     def board(self, board: np.ndarray):
-        self.board_history.append(board)
-        self.board_index += 1
+        self.palette, self.palette_indexes = [], {}
+        self.pixels = np.array(
+            [[self.get_palette_index(pixel) for pixel in row] for row in board], dtype=np.uint16
+        )
+        self.board_history, self.board_index = [], 0
+
+    def get_palette_index(self, pixel: typing.Union[str, int, Color]) -> int:
+        key = pixel.RGBA if isinstance(pixel, Color) else pixel
+        if (index := self.palette_indexes.get(key)) is None:
+            if len(self.palette) > np.iinfo(np.uint16).max:
+                raise ValueError("The palette of the board is full.")
+            index = self.palette_indexes[key] = len(self.palette)
+            self.palette.append(pixel)
+        return index
+
+    def load(self, board: typing_extensions.Self) -> None:
+        """Load the pixels and the history of another board."""
+        self.palette, self.palette_indexes = board.palette.copy(), board.palette_indexes.copy()
+        self.pixels = board.pixels.copy()
+        self.board_history = board.board_history.copy()  # The steps are never modified.
+        self.board_index = board.board_index
+
+    def undo(self) -> bool:
+        if self.board_index == 0:
+            return False
+        self.board_index -= 1
+        positions, old, __ = self.board_history[self.board_index]
+        np.put(self.pixels, positions, old)
+        return True
 
-    @property
-    def backup_board(self) -> np.ndarray:
-        return self.board_history[self.board_index - 1]
+    def redo(self) -> bool:
+        if self.board_index == len(self.board_history):
+            return False
+        positions, __, new = self.board_history[self.board_index]
+        np.put(self.pixels, positions, new)
+        self.board_index += 1
+        return True
 
     def modify(
         self,
@@ -255,9 +291,9 @@ def modify(
             (self.height == height, self.width == width, self.background == background)
         ):  # the attributes haven't been changed
             return
-        if np.array_equal(
-            self.initial_board, self.board
-        ):  # Board has only background, so replace all pixels.
+        if (
+            self.pixels == self.get_palette_index(self.background)
+        ).all():  # Board has only background, so replace all pixels.
             self.__init__(cog=self.cog, height=height, width=width, background=background)
             return
         overlay = self.board
@@ -303,17 +339,17 @@ def modify(
         ] = overlay
         # return Board.from_board(base, background=background)
         self.__init__(cog=self.cog, height=len(base), width=len(base[0]), background=background)
-        self.board_history = [base]
+        self.board = base
 
     @property
     def cursor_pixel(self) -> typing.Any:
-        return self.board[self.cursor_row, self.cursor_col]
+        return self.get_pixel()
 
     @cursor_pixel.setter
     def cursor_pixel(self, value: str) -> None:
         if not isinstance(value, str):
             raise TypeError("Value must be a string.")
-        self.board[self.cursor_row, self.cursor_col] = value
+        self.draw(value, coords=[(self.cursor_row, self.cursor_col)])
 
     def get_pixel(
         self,
@@ -322,7 +358,7 @@ def get_pixel(
     ) -> typing.Any:
         row = row if row is not None else self.cursor_row
         col = col if col is not None else self.cursor_col
-        return self.board[row, col]
+        return self.palette[self.pixels[row, col]]
 
     @classmethod
     def from_board(
@@ -335,7 +371,7 @@ def from_board(
         height = len(board)
         width = len(board[0])
         board_obj = cls(cog=cog, height=height, width=width, background=background)
-        board_obj.board_history = [board]
+        board_obj.board = board
         return board_obj
 
     @classmethod
@@ -349,7 +385,10 @@ def from_str(
         return board
 
     def clear(self) -> None:
-        self.draw(self.background, coords=np.array(np.where(self.board != self.background)).T)
+        self.draw(
+            self.background,
+            coords=np.argwhere(self.pixels != self.get_palette_index(self.background)),
+        )
         self.clear_cursors()
 
     def draw(
@@ -361,20 +400,21 @@ def draw(
         color = color or self.cursor
         color_pixel = getattr(color, "id", color)
         coords = coords if coords is not None else self.cursor_coords
+        if len(coords) == 0:
+            return False
 
-        cursor_matches = []
-        for row, col in coords:
-            if self.board[row, col] == color_pixel:
-                cursor_matches.append(True)
-            else:
-                cursor_matches.append(False)
-        if all(cursor_matches):
+        index = self.get_palette_index(color_pixel)
+        positions = np.ravel_multi_index(tuple(np.asarray(coords).T), self.pixels.shape)
+        old = self.pixels.flat[positions]
+        if not (changed := old != index).any():
             return False
 
-        self.board_history = self.board_history[: self.board_index + 1]
-        self.board = self.board.copy()
-        for row, col in coords:
-            self.board[row, col] = color_pixel
+        # Only the changed pixels are stored in the history.
+        positions, old = positions[changed].astype(np.uint16), old[changed]
+        del self.board_history[self.board_index :]
+        self.board_history.append((positions, old, index))
+        self.board_index += 1
+        np.put(self.pixels, positions, index)
         return True
 
     def clear_cursors(self, *, empty: typing.Optional[bool] = False) -> None:
@@ -35,6 +35,8 @@ def base_colors_options() -> typing.List[discord.SelectOption]:
 MIN_HEIGHT_OR_WIDTH: int = 5
 MAX_HEIGHT_OR_WIDTH: int = 17
 
+TILE_SIZE: int = 25  # The size of the pixels in the boards images.
+
 
 def base_height_or_width_select_options(
     prefix: typing.Optional[str] = "",
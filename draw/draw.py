@@ -11,7 +11,8 @@
 from urllib.parse import quote_plus
 
 import aiohttp
-from PIL import Image, ImageFilter, UnidentifiedImageError
+import numpy as np
+from PIL import Image, ImageDraw, ImageFilter, UnidentifiedImageError
 
 from .board import Board
 from .color import Color
@@ -21,6 +22,7 @@
     MAIN_COLORS,
     MAX_HEIGHT_OR_WIDTH,
     MIN_HEIGHT_OR_WIDTH,
+    TILE_SIZE,
     base_colors_options,
 )  # NOQA
 from .start_view import StartDrawView
@@ -48,6 +50,10 @@ def __init__(self, bot: Red) -> None:
         self.cache: typing.Dict[
             typing.Union[str, int, typing.Tuple[int, int, int, int]]
         ] = {}  # Unicode emojis, colors RGB and Discord custom emojis ids.
+        self.tiles: typing.Dict[
+            typing.Tuple[typing.Union[str, int, typing.Tuple[int, int, int, int]], bool],
+            np.ndarray,
+        ] = {}  # The pixels resized and masked for the boards images: (cache key, rounded).
 
     async def cog_load(self) -> None:
         await super().cog_load()
@@ -56,7 +62,7 @@ async def cog_load(self) -> None:
 
     async def generate_cache(self) -> None:
         for pixel in DEFAULT_CACHE:
-            await self.get_pixel(pixel)
+            await self.get_tile(pixel)
 
     async def cog_unload(self) -> None:
         if self._session is not None:
@@ -67,15 +73,12 @@ async def cog_unload(self) -> None:
     def drawings(self) -> typing.Dict[discord.Message, DrawView]:
         return self.views
 
-    async def get_pixel(
+    def get_pixel_key(
         self,
-        pixel: typing.Union[
-            str, discord.Emoji, int, Color, typing.Tuple[int, int, int, typing.Optional[int]]
-        ],
-        to_file: typing.Optional[bool] = False,
-    ) -> typing.Union[Image.Image, discord.File]:
-        if isinstance(pixel, typing.Tuple) and len(pixel) in {3, 4}:
-            pixel = Color(pixel)
+        pixel: typing.Union[str, discord.Emoji, int, Color],
+    ) -> typing.Tuple[
+        typing.Union[str, int, typing.Tuple[int, int, int, int]], typing.Optional[str]
+    ]:
         try:
             pixel = int(pixel)
         except (ValueError, TypeError):
@@ -98,15 +101,27 @@ async def get_pixel(
                     url = f"https://emojicdn.elk.sh/{quote_plus(key)}?style=twitter"
         elif isinstance(pixel, Color):
             key = pixel.RGBA
-            if key not in self.cache:
-                url = None
-                image = await pixel.to_image()
+            url = None
         else:
             raise TypeError(pixel)
+        return key, url
+
+    async def get_pixel(
+        self,
+        pixel: typing.Union[
+            str, discord.Emoji, int, Color, typing.Tuple[int, int, int, typing.Optional[int]]
+        ],
+        to_file: typing.Optional[bool] = False,
+    ) -> typing.Union[Image.Image, discord.File]:
+        if isinstance(pixel, typing.Tuple) and len(pixel) in {3, 4}:
+            pixel = Color(pixel)
+        key, url = self.get_pixel_key(pixel)
         if key in self.cache:
             image = self.cache[key]
         else:
-            if url is not None:
+            if url is None:
+                image = await pixel.to_image()
+            else:
                 async with self._session.get(url) as r:
                     image_bytes = await r.read()
                 try:
@@ -129,6 +144,31 @@ async def get_pixel(
             return discord.File(buffer, filename=f"pixel.{IMAGE_EXTENSION.lower()}")
         return image
 
+    async def get_tile(
+        self,
+        pixel: typing.Union[str, discord.Emoji, int, Color],
+        rounded: typing.Optional[bool] = True,
+    ) -> np.ndarray:
+        key, __ = self.get_pixel_key(pixel)
+        if (tile := self.tiles.get((key, rounded))) is not None:
+            return tile
+        image = await self.get_pixel(pixel)
+        tile = await asyncio.to_thread(self._get_tile, image, rounded)
+        if key in self.cache:  # The image couldn't be retrieved otherwise, so it will be retried.
+            self.tiles[(key, rounded)] = tile
+        return tile
+
+    def _get_tile(self, image: Image.Image, rounded: bool) -> np.ndarray:
+        image = image.resize((TILE_SIZE, TILE_SIZE)).convert("RGBA")
+        mask = Image.new("L", image.size, 0)
+        ImageDraw.Draw(mask).rounded_rectangle(
+            (0, 0, image.width, image.height), radius=3 if rounded else 0, fill=255
+        )
+        tile = np.array(image)
+        tile[np.array(mask) == 0] = 0
+        tile.flags.writeable = False  # Shared by all the boards.
+        return tile
+
     @commands.bot_has_permissions(embed_links=True, attach_files=True)
     @commands.hybrid_command(aliases=["paint", "pixelart"])
     @app_commands.choices(
@@ -169,6 +209,5 @@ async def draw(
                 width=self.drawings[from_message].width,
                 background=background,
             )
-            board.board_history = self.drawings[from_message].board.board_history.copy()
-            board.board_index = self.drawings[from_message].board.board_index
+            board.load(self.drawings[from_message].board)
         await StartDrawView(cog=self, board=board).start(ctx)
@@ -222,7 +222,10 @@ async def use(self, *, interaction: discord.Interaction) -> bool:
         """The method that is called when the tool is used."""
         color = self.board.cursor
         to_replace = self.board.cursor_pixel
-        return self.board.draw(color, coords=np.array(np.where(self.board.board == to_replace)).T)
+        return self.board.draw(
+            color,
+            coords=np.argwhere(self.board.pixels == self.board.get_palette_index(to_replace)),
+        )
 
 
 CHANGE_AMOUNT = 17  # Change amount for Lighten & Darken tools to allow exactly 15 changes from 0 or 255, respectively.
@@ -251,7 +254,7 @@ async def use(self, *, interaction: discord.Interaction) -> bool:
         """The method that is called when the tool is used."""
         coords = self.board.cursor_coords
         for coord in coords:
-            pixel = self.board.board[coord]
+            pixel = self.board.get_pixel(*coord)
             color = MAIN_COLORS_DICT.get(pixel, pixel)
             if isinstance(color, Color):
                 RGB_A = (
@@ -673,9 +673,9 @@ def update_buttons(self) -> None:
         self.undo.disabled = self.board.board_index == 0 or self.disabled
         self.undo.label = f"{self.board.board_index} ↶"
         self.redo.disabled = (
-            self.board.board_index == len(self.board.board_history) - 1
+            self.board.board_index == len(self.board.board_history)
         ) or self.disabled
-        self.redo.label = f"↷ {(len(self.board.board_history) - 1) - self.board.board_index}"
+        self.redo.label = f"↷ {len(self.board.board_history) - self.board.board_index}"
 
     async def move_cursor(
         self,
@@ -694,8 +694,7 @@ async def move_cursor(
     @discord.ui.button(label="↶", style=discord.ButtonStyle.secondary)
     async def undo(self, interaction: discord.Interaction, button: discord.Button) -> None:
         await interaction.response.defer()
-        if self.board.board_index > 0:
-            self.board.board_index -= 1
+        self.board.undo()
         await self._update()
 
     @discord.ui.button(style=discord.ButtonStyle.danger, emoji="✖️", custom_id="close_page")
@@ -745,8 +744,7 @@ async def secondary_page_button(
     @discord.ui.button(label="↷", style=discord.ButtonStyle.secondary)
     async def redo(self, interaction: discord.Interaction, button: discord.Button) -> None:
         await interaction.response.defer()
-        if self.board.board_index < len(self.board.board_history) - 1:
-            self.board.board_index += 1
+        self.board.redo()
         await self._update()
 
     @discord.ui.button(label="Clear", style=discord.ButtonStyle.danger)
@@ -1,13 +1,24 @@
 from AAA3A_utils import Cog  # isort:skip
-from redbot.core import commands  # isort:skip
+from redbot.core import commands, Config  # isort:skip
 from redbot.core.bot import Red  # isort:skip
 from redbot.core.i18n import Translator, cog_i18n  # isort:skip
 import discord  # isort:skip
 import typing  # isort:skip
 
+import aiohttp
+import asyncio
+import csv
+import datetime
+import gzip
 import io
+import json
+import pathlib
+import tempfile
+import time
+import zipfile
 
 import chat_exporter
+from redbot.core.data_manager import cog_data_path
 from redbot.core.utils.chat_formatting import humanize_list
 
 # Credits:
@@ -23,6 +34,9 @@ def _(untranslated: str) -> str:  # `redgettext` will found these strings.
     "Here is the transcript's {mode} file of the messages in the channel {channel.mention} ({channel.id}).\nPlease note: all attachments and user avatars are saved with the Discord link in this file.\nThere are {count_messages} exported messages.\nRemember that exporting other users' messages from Discord does not respect the TOS."
 )
 LINK_MESSAGE = _("[Click here to view the transcript.]({url})")
+STREAM_RESULT_MESSAGE = _(
+    "Here are the transcript's {mode} files of the messages in the channel {channel.mention} ({channel.id}), in {count_parts} parts.\nPlease note: all attachments and user avatars are saved with the Discord link in these files.\nThere are {count_messages} exported messages.\nRemember that exporting other users' messages from Discord does not respect the TOS."
+)
 
 _: Translator = Translator("ExportChannel", __file__)
 
@@ -40,10 +54,198 @@ async def convert(
                 raise e
 
 
+TRANSIENT_ERRORS: typing.Tuple[typing.Type[Exception], ...] = (
+    discord.DiscordServerError,
+    aiohttp.ClientError,
+    asyncio.TimeoutError,
+)
+CSV_COLUMNS: typing.Tuple[str, ...] = (
+    "id",
+    "created_at",
+    "edited_at",
+    "type",
+    "author_id",
+    "author_name",
+    "author_bot",
+    "content",
+    "attachments",
+    "embeds",
+    "reactions",
+    "reference_id",
+    "pinned",
+)
+
+
+class TranscriptPart:
+    """A transcript file written incrementally on disk, optionally compressed.
+
+    A temporary file is used if no path is provided, instead of a `SpooledTemporaryFile`, because
+    `discord.File` doesn't accept the latter before Python 3.11. With a path, the part can be
+    checkpointed and reopened at the checkpointed size: the gzip parts are made of several
+    members (one by checkpoint), and the zip parts can't be checkpointed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        compression: typing.Optional[typing.Literal["gzip", "zip"]] = None,
+        path: typing.Optional[pathlib.Path] = None,
+        offset: int = 0,
+    ) -> None:
+        self.name: str = name
+        self.compression: typing.Optional[typing.Literal["gzip", "zip"]] = compression
+        self.path: typing.Optional[pathlib.Path] = path
+        self.count_messages: int = 0
+        if path is None:
+            self.file: typing.IO[bytes] = tempfile.TemporaryFile()
+        else:
+            self.file: typing.IO[bytes] = path.open(mode="r+b" if offset else "w+b")
+            self.file.truncate(offset)
+            self.file.seek(offset)
+        self._zip_file: typing.Optional[zipfile.ZipFile] = None
+        if compression == "gzip":
+            self.filename: str = f"{name}.gz"
+        elif compression == "zip":
+            self.filename: str = f"{name}.zip"
+        else:
+            self.filename: str = name
+        self._open_stream()
+
+    def _open_stream(self) -> None:
+        if self.compression == "gzip":
+            self.stream: typing.IO[bytes] = gzip.GzipFile(
+                filename=self.name, mode="wb", fileobj=self.file
+            )
+        elif self.compression == "zip":
+            self._zip_file = zipfile.ZipFile(self.file, mode="w", compression=zipfile.ZIP_DEFLATED)
+            self.stream: typing.IO[bytes] = self._zip_file.open(
+                self.name, mode="w", force_zip64=True
+            )
+        else:
+            self.stream: typing.IO[bytes] = self.file
+
+    @property
+    def size(self) -> int:
+        # The compressed data still buffered by the compressor isn't counted.
+        return self.file.tell()
+
+    def write(self, data: bytes) -> None:
+        self.stream.write(data)
+
+    def checkpoint(self) -> typing.Optional[int]:
+        """Write all the data on the disk, and return the size to reopen the part with."""
+        if self.path is None or self.compression == "zip":
+            return None
+        if self.compression == "gzip":
+            self.stream.close()  # Doesn't close `self.file`.
+        self.file.flush()
+        size = self.file.tell()
+        if self.compression == "gzip":
+            self._open_stream()  # The header of the new member is after the checkpoint.
+        return size
+
+    def close(self) -> discord.File:
+        if self.compression is not None:
+            self.stream.close()
+        if self._zip_file is not None:
+            self._zip_file.close()
+        self.file.seek(0)
+        return discord.File(self.file, filename=self.filename)
+
+    def discard(self) -> None:
+        self.file.close()
+        if self.path is not None and self.path.exists():
+            self.path.unlink()
+
+
 @cog_i18n(_)
 class ExportChannel(Cog):
     """A cog to export all or a part of the messages of a channel in an html file!"""
 
+    def __init__(self, bot: Red) -> None:
+        super().__init__(bot=bot)
+
+        self.config: Config = Config.get_conf(
+            self,
+            identifier=205192943327321000143939875896557571750,
+            force_registration=True,
+        )
+        self.config.register_global(
+            exports={},  # The checkpoints of the streamed exports, by channel id.
+        )
+
+        self.exports_tasks: typing.Dict[int, asyncio.Task] = {}
+
+    async def cog_load(self) -> None:
+        await super().cog_load()
+        asyncio.create_task(self.resume_exports())
+
+    async def cog_unload(self) -> None:
+        # The exports will be resumed from their last checkpoint when the cog is loaded.
+        for task in self.exports_tasks.values():
+            task.cancel()
+        await super().cog_unload()
+
+    async def resume_exports(self) -> None:
+        await self.bot.wait_until_red_ready()
+        for state in (await self.config.exports()).values():
+            if state["channel_id"] not in self.exports_tasks:
+                asyncio.create_task(self.run_export_task(state))
+
+    async def run_export_task(
+        self, state: typing.Dict[str, typing.Any], ctx: typing.Optional[commands.Context] = None
+    ) -> None:
+        task = asyncio.create_task(self.run_stream_export(state))
+        self.exports_tasks[state["channel_id"]] = task
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            return
+        except commands.UserFeedbackCheckFailure:
+            if ctx is not None:
+                raise
+            return
+        except TRANSIENT_ERRORS as e:
+            self.logger.error(
+                f"Error when exporting the channel {state['channel_id']}, use the `exportchannel resume` command to resume it.",
+                exc_info=e,
+            )
+            if ctx is not None:
+                raise commands.UserFeedbackCheckFailure(
+                    _(
+                        "An error occurred during the export. Use `{prefix}exportchannel resume` to resume it from the last checkpoint."
+                    ).format(prefix=ctx.clean_prefix)
+                )
+            return
+        except Exception as e:
+            self.logger.error(
+                f"Error when exporting the channel {state['channel_id']}, the export has been cancelled.",
+                exc_info=e,
+            )
+            if ctx is not None:
+                raise commands.UserFeedbackCheckFailure(
+                    _("An error occurred during the export, which has been cancelled.")
+                )
+            return
+        finally:
+            if self.exports_tasks.get(state["channel_id"]) is task:
+                del self.exports_tasks[state["channel_id"]]
+        if result is None:
+            return
+        count_messages, count_parts = result
+        if (guild := self.bot.get_guild(state["guild_id"])) is None or (
+            destination := guild.get_channel_or_thread(state["destination_id"])
+        ) is None:
+            return
+        await destination.send(
+            _(STREAM_RESULT_MESSAGE).format(
+                channel=guild.get_channel_or_thread(state["channel_id"]),
+                mode=state["mode"],
+                count_parts=count_parts,
+                count_messages=count_messages,
+            )
+        )
+
     async def check_channel(self, ctx: commands.Context, channel: discord.TextChannel) -> None:
         channel_permissions = channel.permissions_for(ctx.me)
         if not all(
@@ -82,12 +284,11 @@ async def get_messages(
             after=after,
             oldest_first=False,
         ):
-            if user_id is not None and message.author.id != user_id:
-                continue
-            if bot is not None and message.author.bot != bot:
-                continue
-            if message.author in exclude_users_and_roles or any(
-                role in exclude_users_and_roles for role in getattr(message.author, "roles", [])
+            if not self.check_message(
+                message,
+                user_id=user_id,
+                bot=bot,
+                exclude_users_and_roles=exclude_users_and_roles,
             ):
                 continue
             messages.append(message)
@@ -103,11 +304,185 @@ async def get_messages(
             raise commands.UserFeedbackCheckFailure(_("Sorry. I could not find any messages."))
         return count_messages, messages
 
+    def check_message(
+        self,
+        message: discord.Message,
+        user_id: typing.Optional[int] = None,
+        bot: typing.Optional[bool] = None,
+        exclude_users_and_roles: typing.List[typing.Union[discord.User, discord.Role]] = [],
+    ) -> bool:
+        if user_id is not None and message.author.id != user_id:
+            return False
+        if bot is not None and message.author.bot != bot:
+            return False
+        # Compared by ids, to accept `discord.Object`s for the resumed exports.
+        excluded_ids = {user_or_role.id for user_or_role in exclude_users_and_roles}
+        if message.author.id in excluded_ids or any(
+            role.id in excluded_ids for role in getattr(message.author, "roles", [])
+        ):
+            return False
+        return True
+
+    async def iter_messages(
+        self,
+        channel: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+        before: typing.Optional[typing.Union[discord.Message, discord.Object]] = None,
+        after: typing.Optional[typing.Union[discord.Message, discord.Object]] = None,
+        user_id: typing.Optional[int] = None,
+        bot: typing.Optional[bool] = None,
+        exclude_users_and_roles: typing.List[typing.Union[discord.User, discord.Role]] = [],
+        ignored_message_id: typing.Optional[int] = None,
+        page_size: int = 100,
+    ) -> typing.AsyncIterator[typing.List[discord.Message]]:
+        """Get the messages by pages, oldest first, without keeping the previous pages."""
+        page = []
+        async for message in channel.history(
+            limit=None, before=before, after=after, oldest_first=True
+        ):
+            if message.id == ignored_message_id or not self.check_message(
+                message,
+                user_id=user_id,
+                bot=bot,
+                exclude_users_and_roles=exclude_users_and_roles,
+            ):
+                continue
+            page.append(message)
+            if len(page) >= page_size:
+                yield page
+                page = []
+        if page:
+            yield page
+
+    async def get_html_transcript(
+        self,
+        channel: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+        messages: typing.List[discord.Message],
+    ) -> str:
+        """Render the messages, newest first, in an html transcript."""
+
+        class Transcript(chat_exporter.construct.transcript.TranscriptDAO):
+            @classmethod
+            async def export(
+                cls,
+                channel: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+                messages: typing.List[discord.Message],
+                tz_info="UTC",
+                guild: typing.Optional[discord.Guild] = None,
+                bot: typing.Optional[discord.Client] = None,
+                military_time: typing.Optional[bool] = False,
+                fancy_times: typing.Optional[bool] = True,
+                support_dev: typing.Optional[bool] = True,
+                attachment_handler: typing.Optional[typing.Any] = None,
+            ):
+                if guild:
+                    channel.guild = guild
+                self = cls(
+                    channel=channel,
+                    limit=None,
+                    messages=messages,
+                    pytz_timezone=tz_info,
+                    military_time=military_time,
+                    fancy_times=fancy_times,
+                    before=None,
+                    after=None,
+                    support_dev=support_dev,
+                    bot=bot,
+                    attachment_handler=attachment_handler,
+                )
+                if not self.after:
+                    self.messages.reverse()
+                return (await self.build_transcript()).html
+
+        return await Transcript.export(
+            channel=channel,
+            messages=messages,
+            tz_info="UTC",
+            guild=channel.guild,
+            bot=self.bot,
+        )
+
+    def get_txt_line(self, message: discord.Message) -> str:
+        BREAK_LINE, BREAK_REPLACE = "\n", "\\n"
+        return f"{message.created_at.strftime('%d/%m/%Y %H:%M:%S')} | {message.id} | {message.author.display_name} ({message.author.id}) | {message.content.replace(BREAK_LINE, BREAK_REPLACE)} | {humanize_list([attachment.filename for attachment in message.attachments])}"
+
+    def get_message_data(self, message: discord.Message) -> typing.Dict[str, typing.Any]:
+        return {
+            "id": message.id,
+            "created_at": message.created_at.isoformat(),
+            "edited_at": message.edited_at.isoformat() if message.edited_at is not None else None,
+            "type": message.type.name,
+            "author": {
+                "id": message.author.id,
+                "name": message.author.name,
+                "display_name": message.author.display_name,
+                "bot": message.author.bot,
+            },
+            "content": message.content,
+            "attachments": [
+                {
+                    "id": attachment.id,
+                    "filename": attachment.filename,
+                    "url": attachment.url,
+                    "size": attachment.size,
+                    "content_type": attachment.content_type,
+                }
+                for attachment in message.attachments
+            ],
+            "embeds": [embed.to_dict() for embed in message.embeds],
+            "stickers": [{"id": sticker.id, "name": sticker.name} for sticker in message.stickers],
+            "reactions": [
+                {"emoji": str(reaction.emoji), "count": reaction.count}
+                for reaction in message.reactions
+            ],
+            "reference_id": message.reference.message_id
+            if message.reference is not None
+            else None,
+            "pinned": message.pinned,
+        }
+
+    def get_lines(
+        self,
+        messages: typing.List[discord.Message],
+        mode: typing.Literal["txt", "ndjson", "csv"],
+        with_header: bool = False,
+    ) -> str:
+        """Render the messages in a line based format, without the html template engine."""
+        if mode == "ndjson":
+            return "".join(
+                f"{json.dumps(self.get_message_data(message), ensure_ascii=False, separators=(',', ':'))}\n"
+                for message in messages
+            )
+        elif mode == "csv":
+            output = io.StringIO()
+            writer = csv.writer(output, lineterminator="\n")
+            if with_header:
+                writer.writerow(CSV_COLUMNS)
+            writer.writerows(
+                [
+                    message.id,
+                    message.created_at.isoformat(),
+                    message.edited_at.isoformat() if message.edited_at is not None else "",
+                    message.type.name,
+                    message.author.id,
+                    message.author.display_name,
+                    message.author.bot,
+                    message.content,
+                    " ".join(attachment.url for attachment in message.attachments),
+                    len(message.embeds),
+                    sum(reaction.count for reaction in message.reactions),
+                    message.reference.message_id if message.reference is not None else "",
+                    message.pinned,
+                ]
+                for message in messages
+            )
+            return output.getvalue()
+        return "".join(f"{self.get_txt_line(message)}\n" for message in messages)
+
     async def export_messages(
         self,
         ctx: commands.Context,
         channel: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
-        mode: typing.Literal["html", "txt"] = "html",
+        mode: typing.Literal["html", "txt", "ndjson", "csv"] = "html",
         **kwargs,
     ) -> typing.Union[int, typing.List[discord.Message], discord.File]:
         if "messages" in kwargs:
@@ -117,63 +492,294 @@ async def export_messages(
             count_messages, messages = await self.get_messages(ctx, channel=channel, **kwargs)
 
         if mode == "html":
-
-            class Transcript(chat_exporter.construct.transcript.TranscriptDAO):
-                @classmethod
-                async def export(
-                    cls,
-                    channel: typing.Union[
-                        discord.TextChannel, discord.VoiceChannel, discord.Thread
-                    ],
-                    messages: typing.List[discord.Message],
-                    tz_info="UTC",
-                    guild: typing.Optional[discord.Guild] = None,
-                    bot: typing.Optional[discord.Client] = None,
-                    military_time: typing.Optional[bool] = False,
-                    fancy_times: typing.Optional[bool] = True,
-                    support_dev: typing.Optional[bool] = True,
-                    attachment_handler: typing.Optional[typing.Any] = None,
-                ):
-                    if guild:
-                        channel.guild = guild
-                    self = cls(
-                        channel=channel,
-                        limit=None,
-                        messages=messages,
-                        pytz_timezone=tz_info,
-                        military_time=military_time,
-                        fancy_times=fancy_times,
-                        before=None,
-                        after=None,
-                        support_dev=support_dev,
-                        bot=bot,
-                        attachment_handler=attachment_handler,
-                    )
-                    if not self.after:
-                        self.messages.reverse()
-                    return (await self.build_transcript()).html
-
-            transcript = await Transcript.export(
-                channel=channel,
-                messages=messages,
-                tz_info="UTC",
-                guild=channel.guild,
-                bot=ctx.bot,
-            )
+            transcript = await self.get_html_transcript(channel=channel, messages=messages)
         else:
-            BREAK_LINE, BREAK_REPLACE = "\n", "\\n"
-            transcript = "\n".join(
-                [
-                    f"{message.created_at.strftime('%d/%m/%Y %H:%M:%S')} | {message.id} | {message.author.display_name} ({message.author.id}) | {message.content.replace(BREAK_LINE, BREAK_REPLACE)} | {humanize_list([attachment.filename for attachment in message.attachments])}"
-                    for message in messages
-                ]
-            )
+            transcript = self.get_lines(messages, mode=mode, with_header=True).rstrip("\n")
 
         file = discord.File(
             io.BytesIO(transcript.encode()), filename=f"transcript-{channel.id}.{mode}"
         )
         return count_messages, messages, file
 
+    def get_export_path(self, channel_id: int) -> pathlib.Path:
+        path = cog_data_path(self) / "exports"
+        path.mkdir(parents=True, exist_ok=True)
+        return path / f"{channel_id}.part"
+
+    async def remove_export(self, channel_id: int) -> None:
+        async with self.config.exports() as exports:
+            exports.pop(str(channel_id), None)
+        if (part_path := self.get_export_path(channel_id)).exists():
+            part_path.unlink()
+
+    async def start_stream_export(
+        self,
+        ctx: commands.Context,
+        channel: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+        mode: typing.Literal["html", "txt", "ndjson", "csv"] = "txt",
+        compression: typing.Optional[typing.Literal["gzip", "zip"]] = None,
+        before: typing.Optional[typing.Union[discord.Message, discord.Object]] = None,
+        after: typing.Optional[typing.Union[discord.Message, discord.Object]] = None,
+        exclude_users_and_roles: typing.List[typing.Union[discord.User, discord.Role]] = [],
+    ) -> typing.Dict[str, typing.Any]:
+        state = {
+            "guild_id": channel.guild.id,
+            "channel_id": channel.id,
+            "destination_id": ctx.channel.id,
+            "author_id": ctx.author.id,
+            "ignored_message_id": ctx.message.id,
+            "mode": mode,
+            "compression": compression,
+            "before": before.id if before is not None else None,
+            "after": after.id if after is not None else None,
+            "exclude_users_and_roles": [
+                user_or_role.id for user_or_role in exclude_users_and_roles
+            ],
+            "started_at": int(time.time()),
+            "progress_message_id": None,
+            # Checkpoint.
+            "last_message_id": None,
+            "count_messages": 0,
+            "count_parts": 0,
+            "part": None,
+        }
+        async with self.config.exports() as exports:
+            exports[str(channel.id)] = state
+        return state
+
+    async def run_stream_export(
+        self, state: typing.Dict[str, typing.Any], max_retries: int = 5
+    ) -> typing.Optional[typing.Tuple[int, int]]:
+        """Run an export from its last checkpoint, and retry from it after a transient error.
+
+        The checkpoint is kept when the retries are exhausted, to resume the export later, and is
+        removed when the export ends, or fails with an error which isn't transient.
+        """
+        retries = 0
+        while True:
+            try:
+                result = await self.stream_export(state)
+            except TRANSIENT_ERRORS as e:
+                if retries >= max_retries:
+                    raise
+                retries += 1
+                self.logger.warning(
+                    f"Transient error when exporting the channel {state['channel_id']}, resuming from the last checkpoint in {2 ** retries} seconds.",
+                    exc_info=e,
+                )
+                await asyncio.sleep(2**retries)
+                # The state in memory may be ahead of the last checkpoint.
+                state = await self.config.exports.get_raw(str(state["channel_id"]))
+                continue
+            except Exception:
+                # A permanent error would fail again on each resume, and block the new exports.
+                await self.remove_export(state["channel_id"])
+                raise
+            await self.remove_export(state["channel_id"])
+            return result
+
+    async def stream_export(
+        self, state: typing.Dict[str, typing.Any], html_part_messages: int = 2000
+    ) -> typing.Optional[typing.Tuple[int, int]]:
+        """Export the messages page by page in files on disk, sent as soon as they are full.
+
+        Only the current page (or the current html part, because chat_exporter renders a whole
+        transcript at once) is kept in memory. Each part is a valid file on its own, smaller than
+        the upload limit of the guild. The progress is checkpointed in Config every 1000 messages
+        and after each sent part, to resume the export after a restart or a network error.
+        """
+        if (
+            (guild := self.bot.get_guild(state["guild_id"])) is None
+            or (channel := guild.get_channel_or_thread(state["channel_id"])) is None
+            or (destination := guild.get_channel_or_thread(state["destination_id"])) is None
+        ):
+            await self.remove_export(state["channel_id"])
+            return None
+        mode, compression = state["mode"], state["compression"]
+        # The compressed data buffered by the compressor isn't counted in the size of the parts.
+        max_part_size = guild.filesize_limit - 1024 * 1024
+        part_path = self.get_export_path(channel.id)
+        part: typing.Optional[TranscriptPart] = None
+        if state["part"] is not None:
+            part = TranscriptPart(
+                state["part"]["name"],
+                compression=compression,
+                path=part_path,
+                offset=state["part"]["size"],
+            )
+            part.count_messages = state["part"]["count_messages"]
+        elif part_path.exists():
+            part_path.unlink()
+
+        async def save_checkpoint(last_message_id: int) -> None:
+            if part is not None:
+                if (size := await asyncio.to_thread(part.checkpoint)) is None:
+                    return  # The current part can't be resumed, keep the previous checkpoint.
+                state["part"] = {
+                    "name": part.name,
+                    "size": size,
+                    "count_messages": part.count_messages,
+                }
+            else:
+                state["part"] = None
+            state["last_message_id"] = last_message_id
+            await self.config.exports.set_raw(str(channel.id), value=state)
+
+        async def send_part(part: TranscriptPart) -> None:
+            file = await asyncio.to_thread(part.close)
+            await destination.send(
+                _("Part {number} ({count_messages} messages).").format(
+                    number=state["count_parts"] + 1, count_messages=part.count_messages
+                ),
+                file=file,
+            )
+            part.discard()
+            state["count_parts"] += 1
+            state["count_messages"] += part.count_messages
+
+        async def write_html_part(messages: typing.List[discord.Message]) -> None:
+            html_part = TranscriptPart(
+                f"transcript-{channel.id}-{state['count_parts'] + 1}.html",
+                compression=compression,
+                path=part_path,
+            )
+            html_part.count_messages = len(messages)
+            transcript = await self.get_html_transcript(channel=channel, messages=messages[::-1])
+            await asyncio.to_thread(html_part.write, transcript.encode())
+            del transcript
+            if html_part.size > max_part_size and len(messages) > 1:
+                html_part.discard()
+                await write_html_part(messages[: len(messages) // 2])
+                await write_html_part(messages[len(messages) // 2 :])
+                return
+            await send_part(html_part)
+            await save_checkpoint(messages[-1].id)
+
+        # The progress is estimated with the creation date of the last exported message.
+        start_time = (
+            discord.utils.snowflake_time(state["after"])
+            if state["after"] is not None
+            else channel.created_at
+        ).timestamp()
+        end_time = (
+            discord.utils.snowflake_time(state["before"]).timestamp()
+            if state["before"] is not None
+            else state["started_at"]
+        )
+        run_start, run_start_ratio, last_progress = time.monotonic(), None, 0
+        run_count_messages = 0
+
+        async def update_progress(message: discord.Message) -> None:
+            nonlocal run_start_ratio, last_progress
+            ratio = (
+                min(
+                    max(
+                        (message.created_at.timestamp() - start_time) / (end_time - start_time),
+                        0,
+                    ),
+                    1,
+                )
+                if end_time > start_time
+                else 1
+            )
+            if run_start_ratio is None:
+                run_start_ratio = ratio
+            if time.monotonic() - last_progress < 10:
+                return
+            last_progress = time.monotonic()
+            elapsed = last_progress - run_start
+            eta = (
+                elapsed * (1 - ratio) / (ratio - run_start_ratio)
+                if ratio > run_start_ratio
+                else None
+            )
+            content = _(
+                "Exporting the messages of {channel.mention}... {count_messages} messages exported ({percent:.1%}), {rate:.1f} messages/s, ETA: {eta}."
+            ).format(
+                channel=channel,
+                count_messages=state["count_messages"]
+                + (part.count_messages if part is not None else 0)
+                + len(html_messages),
+                percent=ratio,
+                rate=run_count_messages / elapsed,
+                eta=discord.utils.format_dt(
+                    datetime.datetime.now(tz=datetime.timezone.utc)
+                    + datetime.timedelta(seconds=eta),
+                    style="R",
+                )
+                if eta is not None
+                else _("unknown"),
+            )
+            try:
+                if state["progress_message_id"] is not None:
+                    await destination.get_partial_message(state["progress_message_id"]).edit(
+                        content=content
+                    )
+                    return
+            except discord.NotFound:
+                pass
+            state["progress_message_id"] = (await destination.send(content)).id
+
+        html_messages: typing.List[discord.Message] = []
+        last_message_id, count_pages = state["last_message_id"], 0
+        try:
+            async for page in self.iter_messages(
+                channel=channel,
+                before=discord.Object(state["before"]) if state["before"] is not None else None,
+                after=discord.Object(state["last_message_id"] or state["after"])
+                if (state["last_message_id"] or state["after"]) is not None
+                else None,
+                exclude_users_and_roles=[
+                    discord.Object(user_or_role_id)
+                    for user_or_role_id in state["exclude_users_and_roles"]
+                ],
+                ignored_message_id=state["ignored_message_id"],
+            ):
+                run_count_messages += len(page)
+                if mode == "html":
+                    html_messages.extend(page)
+                    if len(html_messages) >= html_part_messages:
+                        await write_html_part(html_messages)
+                        html_messages = []
+                    await update_progress(page[-1])
+                    continue
+                data = self.get_lines(page, mode=mode).encode()
+                if part is not None and part.size + len(data) > max_part_size:
+                    await send_part(part)
+                    part = None
+                    await save_checkpoint(last_message_id)
+                if part is None:
+                    if mode == "csv":  # Each part is a valid file on its own.
+                        data = self.get_lines(page, mode=mode, with_header=True).encode()
+                    part = TranscriptPart(
+                        f"transcript-{channel.id}-{state['count_parts'] + 1}.{mode}",
+                        compression=compression,
+                        path=part_path,
+                    )
+                await asyncio.to_thread(part.write, data)
+                part.count_messages += len(page)
+                last_message_id = page[-1].id
+                count_pages += 1
+                if count_pages % 10 == 0:
+                    await save_checkpoint(last_message_id)
+                await update_progress(page[-1])
+            if html_messages:
+                await write_html_part(html_messages)
+            if part is not None:
+                await send_part(part)
+                part = None
+        finally:
+            if part is not None:
+                await asyncio.to_thread(part.file.close)
+        if state["progress_message_id"] is not None:
+            try:
+                await destination.get_partial_message(state["progress_message_id"]).delete()
+            except discord.HTTPException:
+                pass
+        if state["count_messages"] == 0:
+            raise commands.UserFeedbackCheckFailure(_("Sorry. I could not find any messages."))
+        return state["count_messages"], state["count_parts"]
+
     @commands.guild_only()
     @commands.guildowner_or_permissions(administrator=True)
     @commands.bot_has_permissions(attach_files=True, embed_links=True)
@@ -186,7 +792,7 @@ async def all(
         self,
         ctx: commands.Context,
         channel: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread] = None,
-        mode: typing.Literal["html", "txt"] = "html",
+        mode: typing.Literal["html", "txt", "ndjson", "csv"] = "html",
         exclude_users_and_roles: commands.Greedy[typing.Union[discord.User, discord.Role]] = [],
     ) -> None:
         """Export all of a channel's messages to an html file.
@@ -227,7 +833,7 @@ async def message(
         self,
         ctx: commands.Context,
         message: discord.Message,
-        mode: typing.Literal["html", "txt"] = "html",
+        mode: typing.Literal["html", "txt", "ndjson", "csv"] = "html",
     ) -> None:
         """Export a specific message in an html file.
 
@@ -269,7 +875,7 @@ async def messages(
             typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
         ],
         limit: int,
-        mode: typing.Literal["html", "txt"] = "html",
+        mode: typing.Literal["html", "txt", "ndjson", "csv"] = "html",
         exclude_users_and_roles: commands.Greedy[typing.Union[discord.User, discord.Role]] = [],
     ) -> None:
         """Export a part of the messages of a channel in an html file.
@@ -315,7 +921,7 @@ async def before(
             typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
         ],
         before: MessageOrObjectConverter,
-        mode: typing.Literal["html", "txt"] = "html",
+        mode: typing.Literal["html", "txt", "ndjson", "csv"] = "html",
         exclude_users_and_roles: commands.Greedy[typing.Union[discord.User, discord.Role]] = [],
     ) -> None:
         """Export a part of the messages of a channel in an html file.
@@ -361,7 +967,7 @@ async def after(
             typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
         ],
         after: MessageOrObjectConverter,
-        mode: typing.Literal["html", "txt"] = "html",
+        mode: typing.Literal["html", "txt", "ndjson", "csv"] = "html",
         exclude_users_and_roles: commands.Greedy[typing.Union[discord.User, discord.Role]] = [],
     ) -> None:
         """Export a part of the messages of a channel in an html file.
@@ -408,7 +1014,7 @@ async def between(
         ],
         before: MessageOrObjectConverter,
         after: MessageOrObjectConverter,
-        mode: typing.Literal["html", "txt"] = "html",
+        mode: typing.Literal["html", "txt", "ndjson", "csv"] = "html",
         exclude_users_and_roles: commands.Greedy[typing.Union[discord.User, discord.Role]] = [],
     ) -> None:
         """Export a part of the messages of a channel in an html file.
@@ -456,7 +1062,7 @@ async def user(
         ],
         user: discord.User,
         limit: typing.Optional[int] = None,
-        mode: typing.Literal["html", "txt"] = "html",
+        mode: typing.Literal["html", "txt", "ndjson", "csv"] = "html",
     ) -> None:
         """Export a part of the messages of a channel in an html file.
 
@@ -502,7 +1108,7 @@ async def bot(
         ],
         bot: typing.Optional[bool] = True,
         limit: typing.Optional[int] = None,
-        mode: typing.Literal["html", "txt"] = "html",
+        mode: typing.Literal["html", "txt", "ndjson", "csv"] = "html",
         exclude_users_and_roles: commands.Greedy[typing.Union[discord.User, discord.Role]] = [],
     ) -> None:
         """Export a part of the messages of a channel in an html file.
@@ -540,3 +1146,117 @@ async def bot(
         else:
             embed, view = None, None
         await message.edit(embed=embed, view=view)
+
+    @exportchannel.command()
+    async def stream(
+        self,
+        ctx: commands.Context,
+        channel: typing.Optional[
+            typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
+        ] = None,
+        mode: typing.Literal["html", "txt", "ndjson", "csv"] = "txt",
+        compression: typing.Literal["none", "gzip", "zip"] = "none",
+        exclude_users_and_roles: commands.Greedy[typing.Union[discord.User, discord.Role]] = [],
+    ) -> None:
+        """Export all of a channel's messages, for the big channels, in several files if needed.
+
+        The messages are exported by pages, with a bounded memory usage, and the files are sent as soon as they reach the upload limit. The html files contain at most 2000 messages each.
+        The export is checkpointed, and is resumed after a restart or a network error. It is cancelled after any other error.
+        Please note: all attachments and user avatars are saved with the Discord link in these files.
+        Remember that exporting other users' messages from Discord does not respect the TOS.
+        """
+        if channel is None:
+            channel = ctx.channel
+        await self.check_channel(ctx, channel)
+        if str(channel.id) in await self.config.exports():
+            raise commands.UserFeedbackCheckFailure(
+                _(
+                    "An export of this channel is already in progress or interrupted. Use `{prefix}exportchannel resume` or `{prefix}exportchannel cancel`."
+                ).format(prefix=ctx.clean_prefix)
+            )
+        state = await self.start_stream_export(
+            ctx,
+            channel=channel,
+            mode=mode,
+            compression=compression if compression != "none" else None,
+            exclude_users_and_roles=exclude_users_and_roles,
+        )
+        await self.run_export_task(state, ctx=ctx)
+
+    @exportchannel.command()
+    async def streambetween(
+        self,
+        ctx: commands.Context,
+        channel: typing.Optional[
+            typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
+        ],
+        before: MessageOrObjectConverter,
+        after: MessageOrObjectConverter,
+        mode: typing.Literal["html", "txt", "ndjson", "csv"] = "txt",
+        compression: typing.Literal["none", "gzip", "zip"] = "none",
+        exclude_users_and_roles: commands.Greedy[typing.Union[discord.User, discord.Role]] = [],
+    ) -> None:
+        """Export a part of a channel's messages, for the big channels, in several files if needed.
+
+        Specify the before and after messages (id or link) or a valid snowflake.
+        The export is streamed and checkpointed like with the `stream` command.
+        Please note: all attachments and user avatars are saved with the Discord link in these files.
+        Remember that exporting other users' messages from Discord does not respect the TOS.
+        """
+        if channel is None:
+            channel = ctx.channel
+        await self.check_channel(ctx, channel)
+        if str(channel.id) in await self.config.exports():
+            raise commands.UserFeedbackCheckFailure(
+                _(
+                    "An export of this channel is already in progress or interrupted. Use `{prefix}exportchannel resume` or `{prefix}exportchannel cancel`."
+                ).format(prefix=ctx.clean_prefix)
+            )
+        state = await self.start_stream_export(
+            ctx,
+            channel=channel,
+            mode=mode,
+            compression=compression if compression != "none" else None,
+            before=before,
+            after=after,
+            exclude_users_and_roles=exclude_users_and_roles,
+        )
+        await self.run_export_task(state, ctx=ctx)
+
+    @exportchannel.command()
+    async def resume(
+        self,
+        ctx: commands.Context,
+        channel: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread] = None,
+    ) -> None:
+        """Resume an interrupted streamed export from its last checkpoint."""
+        if channel is None:
+            channel = ctx.channel
+        if (state := (await self.config.exports()).get(str(channel.id))) is None:
+            raise commands.UserFeedbackCheckFailure(_("No export to resume for this channel."))
+        if channel.id in self.exports_tasks:
+            raise commands.UserFeedbackCheckFailure(
+                _("The export of this channel is already in progress.")
+            )
+        await ctx.send(_("Resuming the export of {channel.mention}...").format(channel=channel))
+        await self.run_export_task(state, ctx=ctx)
+
+    @exportchannel.command()
+    async def cancel(
+        self,
+        ctx: commands.Context,
+        channel: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread] = None,
+    ) -> None:
+        """Cancel a streamed export in progress or interrupted."""
+        if channel is None:
+            channel = ctx.channel
+        if str(channel.id) not in await self.config.exports():
+            raise commands.UserFeedbackCheckFailure(_("No export to cancel for this channel."))
+        if (task := self.exports_tasks.pop(channel.id, None)) is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.remove_export(channel.id)
+        await ctx.send(_("Export of {channel.mention} cancelled.").format(channel=channel))
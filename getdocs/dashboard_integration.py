@@ -25,7 +25,7 @@ async def on_dashboard_cog_add(self, dashboard_cog: commands.Cog) -> None:
     async def rpc_callback_sources(self, **kwargs) -> typing.Dict[str, typing.Any]:
         return {"status": 0, "data": {"sources": list(self.documentations.keys())}}
 
-    @dashboard_page(name="rtfm", hidden=True)
+    @dashboard_page(name="rtfm", hidden=True, cache_ttl=300, cache_vary_by=("query",))
     async def rpc_callback_rtfm(
         self,
         source: str,
@@ -53,7 +53,7 @@ async def rpc_callback_rtfm(
         results = await _source.search(query=query, limit=limit, exclude_std=not with_std)
         return {"status": 0, "source": source, "results": results.results}
 
-    @dashboard_page(name="documentations", hidden=True)
+    @dashboard_page(name="documentations", hidden=True, cache_ttl=300, cache_vary_by=("query",))
     async def rpc_callback_documentations(
         self, source: str, documentation: str, **kwargs
     ) -> typing.Dict[str, typing.Any]:
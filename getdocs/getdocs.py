@@ -15,6 +15,7 @@
 import sys
 import tempfile
 import time
+from collections import OrderedDict
 from dataclasses import is_dataclass
 from urllib.parse import ParseResult, urljoin, urlparse
 
@@ -249,6 +250,8 @@ def __init__(self, bot: Red) -> None:
         self.config.register_global(
             default_source="discord.py",
             caching=True,
+            lazy_loading=False,
+            max_loaded_sources=5,
             enabled_sources=["discord.py", "redbot", "python", "aiohttp", "discordapi"],
         )
 
@@ -257,6 +260,7 @@ def __init__(self, bot: Red) -> None:
         self._load_time: float = None
         self._caching_time: typing.Dict[str, int] = {"GLOBAL": 0}
         self._docs_sizes: typing.Dict[str, int] = {"GLOBAL": 0}
+        self._sources_usage: typing.OrderedDict[str, float] = OrderedDict()
 
         # self._playwright = None
         # self._browser = None
@@ -275,6 +279,14 @@ def __init__(self, bot: Red) -> None:
                 "converter": bool,
                 "description": "Enable or disable Documentations caching when loading the cog.\n\nIf the option is disabled, a web request will be executed when the command `[p]getdocs` is run only for the searched item.",
             },
+            "lazy_loading": {
+                "converter": bool,
+                "description": "Enable or disable lazy loading of the sources.\n\nIf the option is enabled, only the RTFM inventory of each source is fetched when loading the cog. The manuals are crawled when a documentation of them is queried for the first time, and the cache of the least recently used sources is cleared. Reload the cog to apply this setting.",
+            },
+            "max_loaded_sources": {
+                "converter": commands.Range[int, 1, None],
+                "description": "Set the maximum number of sources with Documentations in cache, when lazy loading is enabled.",
+            },
         }
         self.settings: Settings = Settings(
             bot=self.bot,
@@ -297,6 +309,7 @@ async def cog_load(self) -> None:
         self._load_time = int(time.monotonic())
         self._session: aiohttp.ClientSession = aiohttp.ClientSession()
         enabled_sources = await self.config.enabled_sources()
+        lazy_loading = await self.config.lazy_loading()
         for source in BASE_URLS:
             if source not in enabled_sources:
                 continue
@@ -308,9 +321,11 @@ async def cog_load(self) -> None:
                 aliases=BASE_URLS[source].get("aliases", []),
                 display_name=BASE_URLS[source].get("display_name"),
             )
-            asyncio.create_task(self.documentations[source].load())
+            asyncio.create_task(self.documentations[source].load(lazy=lazy_loading))
 
     async def cog_unload(self) -> None:
+        for source in self.documentations.values():
+            source._cancel_manuals_crawling()
         await super().cog_unload()  # Close loops before session closing.
         if self._session is not None:
             await self._session.close()
@@ -359,6 +374,7 @@ async def docs(
             await ctx.send(embed=embed, view=view)
             return
         if query == "random":
+            await source.ensure_loaded()
             if source._rtfm_cache is None or (
                 source._rtfm_caching_task is not None
                 and source._rtfm_caching_task.currently_running
@@ -574,6 +590,7 @@ async def _sources_enable(
         Enable Documentations source(s).
         """
         enabled_sources: typing.List[str] = await self.config.enabled_sources()
+        lazy_loading = await self.config.lazy_loading()
         for source in sources:
             if source in enabled_sources and source in self.documentations:
                 raise commands.UserFeedbackCheckFailure(
@@ -592,7 +609,7 @@ async def _sources_enable(
                 aliases=BASE_URLS[source]["aliases"],
                 display_name=BASE_URLS[source].get("display_name"),
             )
-            asyncio.create_task(self.documentations[source].load())
+            asyncio.create_task(self.documentations[source].load(lazy=lazy_loading))
         await self.config.enabled_sources.set(enabled_sources)
 
     @configuration.command(name="disablesources", aliases=["disablesource"])
@@ -650,6 +667,19 @@ async def stats(self, ctx: commands.Context) -> None:
             )
         await Menu(pages=str(table), lang="py").start(ctx)
 
+    async def evict_cold_sources(self) -> None:
+        """Clear the Documentations cache of the least recently used lazy sources."""
+        max_loaded_sources = await self.config.max_loaded_sources()
+        loaded_sources = [
+            name
+            for name in self._sources_usage
+            if name in self.documentations
+            and self.documentations[name]._lazy
+            and self.documentations[name].loaded
+        ]
+        for name in loaded_sources[:-max_loaded_sources]:
+            self.documentations[name].unload_documentations()
+
     @configuration.command(hidden=True)
     async def getdebugloopsstatus(self, ctx: commands.Context) -> None:
         """Get an embed to check loops status."""
@@ -748,30 +778,39 @@ def __init__(
         self._result_docs_cache: typing.Dict[str, Documentation] = {}
         # self._rtfs_cache: typing.List = []
 
+        self._lazy: bool = False
+        self._crawled_manuals: typing.Set[str] = set()
+        self._manuals_crawling_tasks: typing.Dict[str, asyncio.Task] = {}
+        # The last loop of each cache, in `cog.loops`.
+        self._caching_loops: typing.Dict[str, Loop] = {}
+
+    @property
+    def loaded(self) -> bool:
+        return bool(self._docs_cache) or (self._lazy and self._docs_caching_task is not None)
+
     ###################
     # Building caches #
     ###################
 
-    async def load(self) -> None:
+    async def load(self, lazy: bool = False) -> None:
+        self._lazy = lazy
+        if lazy and hasattr(self, f"_build_{self.name}_docs_cache"):
+            return  # Special sources are built on first query, in `ensure_loaded`.
         if not hasattr(self, f"_build_{self.name}_docs_cache"):
-            self._rtfm_caching_task: Loop = Loop(
-                cog=self.cog,
-                name=f"`{self.name}`: Build RTFM Cache",
-                function=self._build_rtfm_cache,
-                limit_count=1,
+            self._rtfm_caching_task: Loop = self._create_caching_loop(
+                "rtfm", name=f"`{self.name}`: Build RTFM Cache", function=self._build_rtfm_cache
             )
-            self.cog.loops.append(self._rtfm_caching_task)
             while self._rtfm_cache is None or (
                 self._rtfm_caching_task is not None and self._rtfm_caching_task.currently_running
             ):
                 await asyncio.sleep(1)
-        self._docs_caching_task: Loop = Loop(
-            cog=self.cog,
+        if lazy:
+            return  # Manuals are crawled on first query, in `get_documentation`.
+        self._docs_caching_task: Loop = self._create_caching_loop(
+            "docs",
             name=f"`{self.name}`: Build Documentations Cache",
             function=self._build_docs_cache,
-            limit_count=1,
         )
-        self.cog.loops.append(self._docs_caching_task)
         # if not self._rtfs_cache:
         #     self._rtfs_caching_task: Loop = Loop(
         #         cog=self.cog,
@@ -781,6 +820,85 @@ async def load(self) -> None:
         #     )
         #     self.cog.loops.append(self._rtfs_caching_task)
 
+    async def ensure_loaded(self) -> None:
+        self.cog._sources_usage[self.name] = time.monotonic()
+        self.cog._sources_usage.move_to_end(self.name)
+        if not self._lazy:
+            return
+        if hasattr(self, f"_build_{self.name}_docs_cache") and self._docs_caching_task is None:
+            self._docs_caching_task: Loop = self._create_caching_loop(
+                "docs",
+                name=f"`{self.name}`: Build Documentations Cache",
+                function=self._build_docs_cache,
+            )
+        await self.cog.evict_cold_sources()
+
+    def _create_caching_loop(
+        self, cache: str, name: str, function: typing.Callable[[], typing.Awaitable[None]]
+    ) -> Loop:
+        # The loop of the previous load is replaced, so `cog.loops` doesn't grow on each reload.
+        if (previous := self._caching_loops.pop(cache, None)) is not None and any(
+            loop is previous for loop in self.cog.loops
+        ):
+            self.cog.loops.remove(previous)
+        loop = Loop(cog=self.cog, name=name, function=function, limit_count=1)
+        self._caching_loops[cache] = loop
+        self.cog.loops.append(loop)
+        return loop
+
+    def unload_documentations(self) -> None:
+        if self._docs_caching_task is not None and self._docs_caching_task.currently_running:
+            return
+        self._cancel_manuals_crawling()
+        self._docs_cache = []
+        self._result_docs_cache = {}
+        self._crawled_manuals = set()
+        if hasattr(self, f"_build_{self.name}_docs_cache"):
+            self._docs_caching_task = None
+            self._rtfm_cache = None
+            self._raw_rtfm_cache_with_std = []
+            self._raw_rtfm_cache_without_std = []
+        stats = self.cog._docs_stats.pop(self.name, {"manuals": 0, "documentations": 0})
+        self.cog._docs_stats["GLOBAL"]["manuals"] -= stats["manuals"]
+        self.cog._docs_stats["GLOBAL"]["documentations"] -= stats["documentations"]
+        self.cog._docs_sizes["GLOBAL"] -= self.cog._docs_sizes.pop(self.name, 0)
+        self.cog.logger.debug(f"`{self.name}`: Documentations cache cleared (cold source).")
+
+    def _cancel_manuals_crawling(self) -> None:
+        for task in self._manuals_crawling_tasks.values():
+            task.cancel()
+        self._manuals_crawling_tasks = {}
+
+    async def _crawl_manual(self, page_url: str) -> None:
+        try:
+            documentations = await self._get_all_manual_documentations(page_url)
+        except Exception as e:
+            self.cog.logger.debug(
+                f"`{self.name}`: Error occured while trying to cache `{page_url}` documentation.",
+                exc_info=e,
+            )
+            self._docs_caching_progress[page_url] = e
+            return
+        finally:
+            self._manuals_crawling_tasks.pop(page_url, None)
+        names = {documentation.name for documentation in self._docs_cache}
+        documentations = [
+            documentation for documentation in documentations if documentation.name not in names
+        ]
+        self._docs_cache.extend(documentations)
+        self._crawled_manuals.add(page_url)
+        stats = self.cog._docs_stats.setdefault(self.name, {"manuals": 0, "documentations": 0})
+        stats["manuals"] += 1
+        self.cog._docs_stats["GLOBAL"]["manuals"] += 1
+        stats["documentations"] += len(documentations)
+        self.cog._docs_stats["GLOBAL"]["documentations"] += len(documentations)
+        size = get_object_size(documentations)
+        self.cog._docs_sizes[self.name] = self.cog._docs_sizes.get(self.name, 0) + size
+        self.cog._docs_sizes["GLOBAL"] += size
+        self.cog.logger.verbose(
+            f"`{self.name}`: `{page_url}` documentation added to documentation cache."
+        )
+
     async def _build_rtfm_cache(self, recache: bool = False) -> Inventory:
         if self._rtfm_cache is not None and not recache:
             return self._rtfm_cache
@@ -1733,6 +1851,7 @@ async def search(
         exclude_std: bool = False,
         with_raw_search: bool = False,
     ) -> SearchResults:
+        await self.ensure_loaded()
         if self._rtfm_cache is None or (
             self._rtfm_caching_task is not None and self._rtfm_caching_task.currently_running
         ):
@@ -1878,6 +1997,7 @@ async def get_documentation(self, name: str) -> Documentation:
         #         name = f"discord.{name}"
         #     elif f"discord.ext.commands.{name}" in self._raw_rtfm_cache_without_std:
         #         name = f"discord.ext.commands.{name}"
+        await self.ensure_loaded()
         documentation = discord.utils.get(self._docs_cache, name=name)
         if self.name not in ("discordapi", "git", "warcraftapi") and documentation is None:
             item = discord.utils.get(self._rtfm_cache.objects, name=name)
@@ -1890,6 +2010,14 @@ async def get_documentation(self, name: str) -> Documentation:
             documentation = await self._get_all_manual_documentations(
                 page_url=page_url, item_name=name
             )
+            if (
+                self._lazy
+                and page_url not in self._crawled_manuals
+                and page_url not in self._manuals_crawling_tasks
+            ):
+                self._manuals_crawling_tasks[page_url] = asyncio.create_task(
+                    self._crawl_manual(page_url)
+                )
             if documentation is None:
                 return
             self._docs_cache.append(documentation)
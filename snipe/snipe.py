@@ -1,4 +1,4 @@
-from AAA3A_utils import Cog, Menu, Settings  # isort:skip
+from AAA3A_utils import Cog, Loop, Menu, Settings  # isort:skip
 from redbot.core import commands, Config  # isort:skip
 from redbot.core.bot import Red  # isort:skip
 from redbot.core.i18n import Translator, cog_i18n  # isort:skip
@@ -6,7 +6,8 @@
 import typing  # isort:skip
 
 import datetime
-from collections import defaultdict, deque
+import time
+from collections import OrderedDict, deque
 from copy import deepcopy
 from sys import getsizeof
 
@@ -30,29 +31,68 @@ def sizeof_fmt(num, suffix="B"):
     return f"{num:.1f}Yi{suffix}"
 
 
-# Thanks Phen!
-def recursive_getsizeof(obj: object) -> int:
-    total = 0
+def get_object_size(obj: typing.Any, _seen: typing.Optional[typing.Set[int]] = None) -> int:
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    size = getsizeof(obj)
     if isinstance(obj, typing.Mapping):
-        for v in obj.values():
-            total += recursive_getsizeof(v)
-    else:
-        total += getsizeof(obj)
-    return total
+        size += sum(
+            get_object_size(key, _seen) + get_object_size(value, _seen)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+        size += sum(get_object_size(item, _seen) for item in obj)
+    elif hasattr(obj, "__slots__"):
+        size += sum(
+            get_object_size(getattr(obj, slot), _seen)
+            for slot in obj.__slots__
+            if hasattr(obj, slot)
+        )
+    elif hasattr(obj, "__dict__"):
+        size += get_object_size(obj.__dict__, _seen)
+    return size
 
 
 class SnipedMessage:
+    __slots__: typing.Tuple[str, ...] = (
+        "type",
+        "id",
+        "guild_id",
+        "channel_id",
+        "channel_name",
+        "author_id",
+        "author_name",
+        "author_avatar_url",
+        "created_at",
+        "deleted_at",
+        "reference_jump_url",
+        "reference_content",
+        "content",
+        "new_content",
+        "embed",
+        "embed_url",
+        "embeds_count",
+        "sticker",
+        "mentions",
+        "role_mentions",
+        "size",
+    )
+
     def __init__(
         self, message: discord.Message, after: typing.Optional[discord.Message] = None
     ) -> None:
         self.type: typing.Literal["deleted", "edited"] = "deleted" if after is None else "edited"
 
         self.id: int = message.id
-        self.jump_url: str = message.jump_url
-        self.author: discord.Member = message.author
-        self.channel: typing.Optional[
-            typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
-        ] = message.channel
+        self.guild_id: int = message.guild.id
+        self.channel_id: int = message.channel.id
+        self.channel_name: str = message.channel.name
+        self.author_id: int = message.author.id
+        self.author_name: str = message.author.display_name
+        self.author_avatar_url: str = message.author.display_avatar.url
 
         self.created_at: datetime.datetime = message.created_at
         self.deleted_at: datetime.datetime = datetime.datetime.now(tz=datetime.timezone.utc)
@@ -60,35 +100,57 @@ def __init__(
         if message.reference is not None and isinstance(
             (reference := message.reference.resolved), discord.Message
         ):
-            self.reference: discord.Message = reference
+            self.reference_jump_url: typing.Optional[str] = reference.jump_url
+            self.reference_content: typing.Optional[str] = reference.content
         else:
-            self.reference = None
+            self.reference_jump_url = None
+            self.reference_content = None
         self.content: str = message.content
-        if self.type == "edited":
-            self.new_content: str = after.content
-        self.embeds: typing.List[discord.Embed] = message.embeds.copy()
-        self.attachments: typing.List[discord.Attachment] = message.attachments.copy()
-        self.stickers: typing.List[discord.Sticker] = message.stickers.copy()
-
-        self.mentions: typing.List[discord.Member] = message.mentions.copy()
-        self.role_mentions: typing.List[discord.Role] = message.role_mentions.copy()
-        self.member_mentions: typing.List[typing.Union[discord.Member, discord.User]] = [
-            mention
-            for mention in message.mentions
-            if isinstance(mention, (discord.Member, discord.User))
-        ]
+        self.new_content: typing.Optional[str] = after.content if self.type == "edited" else None
+        # Only the data displayed by `to_embed` is kept, not the `Embed`/`Sticker` objects.
+        self.embed: typing.Optional[typing.Dict[str, typing.Any]] = None
+        self.embed_url: typing.Optional[str] = None
+        self.embeds_count: int = len(message.embeds)
+        if message.embeds:
+            e = message.embeds[0]
+            if e.type == "rich":
+                self.embed = e.to_dict()
+            if e.type in ("image", "article"):
+                self.embed_url = e.url
+        self.sticker: typing.Optional[typing.Tuple[str, str]] = next(
+            ((sticker.name, str(sticker.url)) for sticker in message.stickers if sticker.url),
+            None,
+        )
+
+        self.mentions: typing.Tuple[int, ...] = tuple(mention.id for mention in message.mentions)
+        self.role_mentions: typing.Tuple[int, ...] = tuple(
+            role.id for role in message.role_mentions
+        )
+
+        self.size: int = 0
+        self.size = get_object_size(self)
 
-    def to_embed(self, embed_color: discord.Color = discord.Color.green()) -> discord.Embed:
+    @property
+    def jump_url(self) -> str:
+        return f"https://discord.com/channels/{self.guild_id}/{self.channel_id}/{self.id}"
+
+    @property
+    def author_mention(self) -> str:
+        return f"<@{self.author_id}>"
+
+    @property
+    def member_mentions(self) -> typing.Tuple[int, ...]:
+        return self.mentions
+
+    def to_embed(
+        self, guild: discord.Guild, embed_color: discord.Color = discord.Color.green()
+    ) -> discord.Embed:
         embed: typing.Optional[discord.Embed] = None
-        image = None
+        image = self.embed_url
 
-        if self.embeds:
-            e = self.embeds[0]
-            if e.type == "rich":
-                e.timestamp = self.deleted_at
-                embed = discord.Embed.from_dict(deepcopy(e.to_dict()))
-            if e.type in ("image", "article"):
-                image = e.url
+        if self.embed is not None:
+            embed = discord.Embed.from_dict(deepcopy(self.embed))
+            embed.timestamp = self.deleted_at
         if embed is None:
             embed = discord.Embed(
                 description=f">>> {self.content}" if self.content.strip() else None,
@@ -103,33 +165,42 @@ def to_embed(self, embed_color: discord.Color = discord.Color.green()) -> discor
             embed.title = _("Edited Message (Sent on {created_timestamp})").format(
                 created_timestamp=f"<t:{int(self.created_at.timestamp())}:F>"
             )
-        embed.set_author(
-            name=f"{self.author.display_name} ({self.author.id})",
-            icon_url=self.author.display_avatar,
-            url=self.jump_url,
+        # Members and channels are resolved again on display, falling back on the snapshot.
+        if (author := guild.get_member(self.author_id)) is not None:
+            embed.set_author(
+                name=f"{author.display_name} ({author.id})",
+                icon_url=author.display_avatar,
+                url=self.jump_url,
+            )
+        else:
+            embed.set_author(
+                name=f"{self.author_name} ({self.author_id})",
+                icon_url=self.author_avatar_url,
+                url=self.jump_url,
+            )
+        channel = guild.get_channel_or_thread(self.channel_id)
+        embed.set_footer(
+            text=f"#{channel.name if channel is not None else self.channel_name}",
+            icon_url=guild.icon,
+        )
+        embed.add_field(
+            name=_("Channel:"),
+            value=channel.mention if channel is not None else f"<#{self.channel_id}>",
+            inline=True,
         )
-        embed.set_footer(text=f"#{self.channel.name}", icon_url=self.channel.guild.icon)
-        embed.add_field(name=_("Channel:"), value=self.channel.mention, inline=True)
         embed.add_field(
             name=_("Deleted at:") if self.type == "deleted" else _("Edited at:"),
             value=f"<t:{int(self.deleted_at.timestamp())}:F>",
             inline=True,
         )
 
-        # if self.attachments:
-        #     image = self.attachments[0].proxy_url
-        #     embed.add_field(name=_("Attachments:"), value="\n".join(f"[{attachment.filename}]({attachment.url})" for attachment in self.attachments), inline=False)
-
         # sourcery skip: merge-nested-ifs
         if image is None:
-            if self.stickers:
-                for sticker in self.stickers:
-                    if sticker.url:
-                        image = str(sticker.url)
-                        embed.add_field(
-                            name=_("Stickers:"), value=f"[{sticker.name}]({image})", inline=False
-                        )
-                        break
+            if self.sticker is not None:
+                sticker_name, image = self.sticker
+                embed.add_field(
+                    name=_("Stickers:"), value=f"[{sticker_name}]({image})", inline=False
+                )
         # else:
         #     embed.set_image(url=image)
 
@@ -140,17 +211,162 @@ def to_embed(self, embed_color: discord.Color = discord.Color.green()) -> discor
                 inline=False,
             )
 
-        if self.reference is not None:
-            jump_url = self.reference.jump_url
+        if self.reference_jump_url is not None:
             embed.add_field(
                 name=_("Replying to:"),
-                value=f"[{self.reference.content.strip()[:1000] if self.reference.content.strip() else _('Click to view attachments.')}]({jump_url})",
+                value=f"[{self.reference_content.strip()[:1000] if self.reference_content.strip() else _('Click to view attachments.')}]({self.reference_jump_url})",
                 inline=False,
             )
 
         return embed
 
 
+class SnipeCache:
+    """Sniped messages by channel id, with the channels in least recently used order.
+
+    Secondary indexes (by author, mentioned user/role, with mentions/roles mentions/embeds),
+    scoped by channel and by guild, are maintained on insert and eviction to answer the filtered
+    queries.
+    """
+
+    def __init__(self, maxlen: int = 100) -> None:
+        self.maxlen: int = maxlen
+        self.channels: typing.OrderedDict[int, typing.Deque[SnipedMessage]] = OrderedDict()
+        self.last_used: typing.Dict[int, float] = {}
+        self.entries: int = 0
+        self.size: int = 0
+        # Dicts are used as insertion ordered sets, to keep the messages in chronological order.
+        self.indexes: typing.Dict[
+            typing.Tuple[str, int, str, typing.Optional[int]], typing.Dict[SnipedMessage, None]
+        ] = {}
+
+    def __getitem__(self, channel_id: int) -> typing.Deque[SnipedMessage]:
+        if channel_id not in self.channels:
+            return deque()
+        self._touch(channel_id)
+        return self.channels[channel_id]
+
+    def __len__(self) -> int:
+        return self.entries
+
+    def _touch(self, channel_id: int) -> None:
+        self.channels.move_to_end(channel_id)
+        self.last_used[channel_id] = time.monotonic()
+
+    @staticmethod
+    def _index_keys(
+        sniped_message: SnipedMessage,
+    ) -> typing.Iterator[typing.Tuple[str, int, str, typing.Optional[int]]]:
+        for scope in (("channel", sniped_message.channel_id), ("guild", sniped_message.guild_id)):
+            yield *scope, "author", sniped_message.author_id
+            for user_id in set(sniped_message.mentions):
+                yield *scope, "mention", user_id
+            for role_id in set(sniped_message.role_mentions):
+                yield *scope, "role_mention", role_id
+            if sniped_message.mentions:
+                yield *scope, "mentions", None
+            if sniped_message.role_mentions:
+                yield *scope, "role_mentions", None
+            if sniped_message.embeds_count:
+                yield *scope, "embeds", None
+
+    def _add(self, sniped_message: SnipedMessage) -> None:
+        self.entries += 1
+        self.size += sniped_message.size
+        for key in self._index_keys(sniped_message):
+            self.indexes.setdefault(key, {})[sniped_message] = None
+
+    def _remove(self, sniped_message: SnipedMessage) -> None:
+        self.entries -= 1
+        self.size -= sniped_message.size
+        for key in self._index_keys(sniped_message):
+            if (index := self.indexes.get(key)) is None:
+                continue
+            index.pop(sniped_message, None)
+            if not index:
+                del self.indexes[key]
+
+    def filter(
+        self,
+        kind: typing.Literal[
+            "author", "mention", "role_mention", "mentions", "role_mentions", "embeds"
+        ],
+        value: typing.Optional[int] = None,
+        *,
+        channel_id: typing.Optional[int] = None,
+        guild_id: typing.Optional[int] = None,
+    ) -> typing.List[SnipedMessage]:
+        if channel_id is not None:
+            if channel_id in self.channels:
+                self._touch(channel_id)
+            key = ("channel", channel_id, kind, value)
+        elif guild_id is not None:
+            key = ("guild", guild_id, kind, value)
+        else:
+            raise TypeError("A channel id or a guild id is required.")
+        return list(self.indexes.get(key, ()))
+
+    def guild_messages(self, guild_id: int) -> typing.List[SnipedMessage]:
+        return sorted(
+            (
+                sniped_message
+                for messages in self.channels.values()
+                if messages and messages[0].guild_id == guild_id
+                for sniped_message in messages
+            ),
+            key=lambda sniped_message: sniped_message.deleted_at,
+        )
+
+    def append(self, sniped_message: SnipedMessage) -> None:
+        if (messages := self.channels.get(sniped_message.channel_id)) is None:
+            messages = self.channels[sniped_message.channel_id] = deque()
+        if len(messages) >= self.maxlen:
+            self._remove(messages.popleft())
+        messages.append(sniped_message)
+        self._add(sniped_message)
+        self._touch(sniped_message.channel_id)
+
+    def oldest_use(self) -> typing.Optional[float]:
+        if not self.channels:
+            return None
+        return self.last_used[next(iter(self.channels))]
+
+    def pop_oldest(self) -> typing.Optional[SnipedMessage]:
+        if not self.channels:
+            return None
+        channel_id, messages = next(iter(self.channels.items()))
+        sniped_message = messages.popleft()
+        self._remove(sniped_message)
+        if not messages:
+            self.remove_channel(channel_id)
+        return sniped_message
+
+    def remove_channel(self, channel_id: int) -> None:
+        for sniped_message in self.channels.pop(channel_id, ()):
+            self._remove(sniped_message)
+        self.last_used.pop(channel_id, None)
+
+    def remove_guild(self, guild_id: int) -> None:
+        for channel_id, messages in list(self.channels.items()):
+            if messages and messages[0].guild_id == guild_id:
+                self.remove_channel(channel_id)
+
+    def expire(self, max_ages: typing.Dict[int, int]) -> int:
+        """Remove the messages older than the max age (in seconds) of their guild."""
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        expired = 0
+        for channel_id, messages in list(self.channels.items()):
+            if not messages or not (max_age := max_ages.get(messages[0].guild_id)):
+                continue
+            limit = now - datetime.timedelta(seconds=max_age)
+            while messages and messages[0].deleted_at < limit:
+                self._remove(messages.popleft())
+                expired += 1
+            if not messages:
+                self.remove_channel(channel_id)
+        return expired
+
+
 @cog_i18n(_)
 class Snipe(DashboardIntegration, Cog):
     """Bulk sniping deleted and edited messages, for moderation purpose!"""
@@ -160,24 +376,25 @@ class Snipe(DashboardIntegration, Cog):
     def __init__(self, bot: Red) -> None:
         super().__init__(bot=bot)
 
-        self.deleted_messages: typing.Dict[
-            typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
-            typing.List[SnipedMessage],
-        ] = defaultdict(lambda: deque(maxlen=100))
-        self.edited_messages: typing.Dict[
-            typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
-            typing.List[SnipedMessage],
-        ] = defaultdict(lambda: deque(maxlen=100))
+        self.deleted_messages: SnipeCache = SnipeCache(maxlen=100)
+        self.edited_messages: SnipeCache = SnipeCache(maxlen=100)
         self.no_track: typing.Set[int] = set()
+        self.cache_max_entries: int = 50_000
+        self.cache_max_size: int = 64  # MiB
 
         self.config: Config = Config.get_conf(
             self,
             identifier=205192943327321000143939875896557571750,
             force_registration=True,
         )
+        self.config.register_global(
+            cache_max_entries=50_000,
+            cache_max_size=64,  # MiB
+        )
         self.config.register_guild(
             ignored=False,
             ignored_channels=[],
+            max_age=0,  # minutes
         )
 
         _settings: typing.Dict[str, typing.Dict[str, typing.Any]] = {
@@ -189,6 +406,10 @@ def __init__(self, bot: Red) -> None:
                 "converter": commands.Greedy[discord.abc.GuildChannel],
                 "description": "Set the channels in which deleted and edited messages will be ignored.",
             },
+            "max_age": {
+                "converter": commands.Range[int, 0, None],
+                "description": "Set the maximum age, in minutes, of the deleted and edited messages recorded in this guild. `0` to keep them until they are evicted from the cache.",
+            },
         }
         self.settings: Settings = Settings(
             bot=self.bot,
@@ -205,6 +426,58 @@ def __init__(self, bot: Red) -> None:
     async def cog_load(self) -> None:
         await super().cog_load()
         await self.settings.add_commands()
+        self.cache_max_entries = await self.config.cache_max_entries()
+        self.cache_max_size = await self.config.cache_max_size()
+        self.loops.append(
+            Loop(
+                cog=self,
+                name="Expire Sniped Messages",
+                function=self.expire_cache,
+                minutes=1,
+            )
+        )
+
+    def enforce_cache_budget(self) -> None:
+        """Evict the messages of the least recently used channels, across both caches."""
+        while (
+            self.deleted_messages.entries + self.edited_messages.entries > self.cache_max_entries
+            or self.deleted_messages.size + self.edited_messages.size
+            > self.cache_max_size * 1024**2
+        ):
+            caches = [
+                cache
+                for cache in (self.deleted_messages, self.edited_messages)
+                if cache.oldest_use() is not None
+            ]
+            if not caches:
+                break
+            min(caches, key=lambda cache: cache.oldest_use()).pop_oldest()
+
+    async def expire_cache(self) -> None:
+        max_ages = {
+            guild_id: data["max_age"] * 60
+            for guild_id, data in (await self.config.all_guilds()).items()
+            if data.get("max_age")
+        }
+        if not max_ages:
+            return
+        self.deleted_messages.expire(max_ages)
+        self.edited_messages.expire(max_ages)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        self.deleted_messages.remove_channel(channel.id)
+        self.edited_messages.remove_channel(channel.id)
+
+    @commands.Cog.listener()
+    async def on_raw_thread_delete(self, payload: discord.RawThreadDeleteEvent) -> None:
+        self.deleted_messages.remove_channel(payload.thread_id)
+        self.edited_messages.remove_channel(payload.thread_id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        self.deleted_messages.remove_guild(guild.id)
+        self.edited_messages.remove_guild(guild.id)
 
     @commands.Cog.listener()
     async def on_message_delete(self, message: discord.Message) -> None:
@@ -234,7 +507,8 @@ async def on_message_delete(self, message: discord.Message) -> None:
             )
         ):
             return
-        self.deleted_messages[message.channel].append(SnipedMessage(message=message))
+        self.deleted_messages.append(SnipedMessage(message=message))
+        self.enforce_cache_budget()
 
     @commands.Cog.listener()
     async def on_message_edit(self, before: discord.Message, after: discord.Message) -> None:
@@ -262,7 +536,8 @@ async def on_message_edit(self, before: discord.Message, after: discord.Message)
             and (_("Deleted Messages") in after.content or _("Edited Messages") in after.content)
         ):
             return
-        self.edited_messages[after.channel].append(SnipedMessage(message=before, after=after))
+        self.edited_messages.append(SnipedMessage(message=before, after=after))
+        self.enforce_cache_budget()
 
     @commands.guild_only()
     @commands.mod_or_permissions(manage_messages=True)
@@ -304,13 +579,13 @@ async def snipe_index(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.deleted_messages[channel]:
+        if not self.deleted_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No deleted message recorded in this channel.")
             )
         try:
-            embed = self.deleted_messages[channel][-(index + 1)].to_embed(
-                embed_color=await ctx.embed_color()
+            embed = self.deleted_messages[channel.id][-(index + 1)].to_embed(
+                guild=ctx.guild, embed_color=await ctx.embed_color()
             )
         except IndexError:
             raise commands.UserFeedbackCheckFailure(
@@ -342,13 +617,13 @@ async def snipe_bulk(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.deleted_messages[channel]:
+        if not self.deleted_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No deleted message recorded in this channel.")
             )
         embeds = [
-            deleted_message.to_embed(embed_color=await ctx.embed_color())
-            for deleted_message in self.deleted_messages[channel]
+            deleted_message.to_embed(guild=ctx.guild, embed_color=await ctx.embed_color())
+            for deleted_message in self.deleted_messages[channel.id]
         ]
         await Menu(pages=embeds, page_start=len(embeds) - 1).start(ctx)
 
@@ -378,14 +653,15 @@ async def snipe_member(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.deleted_messages[channel]:
+        if not self.deleted_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No deleted message recorded in this channel.")
             )
         embeds = [
-            deleted_message.to_embed(embed_color=await ctx.embed_color())
-            for deleted_message in self.deleted_messages[channel]
-            if deleted_message.author == member
+            deleted_message.to_embed(guild=ctx.guild, embed_color=await ctx.embed_color())
+            for deleted_message in self.deleted_messages.filter(
+                "author", member.id, channel_id=channel.id
+            )
         ]
         if not embeds:
             raise commands.UserFeedbackCheckFailure(
@@ -417,14 +693,13 @@ async def snipe_embeds(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.deleted_messages[channel]:
+        if not self.deleted_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No deleted message recorded in this channel.")
             )
         embeds = [
-            deleted_message.to_embed(embed_color=await ctx.embed_color())
-            for deleted_message in self.deleted_messages[channel]
-            if deleted_message.embeds
+            deleted_message.to_embed(guild=ctx.guild, embed_color=await ctx.embed_color())
+            for deleted_message in self.deleted_messages.filter("embeds", channel_id=channel.id)
         ]
         if not embeds:
             raise commands.UserFeedbackCheckFailure(
@@ -439,8 +714,10 @@ async def snipe_mentions(
         channel: typing.Optional[
             typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
         ],
+        *,
+        member: typing.Optional[typing.Union[discord.Member, discord.User]] = None,
     ) -> None:
-        """Bulk snipe deleted messages with roles/users mentions."""
+        """Bulk snipe deleted messages with roles/users mentions, optionally mentioning the specified member."""
         if channel is None:
             channel = ctx.channel
         ctx.message.channel = channel
@@ -456,14 +733,17 @@ async def snipe_mentions(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.deleted_messages[channel]:
+        if not self.deleted_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No deleted message recorded in this channel.")
             )
         embeds = [
-            deleted_message.to_embed(embed_color=await ctx.embed_color())
-            for deleted_message in self.deleted_messages[channel]
-            if deleted_message.mentions
+            deleted_message.to_embed(guild=ctx.guild, embed_color=await ctx.embed_color())
+            for deleted_message in self.deleted_messages.filter(
+                "mentions" if member is None else "mention",
+                getattr(member, "id", None),
+                channel_id=channel.id,
+            )
         ]
         if not embeds:
             raise commands.UserFeedbackCheckFailure(
@@ -478,8 +758,10 @@ async def snipe_rolesmentions(
         channel: typing.Optional[
             typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
         ],
+        *,
+        role: typing.Optional[discord.Role] = None,
     ) -> None:
-        """Bulk snipe deleted messages with roles mentions."""
+        """Bulk snipe deleted messages with roles mentions, optionally mentioning the specified role."""
         if channel is None:
             channel = ctx.channel
         ctx.message.channel = channel
@@ -495,14 +777,17 @@ async def snipe_rolesmentions(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.deleted_messages[channel]:
+        if not self.deleted_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No deleted message recorded in this channel.")
             )
         embeds = [
-            deleted_message.to_embed(embed_color=await ctx.embed_color())
-            for deleted_message in self.deleted_messages[channel]
-            if deleted_message.role_mentions
+            deleted_message.to_embed(guild=ctx.guild, embed_color=await ctx.embed_color())
+            for deleted_message in self.deleted_messages.filter(
+                "role_mentions" if role is None else "role_mention",
+                getattr(role, "id", None),
+                channel_id=channel.id,
+            )
         ]
         if not embeds:
             raise commands.UserFeedbackCheckFailure(
@@ -517,8 +802,10 @@ async def snipe_membersmentions(
         channel: typing.Optional[
             typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
         ],
+        *,
+        member: typing.Optional[typing.Union[discord.Member, discord.User]] = None,
     ) -> None:
-        """Bulk snipe deleted messages with members mentions."""
+        """Bulk snipe deleted messages with members mentions, optionally mentioning the specified member."""
         if channel is None:
             channel = ctx.channel
         ctx.message.channel = channel
@@ -534,14 +821,17 @@ async def snipe_membersmentions(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.deleted_messages[channel]:
+        if not self.deleted_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No deleted message recorded in this channel.")
             )
         embeds = [
-            deleted_message.to_embed(embed_color=await ctx.embed_color())
-            for deleted_message in self.deleted_messages[channel]
-            if deleted_message.member_mentions
+            deleted_message.to_embed(guild=ctx.guild, embed_color=await ctx.embed_color())
+            for deleted_message in self.deleted_messages.filter(
+                "mentions" if member is None else "mention",
+                getattr(member, "id", None),
+                channel_id=channel.id,
+            )
         ]
         if not embeds:
             raise commands.UserFeedbackCheckFailure(
@@ -575,21 +865,20 @@ async def snipe_list(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.deleted_messages[channel]:
+        if not self.deleted_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No deleted message recorded in this channel.")
             )
         content = "\n\n".join(
             [
-                f"**{i}.** Deleted <t:{int(deleted_message.deleted_at.timestamp())}:R> - {deleted_message.author.mention} ({deleted_message.author.id}): {deleted_message.content}"
+                f"**{i}.** Deleted <t:{int(deleted_message.deleted_at.timestamp())}:R> - {deleted_message.author_mention} ({deleted_message.author_id}): {deleted_message.content}"
                 for i, deleted_message in enumerate(
                     sorted(
                         [
                             deleted_message
-                            for deleted_message in self.deleted_messages[channel]
-                            if deleted_message.content
-                            and member is None
-                            or deleted_message.author == member
+                            for deleted_message in self.deleted_messages[channel.id]
+                            if (member is None and deleted_message.content)
+                            or (member is not None and deleted_message.author_id == member.id)
                         ],
                         key=lambda message: message.deleted_at,
                     ),
@@ -613,6 +902,73 @@ async def snipe_list(
             embeds.append(e)
         await Menu(pages=embeds, page_start=-1).start(ctx)
 
+    @snipe.command(name="guild", aliases=["server"])
+    async def snipe_guild(
+        self,
+        ctx: commands.Context,
+        *,
+        member: typing.Optional[typing.Union[discord.Member, discord.User]] = None,
+    ) -> None:
+        """Bulk snipe deleted messages in all the channels of this guild, optionally for the specified member."""
+        embeds = await self.get_guild_embeds(ctx, cache=self.deleted_messages, member=member)
+        if not embeds:
+            raise commands.UserFeedbackCheckFailure(
+                _("No deleted message recorded in this guild.")
+            )
+        await Menu(pages=embeds, page_start=len(embeds) - 1).start(ctx)
+
+    @snipe.command(name="guildmentions", aliases=["servermentions"])
+    async def snipe_guildmentions(
+        self,
+        ctx: commands.Context,
+        *,
+        mentioned: typing.Union[discord.Member, discord.User, discord.Role],
+    ) -> None:
+        """Bulk snipe deleted messages mentioning the specified member or role in all the channels of this guild."""
+        embeds = await self.get_guild_embeds(ctx, cache=self.deleted_messages, mentioned=mentioned)
+        if not embeds:
+            raise commands.UserFeedbackCheckFailure(
+                _("No deleted message mentioning this member or role recorded in this guild.")
+            )
+        await Menu(pages=embeds, page_start=len(embeds) - 1).start(ctx)
+
+    async def get_guild_embeds(
+        self,
+        ctx: commands.Context,
+        cache: SnipeCache,
+        member: typing.Optional[typing.Union[discord.Member, discord.User]] = None,
+        mentioned: typing.Optional[
+            typing.Union[discord.Member, discord.User, discord.Role]
+        ] = None,
+    ) -> typing.List[discord.Embed]:
+        if member is not None:
+            sniped_messages = cache.filter("author", member.id, guild_id=ctx.guild.id)
+        elif mentioned is not None:
+            sniped_messages = cache.filter(
+                "role_mention" if isinstance(mentioned, discord.Role) else "mention",
+                mentioned.id,
+                guild_id=ctx.guild.id,
+            )
+        else:
+            sniped_messages = cache.guild_messages(ctx.guild.id)
+        ignored_channels = await self.config.guild(ctx.guild).ignored_channels()
+        is_mod = await self.bot.is_mod(ctx.author)
+        allowed_channels: typing.Dict[int, bool] = {}
+        embed_color = await ctx.embed_color()
+        embeds = []
+        for sniped_message in sniped_messages:
+            if sniped_message.channel_id not in allowed_channels:
+                channel = ctx.guild.get_channel_or_thread(sniped_message.channel_id)
+                allowed_channels[sniped_message.channel_id] = (
+                    channel is not None
+                    and getattr(channel, "parent", channel).id not in ignored_channels
+                    and channel.permissions_for(ctx.author).view_channel
+                    and (is_mod or channel.permissions_for(ctx.author).manage_messages)
+                )
+            if allowed_channels[sniped_message.channel_id]:
+                embeds.append(sniped_message.to_embed(guild=ctx.guild, embed_color=embed_color))
+        return embeds
+
     @commands.guild_only()
     @commands.mod_or_permissions(manage_messages=True)
     @commands.bot_has_permissions(embed_links=True)
@@ -653,13 +1009,13 @@ async def esnipe_index(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.edited_messages[channel]:
+        if not self.edited_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No edited message recorded in this channel.")
             )
         try:
-            embed = self.edited_messages[channel][-(index + 1)].to_embed(
-                embed_color=await ctx.embed_color()
+            embed = self.edited_messages[channel.id][-(index + 1)].to_embed(
+                guild=ctx.guild, embed_color=await ctx.embed_color()
             )
         except IndexError:
             raise commands.UserFeedbackCheckFailure(
@@ -691,13 +1047,13 @@ async def esnipe_bulk(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.deleted_messages[channel]:
+        if not self.deleted_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No edited message recorded in this channel.")
             )
         embeds = [
-            edited_message.to_embed(embed_color=await ctx.embed_color())
-            for edited_message in self.edited_messages[channel]
+            edited_message.to_embed(guild=ctx.guild, embed_color=await ctx.embed_color())
+            for edited_message in self.edited_messages[channel.id]
         ]
         await Menu(pages=embeds, page_start=len(embeds) - 1).start(ctx)
 
@@ -727,14 +1083,15 @@ async def esnipe_member(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.edited_messages[channel]:
+        if not self.edited_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No edited message recorded in this channel.")
             )
         embeds = [
-            edited_message.to_embed(embed_color=await ctx.embed_color())
-            for edited_message in self.edited_messages[channel]
-            if edited_message.author == member
+            edited_message.to_embed(guild=ctx.guild, embed_color=await ctx.embed_color())
+            for edited_message in self.edited_messages.filter(
+                "author", member.id, channel_id=channel.id
+            )
         ]
         if not embeds:
             raise commands.UserFeedbackCheckFailure(
@@ -766,14 +1123,13 @@ async def esnipe_embeds(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.edited_messages[channel]:
+        if not self.edited_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No edited message recorded in this channel.")
             )
         embeds = [
-            edited_message.to_embed(embed_color=await ctx.embed_color())
-            for edited_message in self.edited_messages[channel]
-            if edited_message.embeds
+            edited_message.to_embed(guild=ctx.guild, embed_color=await ctx.embed_color())
+            for edited_message in self.edited_messages.filter("embeds", channel_id=channel.id)
         ]
         if not embeds:
             raise commands.UserFeedbackCheckFailure(
@@ -788,8 +1144,10 @@ async def esnipe_mentions(
         channel: typing.Optional[
             typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
         ],
+        *,
+        member: typing.Optional[typing.Union[discord.Member, discord.User]] = None,
     ) -> None:
-        """Bulk snipe edited messages with roles/users mentions."""
+        """Bulk snipe edited messages with roles/users mentions, optionally mentioning the specified member."""
         if channel is None:
             channel = ctx.channel
         ctx.message.channel = channel
@@ -805,14 +1163,17 @@ async def esnipe_mentions(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.edited_messages[channel]:
+        if not self.edited_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No edited message recorded in this channel.")
             )
         embeds = [
-            edited_message.to_embed(embed_color=await ctx.embed_color())
-            for edited_message in self.edited_messages[channel]
-            if edited_message.mentions
+            edited_message.to_embed(guild=ctx.guild, embed_color=await ctx.embed_color())
+            for edited_message in self.edited_messages.filter(
+                "mentions" if member is None else "mention",
+                getattr(member, "id", None),
+                channel_id=channel.id,
+            )
         ]
         if not embeds:
             raise commands.UserFeedbackCheckFailure(
@@ -827,8 +1188,10 @@ async def esnipe_rolesmentions(
         channel: typing.Optional[
             typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
         ],
+        *,
+        role: typing.Optional[discord.Role] = None,
     ) -> None:
-        """Bulk snipe edited messages with roles mentions."""
+        """Bulk snipe edited messages with roles mentions, optionally mentioning the specified role."""
         if channel is None:
             channel = ctx.channel
         ctx.message.channel = channel
@@ -844,14 +1207,17 @@ async def esnipe_rolesmentions(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.edited_messages[channel]:
+        if not self.edited_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No edited message recorded in this channel.")
             )
         embeds = [
-            edited_message.to_embed(embed_color=await ctx.embed_color())
-            for edited_message in self.edited_messages[channel]
-            if edited_message.role_mentions
+            edited_message.to_embed(guild=ctx.guild, embed_color=await ctx.embed_color())
+            for edited_message in self.edited_messages.filter(
+                "role_mentions" if role is None else "role_mention",
+                getattr(role, "id", None),
+                channel_id=channel.id,
+            )
         ]
         if not embeds:
             raise commands.UserFeedbackCheckFailure(
@@ -866,8 +1232,10 @@ async def esnipe_membersmentions(
         channel: typing.Optional[
             typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
         ],
+        *,
+        member: typing.Optional[typing.Union[discord.Member, discord.User]] = None,
     ) -> None:
-        """Bulk snipe edited messages with members mentions."""
+        """Bulk snipe edited messages with members mentions, optionally mentioning the specified member."""
         if channel is None:
             channel = ctx.channel
         ctx.message.channel = channel
@@ -883,14 +1251,17 @@ async def esnipe_membersmentions(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.edited_messages[channel]:
+        if not self.edited_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No edited message recorded in this channel.")
             )
         embeds = [
-            edited_message.to_embed(embed_color=await ctx.embed_color())
-            for edited_message in self.edited_messages[channel]
-            if edited_message.member_mentions
+            edited_message.to_embed(guild=ctx.guild, embed_color=await ctx.embed_color())
+            for edited_message in self.edited_messages.filter(
+                "mentions" if member is None else "mention",
+                getattr(member, "id", None),
+                channel_id=channel.id,
+            )
         ]
         if not embeds:
             raise commands.UserFeedbackCheckFailure(
@@ -924,21 +1295,20 @@ async def esnipe_list(
             in await self.config.guild(ctx.guild).ignored_channels()
         ):
             raise commands.UserFeedbackCheckFailure(_("This channel is in the ignored list."))
-        if not self.edited_messages[channel]:
+        if not self.edited_messages[channel.id]:
             raise commands.UserFeedbackCheckFailure(
                 _("No edited message recorded in this channel.")
             )
         content = "\n\n".join(
             [
-                f"**{i}.** Edited <t:{int(edited_message.deleted_at.timestamp())}:R> - {edited_message.author.mention} ({edited_message.author.id}): {edited_message.content}"
+                f"**{i}.** Edited <t:{int(edited_message.deleted_at.timestamp())}:R> - {edited_message.author_mention} ({edited_message.author_id}): {edited_message.content}"
                 for i, edited_message in enumerate(
                     sorted(
                         [
                             edited_message
-                            for edited_message in self.edited_messages[channel]
-                            if edited_message.content
-                            and member is None
-                            or edited_message.author == member
+                            for edited_message in self.edited_messages[channel.id]
+                            if (member is None and edited_message.content)
+                            or (member is not None and edited_message.author_id == member.id)
                         ],
                         key=lambda message: message.deleted_at,
                     ),
@@ -962,6 +1332,34 @@ async def esnipe_list(
             embeds.append(e)
         await Menu(pages=embeds, page_start=-1).start(ctx)
 
+    @esnipe.command(name="guild", aliases=["server"])
+    async def esnipe_guild(
+        self,
+        ctx: commands.Context,
+        *,
+        member: typing.Optional[typing.Union[discord.Member, discord.User]] = None,
+    ) -> None:
+        """Bulk snipe edited messages in all the channels of this guild, optionally for the specified member."""
+        embeds = await self.get_guild_embeds(ctx, cache=self.edited_messages, member=member)
+        if not embeds:
+            raise commands.UserFeedbackCheckFailure(_("No edited message recorded in this guild."))
+        await Menu(pages=embeds, page_start=len(embeds) - 1).start(ctx)
+
+    @esnipe.command(name="guildmentions", aliases=["servermentions"])
+    async def esnipe_guildmentions(
+        self,
+        ctx: commands.Context,
+        *,
+        mentioned: typing.Union[discord.Member, discord.User, discord.Role],
+    ) -> None:
+        """Bulk snipe edited messages mentioning the specified member or role in all the channels of this guild."""
+        embeds = await self.get_guild_embeds(ctx, cache=self.edited_messages, mentioned=mentioned)
+        if not embeds:
+            raise commands.UserFeedbackCheckFailure(
+                _("No edited message mentioning this member or role recorded in this guild.")
+            )
+        await Menu(pages=embeds, page_start=len(embeds) - 1).start(ctx)
+
     @commands.guild_only()
     @commands.admin_or_permissions(manage_guild=True)
     @commands.hybrid_group()
@@ -969,12 +1367,34 @@ async def setsnipe(self, ctx: commands.Context) -> None:
         """Commands to configure Snipe."""
         pass
 
+    @commands.is_owner()
+    @setsnipe.command()
+    async def cachebudget(
+        self,
+        ctx: commands.Context,
+        max_entries: commands.Range[int, 100, None],
+        max_size: commands.Range[int, 1, None],
+    ) -> None:
+        """Set the global budget of the Snipe cache.
+
+        Arguments:
+        - `max_entries`: The maximum number of recorded deleted and edited messages, across all channels.
+        - `max_size`: The maximum estimated size of the recorded messages, in MiB.
+
+        When the budget is exceeded, the oldest messages of the least recently used channels are evicted.
+        """
+        await self.config.cache_max_entries.set(max_entries)
+        await self.config.cache_max_size.set(max_size)
+        self.cache_max_entries = max_entries
+        self.cache_max_size = max_size
+        self.enforce_cache_budget()
+
     @commands.is_owner()
     @setsnipe.command()
     async def stats(self, ctx: commands.Context) -> None:
         """Show stats about Snipe cache."""
-        deleted_messages_cache_size = recursive_getsizeof(self.deleted_messages)
-        edited_messages_cache_size = recursive_getsizeof(self.edited_messages)
+        deleted_messages_cache_size = self.deleted_messages.size
+        edited_messages_cache_size = self.edited_messages.size
         embed: discord.Embed = discord.Embed(title=_("Snipe Stats"), color=await ctx.embed_color())
         embed.add_field(
             name=_("Deleted Messages Cache Size:"),
@@ -987,20 +1407,19 @@ async def stats(self, ctx: commands.Context) -> None:
         )
         embed.add_field(
             name=_("Total Cache Size:"),
-            value=f"`{sizeof_fmt(deleted_messages_cache_size + edited_messages_cache_size)}`",
+            value=f"`{sizeof_fmt(deleted_messages_cache_size + edited_messages_cache_size)}` / `{sizeof_fmt(self.cache_max_size * 1024**2)}`",
             inline=True,
         )
         embed.add_field(
             name=_("Cache Entries:"),
             value=_(
-                "**Deleted Messages:** `{len_deleted_messages}`\n**Edited Messages:** `{len_edited_messages}`"
+                "**Deleted Messages:** `{len_deleted_messages}` (`{channels_deleted_messages}` channels)\n**Edited Messages:** `{len_edited_messages}` (`{channels_edited_messages}` channels)\n**Budget:** `{max_entries}`"
             ).format(
-                len_deleted_messages=sum(
-                    len(deleted_messages) for deleted_messages in self.deleted_messages.values()
-                ),
-                len_edited_messages=sum(
-                    len(edited_messages) for edited_messages in self.edited_messages.values()
-                ),
+                len_deleted_messages=len(self.deleted_messages),
+                channels_deleted_messages=len(self.deleted_messages.channels),
+                len_edited_messages=len(self.edited_messages),
+                channels_edited_messages=len(self.edited_messages.channels),
+                max_entries=self.cache_max_entries,
             ),
             inline=False,
         )
@@ -1,4 +1,4 @@
-from AAA3A_utils import Cog, Loop, Menu, Settings, CogsUtils  # isort:skip
+from AAA3A_utils import Cog, Menu, Settings, CogsUtils  # isort:skip
 from redbot.core import commands, Config, modlog  # isort:skip
 from redbot.core.bot import Red  # isort:skip
 from redbot.core.i18n import Translator, cog_i18n  # isort:skip
@@ -8,7 +8,8 @@
 from redbot.core.utils.chat_formatting import humanize_list, pagify
 
 import asyncio
-import datetime
+import heapq
+import time
 
 from .converters import ProfileConverter, ForumTagConverter, Emoji, MyMessageConverter, ModalConverter
 from .dashboard_integration import DashboardIntegration
@@ -65,6 +66,7 @@ def __init__(self, bot: Red) -> None:
                 "close_reopen_reason_modal": True,
                 "create_modlog_case": False,
                 "transcripts": True,
+                "transcripts_archive_attachments": False,
                 "always_include_item_label": False,
                 # Roles.
                 "support_roles": [],
@@ -110,6 +112,13 @@ def __init__(self, bot: Red) -> None:
         )
 
         self.tickets: typing.Dict[int, typing.Dict[int, Tickets]] = {}
+        # The closed tickets to delete automatically: (deletion timestamp, guild id, ticket id).
+        self.scheduled_deletions: typing.List[typing.Tuple[int, int, int]] = []
+        self.scheduled_deletions_changed: asyncio.Event = asyncio.Event()
+        self.scheduled_deletions_task: typing.Optional[asyncio.Task] = None
+        # The transcripts are generated in the background by a few workers: (ticket, channel, messages, callback).
+        self.transcripts_queue: asyncio.Queue = asyncio.Queue()
+        self.transcripts_workers: typing.List[asyncio.Task] = []
 
         _settings: typing.Dict[str, typing.Dict[str, typing.Any]] = {
             "enabled": {
@@ -149,6 +158,11 @@ def __init__(self, bot: Red) -> None:
                 "description": "Whether a transcript will be created when a ticket is deleted.",
                 "no_slash": True,
             },
+            "transcripts_archive_attachments": {
+                "converter": bool,
+                "description": "Whether the attachments will be archived by the bot and sent with the transcripts in a ZIP file, instead of linking their Discord URLs, which expire.",
+                "no_slash": True,
+            },
             "always_include_item_label": {
                 "converter": bool,
                 "description": "Whether the item label will always be included in the embeds.",
@@ -362,22 +376,42 @@ async def cog_load(self) -> None:
             
         )
         await self.settings.add_commands()
+        self.transcripts_workers = [asyncio.create_task(self.transcripts_worker()) for __ in range(2)]
         asyncio.create_task(self.load_tickets())
 
     async def cog_unload(self) -> None:
+        if self.scheduled_deletions_task is not None:
+            self.scheduled_deletions_task.cancel()
+        for task in self.transcripts_workers:
+            task.cancel()
         await super().cog_unload()
 
-    async def load_tickets(self) -> None:
+    async def load_tickets(self, batch_size: int = 100) -> None:
         await self.bot.wait_until_red_ready()
-        for guild_id, guild_data in (await self.config.all_guilds()).items():
+        start = time.monotonic()
+        all_guilds = await self.config.all_guilds()
+        # All the tickets are loaded first, so the commands can use them during the views loading.
+        for guild_id, guild_data in all_guilds.items():
             for ticket_id, ticket_data in guild_data["tickets"].items():
                 ticket = Ticket(bot=self.bot, cog=self, **ticket_data)
                 self.tickets.setdefault(guild_id, {})[int(ticket_id)] = ticket
+        # The views are loaded by batches, with the profiles already loaded instead of reading them
+        # from Config for each ticket, and the event loop is released between the batches.
+        count = 0
+        for guild_id, tickets in self.tickets.copy().items():
+            profiles = all_guilds[guild_id]["profiles"]
+            for ticket in list(tickets.values()):
+                if (message := ticket.message) is None or ticket.profile not in profiles:
+                    continue  # The ticket will be removed by the maintenance.
                 view: TicketView = TicketView(cog=self, ticket=ticket)
-                view._message = ticket.message
-                await view._update()
-                self.bot.add_view(view, message_id=ticket.message.id)
-                self.views[ticket.message] = view
+                view._message = message
+                await view._update(config=profiles[ticket.profile])
+                self.bot.add_view(view, message_id=message.id)
+                self.views[message] = view
+                count += 1
+                if count % batch_size == 0:
+                    await asyncio.sleep(0)
+        for guild_id, guild_data in all_guilds.items():
             for message, components in guild_data["buttons_dropdowns"].items():
                 channel = self.bot.get_channel(int((str(message).split("-"))[0]))
                 if channel is None:
@@ -392,48 +426,148 @@ async def load_tickets(self) -> None:
         view: ClosedTicketControls = ClosedTicketControls(cog=self)
         self.bot.add_view(view)
         self.views["ClosedTicketControls"] = view
-        self.loops.append(
-            Loop(
-                cog=self,
-                name="Check Tickets",
-                function=self.check_tickets,
-                minutes=1,
-            )
-        )
+        self.logger.debug(f"{count} tickets views loaded in {time.monotonic() - start:.2f}s.")
+        # The changes made while the bot was offline are checked once, then the listeners and the
+        # scheduled deletions take over.
+        self.scheduled_deletions_task = asyncio.create_task(self.run_scheduled_deletions())
+        await self.check_tickets()
 
-    async def check_tickets(self) -> None:
-        for guild_id, tickets in self.tickets.copy().items():
-            profiles = await self.config.guild_from_id(guild_id).profiles()
-            for ticket_id, ticket in tickets.copy().items():
-                if ticket.guild is None:
-                    try:
-                        await self.bot.fetch_guild(guild_id)
-                    except discord.NotFound:
-                        await ticket.delete()
-                    continue
-                if ticket.channel is None:
-                    try:
-                        await ticket.guild.fetch_channel(ticket.channel_id)
-                    except discord.NotFound:
-                        await ticket.delete()
-                    continue
-                if ticket.profile not in profiles:
-                    await ticket.delete()
-                    continue
-                config = profiles[ticket.profile]
-                if ticket.owner is None:
-                    try:
-                        await ticket.guild.fetch_member(ticket.host_id)
-                    except discord.NotFound:
-                        if config["close_on_leave"]:
-                            await ticket.close()
-                    continue
-                if (
-                    ticket.is_closed
-                    and config["auto_delete_on_close"] is not None
-                    and datetime.datetime.now(tz=datetime.timezone.utc) - ticket.closed_at > datetime.timedelta(hours=config["auto_delete_on_close"])
-                ):
-                    await ticket.delete_action()
+    def queue_transcript(
+        self,
+        ticket: Ticket,
+        callback: typing.Callable[[typing.Optional[discord.File]], typing.Awaitable[None]],
+        channel: typing.Optional[typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]] = None,
+        messages: typing.Optional[typing.List[discord.Message]] = None,
+    ) -> None:
+        self.transcripts_queue.put_nowait((ticket, channel, messages, callback))
+
+    async def transcripts_worker(self) -> None:
+        while True:
+            ticket, channel, messages, callback = await self.transcripts_queue.get()
+            # Nothing must stop the worker, or the next transcripts would never be sent.
+            try:
+                try:
+                    transcript = await ticket.export(channel=channel, messages=messages)
+                except Exception as e:
+                    self.logger.error(f"Error when generating the transcript of the ticket #{ticket.id} in the guild {ticket.guild_id}.", exc_info=e)
+                    transcript = None
+                await callback(transcript)
+            except Exception as e:
+                self.logger.error(f"Error when sending the transcript of the ticket #{ticket.id} in the guild {ticket.guild_id}.", exc_info=e)
+            finally:
+                self.transcripts_queue.task_done()
+
+    async def check_tickets(self, guild_id: typing.Optional[int] = None) -> None:
+        for _guild_id, tickets in self.tickets.copy().items():
+            if guild_id is not None and _guild_id != guild_id:
+                continue
+            if (guild := self.bot.get_guild(_guild_id)) is None:
+                continue  # Handled by `on_guild_remove`, or unavailable.
+            profiles = await self.config.guild(guild).profiles()
+            for ticket in list(tickets.values()):
+                try:
+                    await self.check_ticket(ticket, profiles=profiles)
+                except Exception as e:
+                    self.logger.error(f"Error when checking the ticket #{ticket.id} in the guild {_guild_id}.", exc_info=e)
+
+    async def check_ticket(self, ticket: Ticket, profiles: typing.Dict[str, typing.Dict[str, typing.Any]]) -> None:
+        if ticket.profile not in profiles:
+            await ticket.delete()
+            return
+        if ticket.channel is None:
+            try:
+                await ticket.guild.fetch_channel(ticket.channel_id)
+            except discord.NotFound:
+                await ticket.delete()
+            return
+        if ticket.is_closed:
+            self.schedule_ticket_deletion(ticket, config=profiles[ticket.profile])
+        elif ticket.owner is None and profiles[ticket.profile]["close_on_leave"]:
+            try:
+                await ticket.guild.fetch_member(ticket.owner_id)
+            except discord.NotFound:
+                await ticket.close()
+
+    def schedule_ticket_deletion(self, ticket: Ticket, config: typing.Dict[str, typing.Any]) -> None:
+        if not ticket.is_closed or config["auto_delete_on_close"] is None:
+            return
+        entry = (ticket.closed_at_timestamp + config["auto_delete_on_close"] * 3600, ticket.guild_id, ticket.id)
+        if entry in self.scheduled_deletions:
+            return
+        heapq.heappush(self.scheduled_deletions, entry)
+        self.scheduled_deletions_changed.set()
+
+    async def run_scheduled_deletions(self) -> None:
+        """Delete the closed tickets on time, sleeping until the next scheduled deletion.
+
+        The entries aren't removed when a ticket is reopened or when the setting changes: they are
+        checked against the current ticket and config when they are due, and skipped if outdated.
+        """
+        while True:
+            self.scheduled_deletions_changed.clear()
+            if not self.scheduled_deletions:
+                await self.scheduled_deletions_changed.wait()
+                continue
+            timestamp, guild_id, ticket_id = self.scheduled_deletions[0]
+            if (delay := timestamp - time.time()) > 0:
+                try:
+                    await asyncio.wait_for(self.scheduled_deletions_changed.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            heapq.heappop(self.scheduled_deletions)
+            if (
+                (ticket := self.tickets.get(guild_id, {}).get(ticket_id)) is None
+                or not ticket.is_closed
+                or ticket.guild is None
+                or ticket.channel is None
+            ):
+                continue
+            config = await self.config.guild(ticket.guild).profiles.get_raw(ticket.profile, default=None)
+            if (
+                config is None
+                or config["auto_delete_on_close"] is None
+                or ticket.closed_at_timestamp + config["auto_delete_on_close"] * 3600 != timestamp
+            ):
+                continue
+            try:
+                await ticket.delete_channel()
+            except Exception as e:
+                self.logger.error(f"Error when deleting automatically the ticket {ticket_id} in the guild {guild_id}.", exc_info=e)
+
+    @commands.Cog.listener()
+    async def on_ticket_closed(self, ticket: Ticket) -> None:
+        config = await self.config.guild(ticket.guild).profiles.get_raw(ticket.profile)
+        self.schedule_ticket_deletion(ticket, config=config)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild) -> None:
+        for ticket in list(self.tickets.get(guild.id, {}).values()):
+            await ticket.delete()
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        if (ticket := discord.utils.get(self.tickets.get(channel.guild.id, {}).values(), channel_id=channel.id)) is not None:
+            await ticket.delete()
+
+    @commands.Cog.listener()
+    async def on_thread_delete(self, thread: discord.Thread) -> None:
+        await self.on_guild_channel_delete(thread)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member) -> None:
+        for ticket in list(self.tickets.get(member.guild.id, {}).values()):
+            if ticket.owner_id != member.id or ticket.is_closed:
+                continue
+            config = await self.config.guild(member.guild).profiles.get_raw(ticket.profile, default=None)
+            if config is not None and config["close_on_leave"]:
+                await ticket.close()
+
+    @commands.Cog.listener()
+    async def on_command_completion(self, ctx: commands.Context) -> None:
+        # A profile may have been deleted, or its `auto_delete_on_close` setting changed.
+        if ctx.guild is not None and ctx.cog is self and ctx.command.root_parent == self.settickets:
+            await self.check_tickets(ctx.guild.id)
 
     def is_support(ignore_owner=False):
         async def predicate(ctx: typing.Union[commands.Context, discord.Interaction]) -> bool:
@@ -676,6 +810,7 @@ async def settings(self, ctx: commands.Context, profile: str = None) -> None:
                     "**•** Close/Reopen Reason Modal: {close_reopen_reason_modal}\n"
                     "**•** Create Modlog Case: {create_modlog_case}\n"
                     "**•** Transcripts: {transcripts}\n"
+                    "**•** Transcripts Archive Attachments: {transcripts_archive_attachments}\n"
                     "**•** Always Include Item Label: {always_include_item_label}\n\n"
                     "**•** Support Roles: {support_roles}\n"
                     "**•** Ping Roles: {ping_roles}\n"
@@ -711,6 +846,7 @@ async def settings(self, ctx: commands.Context, profile: str = None) -> None:
                     close_reopen_reason_modal=config["close_reopen_reason_modal"],
                     create_modlog_case=config["create_modlog_case"],
                     transcripts=config["transcripts"],
+                    transcripts_archive_attachments=config["transcripts_archive_attachments"],
                     always_include_item_label=config["always_include_item_label"],
                     support_roles=humanize_list([role.mention for role_id in config["support_roles"] if (role := ctx.guild.get_role(role_id)) is not None]) or "...",
                     ping_roles=humanize_list([role.mention for role_id in config["ping_roles"] if (role := ctx.guild.get_role(role_id)) is not None]) or "...",
@@ -947,20 +1083,29 @@ async def export(self, ctx: commands.Context, ticket: typing.Optional[TicketConv
             and (ticket := discord.utils.get(self.tickets.get(ctx.guild.id, {}).values(), channel=ctx.channel)) is None
         ):
             raise commands.UserFeedbackCheckFailure(_("No ticket found."))
-        transcript = await ticket.export()
-        message = await ctx.send(
-            _("📜 Here is the transcript of this ticket!"),
-            file=transcript,
-        )
-        view: discord.ui.View = discord.ui.View()
-        view.add_item(
-            discord.ui.Button(
-                label=_("View Transcript"),
-                style=discord.ButtonStyle.link,
-                url=f"https://mahto.id/chat-exporter?url={message.attachments[0].url}",
+
+        async def send_transcript(transcript: typing.Optional[discord.File]) -> None:
+            if transcript is None:
+                await ctx.send(_("An error occurred while generating the transcript of this ticket."))
+                return
+            message = await ctx.send(
+                _("📜 Here is the transcript of this ticket!"),
+                file=transcript,
             )
-        )
-        await message.edit(view=view)
+            if not transcript.filename.endswith(".html"):
+                return  # The ZIP bundles can't be viewed online.
+            view: discord.ui.View = discord.ui.View()
+            view.add_item(
+                discord.ui.Button(
+                    label=_("View Transcript"),
+                    style=discord.ButtonStyle.link,
+                    url=f"https://mahto.id/chat-exporter?url={message.attachments[0].url}",
+                )
+            )
+            await message.edit(view=view)
+
+        await ctx.send(_("📜 The transcript of this ticket is being generated..."))
+        self.queue_transcript(ticket, callback=send_transcript)
 
     @is_support(ignore_owner=True)
     async def delete(self, ctx: commands.Context, ticket: typing.Optional[TicketConverter] = None) -> None:
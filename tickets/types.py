@@ -6,10 +6,14 @@
 
 from redbot.core.utils.chat_formatting import humanize_list, bold
 
+import asyncio
 import chat_exporter
 import copy
 import datetime
-import io
+import hashlib
+import pathlib
+import tempfile
+import zipfile
 
 from dataclasses import dataclass, field, _is_dataclass_instance, fields
 
@@ -37,6 +41,23 @@ def _asdict_inner(obj, dict_factory=dict):
         return copy.deepcopy(obj)
 
 
+def _write_transcript(
+    html: str,
+    html_filename: str,
+    files: typing.Dict[str, pathlib.Path],
+) -> typing.IO[bytes]:
+    fp = tempfile.TemporaryFile()
+    if not files:
+        fp.write(html.encode())
+    else:
+        with zipfile.ZipFile(fp, mode="w", compression=zipfile.ZIP_DEFLATED) as bundle:
+            bundle.writestr(html_filename, html)
+            for name, path in files.items():
+                bundle.write(path, arcname=name)
+    fp.seek(0)
+    return fp
+
+
 @dataclass
 class Ticket:
     bot: Red
@@ -86,8 +107,15 @@ async def delete(self) -> None:
         else:
             if not self.cog.tickets[self.guild_id]:
                 del self.cog.tickets[self.guild_id]
-        await self.cog.config.guild(self.guild).tickets.clear_raw(str(self.id))
-        self.cog.views.pop(self.message).stop()
+        await self.cog.config.guild_from_id(self.guild_id).tickets.clear_raw(str(self.id))
+        # The view is found by message id, because the channel (and so `self.message`) may be already deleted.
+        if self.message_id is not None and (
+            message := next(
+                (message for message, view in self.cog.views.items() if isinstance(view, TicketView) and getattr(message, "id", None) == self.message_id),
+                None,
+            )
+        ) is not None:
+            self.cog.views.pop(message).stop()
 
     @property
     def guild(self) -> discord.Guild:
@@ -1015,7 +1043,19 @@ async def log_action(
             )
         await self.channel.send(embed=embed)
 
-    async def export(self) -> discord.File:
+    async def export(
+        self,
+        channel: typing.Optional[typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]] = None,
+        messages: typing.Optional[typing.List[discord.Message]] = None,
+        archive_attachments: typing.Optional[bool] = None,
+    ) -> discord.File:
+        if channel is None:
+            channel = self.channel
+        if messages is None:
+            messages = [message async for message in channel.history(limit=None, oldest_first=True)]
+        if archive_attachments is None:
+            archive_attachments = await self.cog.config.guild(self.guild).profiles.get_raw(self.profile, "transcripts_archive_attachments", default=False)
+
         class Transcript(chat_exporter.construct.transcript.TranscriptDAO):
             @classmethod
             async def export(
@@ -1058,17 +1098,53 @@ async def process_asset(self, attachment: discord.Attachment) -> discord.Attachm
                 # attachment.proxy_url = attachment.url
                 return attachment
 
-        transcript = await Transcript.export(
-            channel=self.channel,
-            messages=[message async for message in self.channel.history(limit=None, oldest_first=True)],
-            tz_info="UTC",
-            guild=self.guild,
-            bot=self.bot,
-            attachment_handler=AttachmentHandler(),
-        )
+        class ArchiveAttachmentHandler(chat_exporter.AttachmentHandler):
+            def __init__(self, path: pathlib.Path) -> None:
+                self.path: pathlib.Path = path
+                self.files: typing.Dict[str, pathlib.Path] = {}
+                self.urls: typing.Dict[str, str] = {}
+
+            async def process_asset(self, attachment: discord.Attachment) -> discord.Attachment:
+                try:
+                    data = await attachment.read()
+                except discord.HTTPException:
+                    return attachment  # The remote URL is kept.
+                # The attachments are stored by content, so a file sent several times is only bundled once.
+                digest = hashlib.sha256(data).hexdigest()
+                path = self.path / digest
+                if not path.exists():
+                    await asyncio.to_thread(path.write_bytes, data)
+                name = f"attachments/{digest}{pathlib.PurePath(attachment.filename).suffix}"
+                self.files[name] = path
+                self.urls[name] = attachment.url
+                attachment.url = attachment.proxy_url = name
+                return attachment
+
+        # The attachments are only kept on the disk for the time of the export, in a directory removed once the bundle is written.
+        with tempfile.TemporaryDirectory() as directory:
+            attachment_handler = ArchiveAttachmentHandler(pathlib.Path(directory)) if archive_attachments else AttachmentHandler()
+            transcript = await Transcript.export(
+                channel=channel,
+                messages=messages,
+                tz_info="UTC",
+                guild=self.guild,
+                bot=self.bot,
+                attachment_handler=attachment_handler,
+            )
+            filename = f"ticket-{self.id}-{getattr(self.owner, 'name', self.owner_id)}"
+            files = attachment_handler.files if archive_attachments else {}
+            fp = await asyncio.to_thread(_write_transcript, transcript, f"{filename}.html", files)
+        if files and fp.seek(0, 2) > self.guild.filesize_limit:
+            # The bundle is too big to be sent, so the HTML transcript is sent alone, with the remote URLs.
+            fp.close()
+            for name, url in attachment_handler.urls.items():
+                transcript = transcript.replace(name, url)
+            files = {}
+            fp = await asyncio.to_thread(_write_transcript, transcript, f"{filename}.html", files)
+        fp.seek(0)
         return discord.File(
-            filename=f"ticket-{self.id}-{self.owner.name}.html",
-            fp=io.BytesIO(transcript.encode()),
+            filename=f"{filename}.zip" if files else f"{filename}.html",
+            fp=fp,
         )
 
     async def delete_channel(self, deleter: typing.Optional[discord.Member] = None) -> None:
@@ -1076,18 +1152,20 @@ async def delete_channel(self, deleter: typing.Optional[discord.Member] = None)
             audit_reason = _("Ticket deleted (profile `{self.profile}`)").format(self=self)
         else:
             audit_reason = _("Ticket deleted by {deleter.display_name} ({deleter.id}) (profile `{self.profile}`)").format(deleter=deleter, self=self)
-        if isinstance(self.channel, discord.Thread):
-            await self.channel.delete(reason=audit_reason)
+        config = await self.cog.config.guild(self.guild).profiles.get_raw(self.profile)
+        channel = self.channel
+        logs_channel = self.guild.get_channel_or_thread(config["logs_channel"]) if config["logs_channel"] is not None else None
+        # The history is fetched before the deletion of the channel, and the transcript is generated in the background.
+        messages = [message async for message in channel.history(limit=None, oldest_first=True)] if config["transcripts"] and logs_channel is not None else None
+        if (view := self.cog.views.pop(self.message, None)) is not None:
+            view.stop()
+        if isinstance(channel, discord.Thread):
+            await channel.delete(reason=audit_reason)
         else:
-            await self.channel.delete(reason=audit_reason)
-        self.cog.views.pop(self.message).stop()
+            await channel.delete(reason=audit_reason)
 
-        config = await self.cog.config.guild(self.guild).profiles.get_raw(self.profile)
-        if (
-            (log_channel_id := await self.cog.config.guild(self.guild).log_channel())
-            and (log_channel := self.guild.get_channel(log_channel_id))
-        ):
-            await log_channel.send(
+        if logs_channel is not None:
+            await logs_channel.send(
                 embeds=[
                     discord.Embed(
                         title=_("🗑 Ticket Deleted"),
@@ -1097,8 +1175,15 @@ async def delete_channel(self, deleter: typing.Optional[discord.Member] = None)
                     ),
                     await self.get_embed(for_logging=True),
                 ],
-                file=await self.export() if config["transcripts"] else None,
             )
+            if messages is not None:
+                async def send_transcript(transcript: typing.Optional[discord.File]) -> None:
+                    if transcript is not None:
+                        await logs_channel.send(
+                            _("📜 Here is the transcript of the ticket #{self.id}!").format(self=self),
+                            file=transcript,
+                        )
+                self.cog.queue_transcript(self, callback=send_transcript, channel=channel, messages=messages)
 
         self.bot.dispatch("ticket_deleted", self)
         if config["create_modlog_case"]:
@@ -35,8 +35,9 @@ async def interaction_check(self, interaction: discord.Interaction) -> bool:
             return False
         return True
 
-    async def _update(self, edit_message: bool = False) -> None:
-        config = await self.cog.config.guild(self.ticket.guild).profiles.get_raw(self.ticket.profile)
+    async def _update(self, edit_message: bool = False, config: typing.Optional[typing.Dict[str, typing.Any]] = None) -> None:
+        if config is None:
+            config = await self.cog.config.guild(self.ticket.guild).profiles.get_raw(self.ticket.profile)
         self.members.custom_id = f"Tickets_#{self.ticket.id}_members"
         if not self.ticket.is_locked:
             try:
@@ -472,22 +473,33 @@ async def interaction_check(self, interaction: discord.Interaction) -> bool:
     async def transcript(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
         await interaction.response.defer(thinking=True)
         ticket = discord.utils.get(self.cog.tickets.get(interaction.guild.id, {}).values(), channel=interaction.channel)
-        transcript = await ticket.export()
-        message = await interaction.followup.send(
-            _("📜 Here is the transcript of this ticket!"),
-            file=transcript,
-            ephemeral=True,
-            wait=True,
-        )
-        view: discord.ui.View = discord.ui.View()
-        view.add_item(
-            discord.ui.Button(
-                label=_("View Transcript"),
-                style=discord.ButtonStyle.link,
-                url=f"https://mahto.id/chat-exporter?url={message.attachments[0].url}",
+
+        async def send_transcript(transcript: typing.Optional[discord.File]) -> None:
+            if transcript is None:
+                await interaction.followup.send(
+                    _("An error occurred while generating the transcript of this ticket."),
+                    ephemeral=True,
+                )
+                return
+            message = await interaction.followup.send(
+                _("📜 Here is the transcript of this ticket!"),
+                file=transcript,
+                ephemeral=True,
+                wait=True,
             )
-        )
-        await interaction.edit_original_response(view=view)
+            if not transcript.filename.endswith(".html"):
+                return  # The ZIP bundles can't be viewed online.
+            view: discord.ui.View = discord.ui.View()
+            view.add_item(
+                discord.ui.Button(
+                    label=_("View Transcript"),
+                    style=discord.ButtonStyle.link,
+                    url=f"https://mahto.id/chat-exporter?url={message.attachments[0].url}",
+                )
+            )
+            await interaction.edit_original_response(view=view)
+
+        self.cog.queue_transcript(ticket, callback=send_transcript)
 
     @discord.ui.button(label="Reopen", style=discord.ButtonStyle.secondary)
     async def reopen(self, interaction: discord.Interaction, button: discord.ui.Button) -> None:
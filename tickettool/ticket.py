@@ -6,6 +6,7 @@
 
 import datetime
 import io
+from copy import deepcopy
 
 import chat_exporter
 
@@ -14,6 +15,87 @@
 _: Translator = Translator("TicketTool", __file__)
 
 
+class TicketsIndex:
+    """In-memory index of the tickets of a guild, kept in sync with Config on each save/delete.
+
+    The raw tickets data are indexed by channel id, by owner, by creator and by profile and
+    status, so that the lookups are O(matching tickets) instead of loading all the tickets.
+    """
+
+    def __init__(self, tickets: typing.Dict[str, typing.Dict[str, typing.Any]] = {}) -> None:
+        self.tickets: typing.Dict[int, typing.Dict[str, typing.Any]] = {}
+        self.by_owner: typing.Dict[int, typing.Set[int]] = {}
+        self.by_created_by: typing.Dict[int, typing.Set[int]] = {}
+        self.by_profile_status: typing.Dict[typing.Tuple[str, str], typing.Set[int]] = {}
+        for channel_id, json in tickets.items():
+            self.add(int(channel_id), json)
+
+    def __contains__(self, channel_id: int) -> bool:
+        return channel_id in self.tickets
+
+    def __len__(self) -> int:
+        return len(self.tickets)
+
+    def _keys(
+        self, json: typing.Dict[str, typing.Any]
+    ) -> typing.Iterator[typing.Tuple[typing.Dict[typing.Any, typing.Set[int]], typing.Any]]:
+        if json.get("owner") is not None:
+            yield self.by_owner, json["owner"]
+        if json.get("created_by") is not None:
+            yield self.by_created_by, json["created_by"]
+        yield self.by_profile_status, (json.get("profile", "main"), json["status"])
+
+    def add(self, channel_id: int, json: typing.Dict[str, typing.Any]) -> None:
+        self.remove(channel_id)
+        json = deepcopy(json)
+        self.tickets[channel_id] = json
+        for index, key in self._keys(json):
+            index.setdefault(key, set()).add(channel_id)
+
+    def remove(self, channel_id: int) -> None:
+        if (json := self.tickets.pop(channel_id, None)) is None:
+            return
+        for index, key in self._keys(json):
+            if (channels_ids := index.get(key)) is not None:
+                channels_ids.discard(channel_id)
+                if not channels_ids:
+                    del index[key]
+
+    def get(self, channel_id: int) -> typing.Optional[typing.Dict[str, typing.Any]]:
+        if (json := self.tickets.get(channel_id)) is None:
+            return None
+        return deepcopy(json)
+
+    def filter(
+        self,
+        profile: typing.Optional[str] = None,
+        status: typing.Optional[str] = None,
+        owner: typing.Optional[int] = None,
+        created_by: typing.Optional[int] = None,
+    ) -> typing.List[int]:
+        """Get the channels ids of the tickets matching all the provided criteria."""
+        channels_ids_sets = []
+        if profile is not None or status is not None:
+            channels_ids_sets.append(
+                set().union(
+                    *(
+                        channels_ids
+                        for (_profile, _status), channels_ids in self.by_profile_status.items()
+                        if (profile is None or _profile == profile)
+                        and (status is None or _status == status)
+                    )
+                )
+            )
+        if owner is not None:
+            channels_ids_sets.append(self.by_owner.get(owner, set()))
+        if created_by is not None:
+            channels_ids_sets.append(self.by_created_by.get(created_by, set()))
+        if not channels_ids_sets:
+            return list(self.tickets)
+        # `set.intersection` iterates over the smallest set.
+        return list(set.intersection(*channels_ids_sets))
+
+
 class Ticket:
     """Representation of a Ticket."""
 
@@ -228,9 +310,8 @@ async def save(self, clean: bool = True) -> typing.Dict[str, typing.Any]:
             for key in ("logs_messages", "save_data"):
                 if json[key]:
                     del json[key]
-        data = await cog.config.guild(guild).tickets.all()
-        data[str(channel.id)] = json
-        await cog.config.guild(guild).tickets.set(data)
+        await cog.config.guild(guild).tickets.set_raw(str(channel.id), value=json)
+        cog.get_tickets_index(guild).add(channel.id, json)
         return json
 
     async def create(self) -> typing.Any:
@@ -446,6 +527,7 @@ async def create(self) -> typing.Any:
         await self.cog.config.guild(self.guild).profiles.set_raw(
             self.profile, "last_nb", value=self.id
         )
+        self.cog.clear_config_cache(self.guild, self.profile)
         await self.save()
         return self
 
@@ -826,12 +908,7 @@ async def delete(
             await self.channel.delete(reason=_reason)
         else:
             await self.channel.delete()
-        data = await self.cog.config.guild(self.guild).tickets.all()
-        try:
-            del data[str(self.channel.id)]
-        except KeyError:
-            pass
-        await self.cog.config.guild(self.guild).tickets.set(data)
+        await self.cog.remove_ticket(self.guild, self.channel.id)
         return self
 
     async def claim_ticket(
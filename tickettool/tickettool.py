@@ -8,6 +8,7 @@
 import asyncio
 import datetime
 import io
+import time
 from copy import deepcopy
 from functools import partial
 
@@ -17,7 +18,7 @@
 
 from .dashboard_integration import DashboardIntegration
 from .settings import settings
-from .ticket import Ticket
+from .ticket import Ticket, TicketsIndex
 from .utils import CustomModalConverter
 
 # Credits:
@@ -87,6 +88,12 @@ def __init__(self, bot: Red) -> None:
             dropdowns={},
         )
 
+        self.tickets_index: typing.Dict[int, TicketsIndex] = {}
+        # The resolved profiles configs, by guild id and profile: (resolved time, config).
+        self.configs_cache: typing.Dict[
+            int, typing.Dict[str, typing.Tuple[float, typing.Dict[str, typing.Any]]]
+        ] = {}
+
         _settings: typing.Dict[
             str, typing.Dict[str, typing.Union[typing.List[str], typing.Any, str]]
         ] = {
@@ -202,6 +209,7 @@ def __init__(self, bot: Red) -> None:
     async def cog_load(self) -> None:
         await super().cog_load()
         await self.edit_config_schema()
+        await self.load_tickets_index()
         await self.settings.add_commands()
         try:
             await modlog.register_casetype(
@@ -411,9 +419,22 @@ async def load_buttons(self) -> None:
                         exc_info=e,
                     )
 
-    async def get_config(self, guild: discord.Guild, profile: str) -> typing.Dict[str, typing.Any]:
+    async def get_config(
+        self, guild: discord.Guild, profile: str, ttl: int = 60
+    ) -> typing.Dict[str, typing.Any]:
+        """Get the config of a profile, with the channels and the roles resolved.
+
+        The resolved configs are cached, and the cache is cleared by the settings commands, by
+        the creation of a ticket (for `last_nb`) and when a channel or a role is deleted. The
+        `ttl` only bounds the staleness after a change made outside of these paths.
+        """
+        if (
+            cached := self.configs_cache.get(guild.id, {}).get(profile)
+        ) is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1].copy()
         config = await self.config.guild(guild).profiles.get_raw(profile)
-        for key, value in self.config._defaults[Config.GUILD]["default_profile_settings"].items():
+        default_profile_settings = self.config._defaults[Config.GUILD]["default_profile_settings"]
+        for key, value in default_profile_settings.items():
             if key not in config:
                 config[key] = value
         if config["logschannel"] is not None:
@@ -424,54 +445,56 @@ async def get_config(self, guild: discord.Guild, profile: str) -> typing.Dict[st
             config["category_open"] = guild.get_channel(config["category_open"])
         if config["category_close"] is not None:
             config["category_close"] = guild.get_channel(config["category_close"])
-        if config["admin_roles"]:
-            config["admin_roles"] = [
-                role
-                for role_id in config["admin_roles"]
-                if (role := guild.get_role(role_id)) is not None
-            ]
-        if config["support_roles"]:
-            config["support_roles"] = [
-                role
-                for role_id in config["support_roles"]
-                if (role := guild.get_role(role_id)) is not None
-            ]
-        if config["view_roles"]:
-            config["view_roles"] = [
-                role
-                for role_id in config["view_roles"]
-                if (role := guild.get_role(role_id)) is not None
-            ]
-        if config["ping_roles"]:
-            config["ping_roles"] = [
-                role
-                for role_id in config["ping_roles"]
-                if (role := guild.get_role(role_id)) is not None
-            ]
+        for key in ("admin_roles", "support_roles", "view_roles", "ping_roles"):
+            if config[key]:
+                config[key] = [
+                    role
+                    for role_id in config[key]
+                    if (role := guild.get_role(role_id)) is not None
+                ]
         if config["ticket_role"] is not None:
             config["ticket_role"] = guild.get_role(config["ticket_role"])
-        for key, value in self.config._defaults[self.config.GUILD][
-            "default_profile_settings"
-        ].items():
-            if key not in config:
-                config[key] = value
         if len(config["embed_button"]) == 0:
-            config["embed_button"] = self.config._defaults[self.config.GUILD][
-                "default_profile_settings"
-            ]["embed_button"]
+            config["embed_button"] = default_profile_settings["embed_button"]
         else:
-            for key, value in self.config._defaults[self.config.GUILD]["default_profile_settings"][
-                "embed_button"
-            ].items():
-                if key not in config:
-                    config[key] = value
-        return config
+            for key, value in default_profile_settings["embed_button"].items():
+                if key not in config["embed_button"]:
+                    config["embed_button"][key] = value
+        self.configs_cache.setdefault(guild.id, {})[profile] = (time.monotonic(), config)
+        return config.copy()
 
-    async def get_ticket(self, channel: discord.TextChannel) -> Ticket:
-        tickets = await self.config.guild(channel.guild).tickets.all()
-        if str(channel.id) in tickets:
-            json = tickets[str(channel.id)]
+    def clear_config_cache(
+        self, guild: discord.Guild, profile: typing.Optional[str] = None
+    ) -> None:
+        if profile is None:
+            self.configs_cache.pop(guild.id, None)
         else:
+            self.configs_cache.get(guild.id, {}).pop(profile, None)
+
+    async def load_tickets_index(self) -> None:
+        all_guilds = await self.config.all_guilds()
+        self.tickets_index = {
+            guild_id: TicketsIndex(all_guilds[guild_id]["tickets"]) for guild_id in all_guilds
+        }
+
+    def get_tickets_index(self, guild: discord.Guild) -> TicketsIndex:
+        if guild.id not in self.tickets_index:
+            self.tickets_index[guild.id] = TicketsIndex()
+        return self.tickets_index[guild.id]
+
+    async def remove_ticket(self, guild: discord.Guild, channel_id: int) -> None:
+        self.get_tickets_index(guild).remove(channel_id)
+        await self.config.guild(guild).tickets.clear_raw(str(channel_id))
+
+    def get_ticket_channel(
+        self, guild: discord.Guild, channel_id: int, config: typing.Dict[str, typing.Any]
+    ) -> typing.Optional[typing.Union[discord.TextChannel, discord.Thread]]:
+        if config["forum_channel"] is not None:
+            return config["forum_channel"].get_thread(channel_id)
+        return guild.get_channel(channel_id)
+
+    async def get_ticket(self, channel: discord.TextChannel) -> Ticket:
+        if (json := self.get_tickets_index(channel.guild).get(channel.id)) is None:
             return None
         if "profile" not in json:
             json["profile"] = "main"
@@ -624,27 +647,14 @@ async def get_embed_action(
 
     async def check_limit(self, member: discord.Member, profile: str) -> bool:
         config = await self.get_config(member.guild, profile)
-        tickets = await self.config.guild(member.guild).tickets.all()
-        to_remove = []
         count = 1
-        for id in tickets:
-            if config["forum_channel"] is not None:
-                channel = config["forum_channel"].get_thread(int(id))
-            else:
-                channel = member.guild.get_channel(int(id))
-            if channel is not None:
-                ticket: Ticket = await self.get_ticket(channel)
-                if ticket.profile != profile:
-                    continue
-                if ticket.created_by == member and ticket.status == "open":
-                    count += 1
+        for channel_id in self.get_tickets_index(member.guild).filter(
+            profile=profile, status="open", created_by=member.id
+        ):
+            if self.get_ticket_channel(member.guild, channel_id, config=config) is not None:
+                count += 1
             else:
-                to_remove.append(id)
-        if to_remove:
-            tickets = await self.config.guild(member.guild).tickets.all()
-            for id in to_remove:
-                del tickets[str(id)]
-            await self.config.guild(member.guild).tickets.set(tickets)
+                await self.remove_ticket(member.guild, channel_id)
         return count <= config["nb_max"]
 
     async def create_modlog(
@@ -1357,23 +1367,16 @@ async def command_list(
         """List the existing Tickets for a profile. You can provide a status and/or a ticket owner."""
         if status is None:
             status = "open"
-        tickets = await self.config.guild(ctx.guild).tickets.all()
+        config = await self.get_config(ctx.guild, profile=profile)
         tickets_to_show = []
-        for channel_id in tickets:
-            config = await self.get_config(ctx.guild, profile=profile)
-            if config["forum_channel"] is not None:
-                channel = config["forum_channel"].get_thread(int(channel_id))
-            else:
-                channel = ctx.guild.get_channel(int(channel_id))
-            if channel is None:
+        for channel_id in self.get_tickets_index(ctx.guild).filter(
+            profile=profile,
+            status=status if status != "all" else None,
+            owner=owner.id if owner is not None else None,
+        ):
+            if (channel := self.get_ticket_channel(ctx.guild, channel_id, config=config)) is None:
                 continue
-            ticket: Ticket = await self.get_ticket(channel)
-            if (
-                ticket.profile == profile
-                and (owner is None or ticket.owner == owner)
-                and (status == "all" or ticket.status == status)
-            ):
-                tickets_to_show.append(ticket)
+            tickets_to_show.append(await self.get_ticket(channel))
         if not tickets_to_show:
             raise commands.UserFeedbackCheckFailure(_("No tickets to show."))
         BREAK_LINE = "\n"
@@ -1742,32 +1745,38 @@ async def on_message_delete(self, message: discord.Message) -> None:
 
     @commands.Cog.listener()
     async def on_guild_channel_delete(self, old_channel: discord.abc.GuildChannel) -> None:
-        tickets = await self.config.guild(old_channel.guild).tickets.all()
-        if str(old_channel.id) not in tickets:
+        self.clear_config_cache(old_channel.guild)
+        if old_channel.id not in self.get_tickets_index(old_channel.guild):
             return
-        try:
-            del tickets[str(old_channel.id)]
-        except KeyError:
-            pass
-        await self.config.guild(old_channel.guild).tickets.set(tickets)
+        await self.remove_ticket(old_channel.guild, old_channel.id)
         return
 
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role) -> None:
+        self.clear_config_cache(role.guild)
+
+    @commands.Cog.listener()
+    async def on_command_completion(self, ctx: commands.Context) -> None:
+        if ctx.guild is None or ctx.cog is not self:
+            return
+        if ctx.command == self.configuration or ctx.command.root_parent == self.configuration:
+            self.clear_config_cache(ctx.guild)
+
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member) -> None:
-        tickets = await self.config.guild(member.guild).tickets.all()
-        for channel_id in tickets:
-            config = await self.get_config(member.guild, profile=tickets[channel_id]["profile"])
-            if config["forum_channel"] is not None:
-                channel = config["forum_channel"].get_thread(int(channel_id))
-            else:
-                channel = member.guild.get_channel(int(channel_id))
-            if channel is None:
+        tickets_index = self.get_tickets_index(member.guild)
+        for channel_id in tickets_index.filter(status="open", owner=member.id):
+            config = await self.get_config(
+                member.guild, profile=tickets_index.tickets[channel_id].get("profile", "main")
+            )
+            if not config["close_on_leave"]:
+                continue
+            if (
+                channel := self.get_ticket_channel(member.guild, channel_id, config=config)
+            ) is None:
                 continue
             ticket: Ticket = await self.get_ticket(channel)
-            if config["close_on_leave"] and (
-                getattr(ticket.owner, "id", ticket.owner) == member.id and ticket.status == "open"
-            ):
-                await ticket.close(ticket.guild.me)
+            await ticket.close(ticket.guild.me)
         return
 
     def get_buttons(self, buttons: typing.List[dict]) -> discord.ui.View:
@@ -1822,19 +1831,15 @@ async def get_open_tickets_list_in_server_for_assistant(
     ):
         if not isinstance(user, discord.Member):
             return "The command isn't executed in a server."
-        tickets = await self.config.guild(user.guild).tickets.all()
+        tickets_index = self.get_tickets_index(user.guild)
         tickets_to_show = []
-        for channel_id in tickets:
-            config = await self.get_config(user.guild, profile=tickets[channel_id]["profile"])
-            if config["forum_channel"] is not None:
-                channel = config["forum_channel"].get_thread(int(channel_id))
-            else:
-                channel = user.guild.get_channel(int(channel_id))
-            if channel is None:
+        for channel_id in tickets_index.filter(status="open", owner=user.id):
+            config = await self.get_config(
+                user.guild, profile=tickets_index.tickets[channel_id].get("profile", "main")
+            )
+            if (channel := self.get_ticket_channel(user.guild, channel_id, config=config)) is None:
                 continue
-            ticket: Ticket = await self.get_ticket(channel)
-            if (ticket.owner is not None and ticket.owner == user) and ticket.status == "open":
-                tickets_to_show.append(ticket)
+            tickets_to_show.append(await self.get_ticket(channel))
         if not tickets_to_show:
             raise commands.UserFeedbackCheckFailure(
                 _("No open tickets by this user in this server.")
@@ -1,12 +1,17 @@
 from AAA3A_utils import Cog, CogsUtils, Menu  # isort:skip
-from redbot.core import commands  # isort:skip
+from redbot.core import commands, Config  # isort:skip
 from redbot.core.bot import Red  # isort:skip
 from redbot.core.i18n import Translator, cog_i18n  # isort:skip
 import discord  # isort:skip
 import typing  # isort:skip
 
+import aiohttp
+import asyncio
+import datetime
+import tempfile
+import time
+
 from redbot.core.utils.chat_formatting import pagify
-from redbot.core.utils.tunnel import Tunnel
 
 # Credits:
 # General repo credits.
@@ -41,10 +46,60 @@ async def convert(
                 raise e
 
 
+class RateLimiter:
+    """A token bucket, to pace the requests under a rate limit instead of hitting it."""
+
+    def __init__(self, capacity: int, rate: float) -> None:
+        self.capacity: int = capacity
+        self.rate: float = rate  # Tokens by second.
+        self.tokens: float = capacity
+        self.updated_at: float = time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
 @cog_i18n(_)
 class TransferChannel(Cog):
     """A cog to transfer messages from a channel to another channel, with many options!"""
 
+    def __init__(self, bot: Red) -> None:
+        super().__init__(bot=bot)
+
+        self.config: Config = Config.get_conf(
+            self,
+            identifier=205192943327321000143939875896557571750,
+            force_registration=True,
+        )
+        self.config.register_global(
+            transfers={},  # The journals of the transfers, by destination id.
+        )
+
+        self.transfers_tasks: typing.Dict[int, asyncio.Task] = {}
+
+    async def cog_load(self) -> None:
+        await super().cog_load()
+        asyncio.create_task(self.resume_transfers())
+
+    async def cog_unload(self) -> None:
+        # The transfers will be resumed from their last transferred message when the cog is loaded.
+        for task in self.transfers_tasks.values():
+            task.cancel()
+        await super().cog_unload()
+
+    async def resume_transfers(self) -> None:
+        await self.bot.wait_until_red_ready()
+        for state in (await self.config.transfers()).values():
+            if state["destination_id"] not in self.transfers_tasks:
+                asyncio.create_task(self.run_transfer_task(state))
+
     def embed_from_msg(self, message: discord.Message) -> discord.Embed:
         content = message.content
         channel = message.channel
@@ -109,6 +164,29 @@ async def check_channels(
                 ).format(destination=destination)
             )
 
+    def check_message(
+        self,
+        message: discord.Message,
+        user_id: typing.Optional[int] = None,
+        bot: typing.Optional[bool] = None,
+        exclude_users_and_roles: typing.List[
+            typing.Union[discord.User, discord.Role, discord.Object]
+        ] = [],
+    ) -> bool:
+        if message.type not in (discord.MessageType.default, discord.MessageType.reply):
+            return False
+        if user_id is not None and message.author.id != user_id:
+            return False
+        if bot is not None and message.author.bot != bot:
+            return False
+        # Compared by ids, to work with the `discord.Object`s of a resumed transfer.
+        excluded_ids = {user_or_role.id for user_or_role in exclude_users_and_roles}
+        if message.author.id in excluded_ids or any(
+            role.id in excluded_ids for role in getattr(message.author, "roles", [])
+        ):
+            return False
+        return True
+
     async def get_messages(
         self,
         ctx: commands.Context,
@@ -132,14 +210,11 @@ async def get_messages(
             after=after,
             oldest_first=False,
         ):
-            if message.type not in (discord.MessageType.default, discord.MessageType.reply):
-                continue
-            if user_id is not None and message.author.id != user_id:
-                continue
-            if bot is not None and message.author.bot != bot:
-                continue
-            if message.author in exclude_users_and_roles or any(
-                role in exclude_users_and_roles for role in getattr(message.author, "roles", [])
+            if not self.check_message(
+                message,
+                user_id=user_id,
+                bot=bot,
+                exclude_users_and_roles=exclude_users_and_roles,
             ):
                 continue
             messages.append(message)
@@ -155,115 +230,575 @@ async def get_messages(
             raise commands.UserFeedbackCheckFailure(_("Sorry. I could not find any messages."))
         return count_messages, messages
 
-    async def transfer_messages(
+    async def iter_messages(
         self,
-        ctx: commands.Context,
-        source: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+        channel: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+        before: typing.Union[discord.Message, discord.Object],
+        after: typing.Union[discord.Message, discord.Object],
+        user_id: typing.Optional[int] = None,
+        bot: typing.Optional[bool] = None,
+        exclude_users_and_roles: typing.List[
+            typing.Union[discord.User, discord.Role, discord.Object]
+        ] = [],
+        ignored_message_id: typing.Optional[int] = None,
+    ) -> typing.AsyncIterator[discord.Message]:
+        """Yield the messages of a range oldest first, fetched by pages with `after`, without storing the whole range."""
+        async for message in channel.history(
+            limit=None, before=before, after=after, oldest_first=True
+        ):
+            if message.id == ignored_message_id or not self.check_message(
+                message,
+                user_id=user_id,
+                bot=bot,
+                exclude_users_and_roles=exclude_users_and_roles,
+            ):
+                continue
+            yield message
+
+    async def download_attachments(
+        self,
+        session: aiohttp.ClientSession,
+        message: discord.Message,
+        max_size: int,
+        semaphore: asyncio.Semaphore,
+    ) -> typing.List[discord.File]:
+        """Download the attachments of a message in temporary files, like `Tunnel.files_from_attatch` but without keeping them in memory."""
+        if not message.attachments or sum(a.size for a in message.attachments) > max_size:
+            return []
+        files = []
+        async with semaphore:
+            for attachment in message.attachments:
+                fp = tempfile.TemporaryFile()
+                try:
+                    async with session.get(attachment.url) as r:
+                        if r.status != 200:
+                            # The attachment URL may have expired, the proxy URL is tried then.
+                            raise aiohttp.ClientResponseError(
+                                r.request_info, r.history, status=r.status
+                            )
+                        async for chunk in r.content.iter_chunked(64 * 1024):
+                            await asyncio.to_thread(fp.write, chunk)
+                except aiohttp.ClientError:
+                    fp.close()
+                    try:
+                        files.append(await attachment.to_file(use_cached=True))
+                    except discord.HTTPException:
+                        pass
+                    continue
+                fp.seek(0)
+                files.append(
+                    discord.File(
+                        fp,
+                        filename=attachment.filename,
+                        spoiler=attachment.is_spoiler(),
+                        description=attachment.description,
+                    )
+                )
+        return files
+
+    async def send_message(
+        self,
+        message: discord.Message,
         destination: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
         way: typing.Literal["webhooks", "embeds", "messages"],
-        **kwargs,
-    ) -> typing.Tuple[int, typing.List[discord.Message]]:
-        if "messages" in kwargs:
-            messages = kwargs["messages"]
-            count_messages = len(messages)
-        else:
-            count_messages, messages = await self.get_messages(ctx, channel=source, **kwargs)
-        messages.reverse()
+        files: typing.List[discord.File],
+        rate_limiter: RateLimiter,
+        hook: typing.Optional[discord.Webhook] = None,
+    ) -> None:
+        # A `discord.File` is closed once sent, so the files are only sent with the last page.
         if way == "webhooks":
-            hook = await CogsUtils.get_hook(
-                bot=ctx.bot,
-                channel=destination.parent
-                if isinstance(destination, discord.Thread)
-                else destination,
-            )
-        for message in messages:
-            if destination.permissions_for(destination.guild.me).attach_files:
-                files = await Tunnel.files_from_attatch(message)
-            else:
-                files = []
-            if way == "webhooks":
-                if not any([message.content, message.embeds, message.attachments]):
-                    continue
-                for page in pagify(message.content):
-                    await hook.send(
-                        username=message.author.display_name,
-                        avatar_url=message.author.display_avatar,
-                        content=page,
-                        embeds=message.embeds,
+            if not any([message.content, message.embeds, message.attachments]):
+                return
+            pages = list(pagify(message.content)) or [""]
+            for i, page in enumerate(pages, start=1):
+                await rate_limiter.acquire()
+                await hook.send(
+                    username=message.author.display_name,
+                    avatar_url=message.author.display_avatar,
+                    content=page,
+                    embeds=message.embeds,
+                    files=files if i == len(pages) else [],
+                    allowed_mentions=discord.AllowedMentions(
+                        everyone=False, users=False, roles=False
+                    ),
+                    thread=destination
+                    if isinstance(destination, discord.Thread)
+                    else discord.utils.MISSING,
+                    wait=True,
+                )
+        elif way == "embeds":
+            embed = self.embed_from_msg(message)
+            await rate_limiter.acquire()
+            try:
+                await destination.send(
+                    embeds=[embed] + message.embeds,
+                    files=files,
+                    stickers=message.stickers,
+                    allowed_mentions=discord.AllowedMentions(
+                        everyone=False, users=False, roles=False
+                    ),
+                )
+            except discord.HTTPException:
+                for file in files:
+                    file.reset()
+                await rate_limiter.acquire()
+                try:
+                    await destination.send(
+                        embeds=[embed] + message.embeds[:-1],
                         files=files,
+                        stickers=message.stickers,
                         allowed_mentions=discord.AllowedMentions(
                             everyone=False, users=False, roles=False
                         ),
-                        thread=destination
-                        if isinstance(destination, discord.Thread)
-                        else discord.utils.MISSING,
-                        wait=True,
                     )
-            elif way == "embeds":
-                embed = self.embed_from_msg(message)
-                try:
+                except discord.HTTPException:
+                    for file in files:
+                        file.reset()
+                    await rate_limiter.acquire()
                     await destination.send(
-                        embeds=[embed] + message.embeds,
+                        embed=embed,
                         files=files,
                         stickers=message.stickers,
                         allowed_mentions=discord.AllowedMentions(
                             everyone=False, users=False, roles=False
                         ),
                     )
-                except discord.HTTPException:
-                    try:
-                        await destination.send(
-                            embeds=[embed] + message.embeds[:-1],
-                            files=files,
-                            stickers=message.stickers,
-                            allowed_mentions=discord.AllowedMentions(
-                                everyone=False, users=False, roles=False
-                            ),
-                        )
-                    except discord.HTTPException:
-                        await destination.send(
-                            embed=embed,
-                            files=files,
-                            stickers=message.stickers,
-                            allowed_mentions=discord.AllowedMentions(
-                                everyone=False, users=False, roles=False
-                            ),
-                        )
-            elif way == "messages":
-                iso_format = message.created_at.isoformat()
-                msg = "\n".join(
-                    [
-                        _("**Author:** {message.author.mention} ({message.author.id})").format(
-                            message=message
-                        ),
-                        _("**Channel:** <#{message.channel.id}>").format(message=message),
-                        _("**Time (UTC):** {iso_format}").format(iso_format=iso_format),
-                    ]
+        elif way == "messages":
+            iso_format = message.created_at.isoformat()
+            msg = "\n".join(
+                [
+                    _("**Author:** {message.author.mention} ({message.author.id})").format(
+                        message=message
+                    ),
+                    _("**Channel:** <#{message.channel.id}>").format(message=message),
+                    _("**Time (UTC):** {iso_format}").format(iso_format=iso_format),
+                ]
+            )
+            await rate_limiter.acquire()
+            if len(f"{msg}\n\n{message.content}") <= 2000:
+                await destination.send(
+                    f"{msg}\n\n{message.content}",
+                    embeds=message.embeds,
+                    files=files,
+                    stickers=message.stickers,
+                    allowed_mentions=discord.AllowedMentions(
+                        everyone=False, users=False, roles=False
+                    ),
                 )
-                if len(f"{msg}\n\n{message.content}") <= 2000:
+            else:
+                await destination.send(msg, allowed_mentions=discord.AllowedMentions.none())
+                pages = list(pagify(message.content))
+                for i, page in enumerate(pages, start=1):
+                    await rate_limiter.acquire()
                     await destination.send(
-                        f"{msg}\n\n{message.content}",
+                        page,
                         embeds=message.embeds,
-                        files=files,
+                        files=files if i == len(pages) else [],
                         stickers=message.stickers,
                         allowed_mentions=discord.AllowedMentions(
                             everyone=False, users=False, roles=False
                         ),
                     )
+
+    async def send_messages(
+        self,
+        source: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+        destination: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+        way: typing.Literal["webhooks", "embeds", "messages"],
+        messages: typing.Union[
+            typing.Iterable[discord.Message], typing.AsyncIterable[discord.Message]
+        ],
+        on_message_sent: typing.Optional[
+            typing.Callable[[discord.Message], typing.Awaitable[None]]
+        ] = None,
+        max_concurrent_downloads: int = 4,
+        max_pending_messages: int = 20,
+    ) -> None:
+        """Send the messages with a pipeline: the attachments of the next messages are downloaded (with a bounded concurrency) while the previous messages are sent, in order, and paced to stay under the rate limits."""
+        hook = None
+        if way == "webhooks":
+            hook = await CogsUtils.get_hook(
+                bot=self.bot,
+                channel=destination.parent
+                if isinstance(destination, discord.Thread)
+                else destination,
+            )
+            # Webhooks: 5 requests by 2 seconds, and 30 messages by minute in a channel.
+            rate_limiter = RateLimiter(capacity=5, rate=0.5)
+        else:
+            # Bots: 5 messages by 5 seconds in a channel.
+            rate_limiter = RateLimiter(capacity=5, rate=1)
+        attach_files = destination.permissions_for(destination.guild.me).attach_files
+        max_size = min(
+            source.guild.filesize_limit if source.guild is not None else 26214400,
+            destination.guild.filesize_limit,
+        )
+        semaphore = asyncio.Semaphore(max_concurrent_downloads)
+        # The downloads tasks, in the messages order. The queue size limits the messages (and
+        # their files) waiting to be sent.
+        pending: asyncio.Queue = asyncio.Queue(maxsize=max_pending_messages)
+
+        async with aiohttp.ClientSession() as session:
+
+            async def aiter_messages() -> typing.AsyncIterator[discord.Message]:
+                if isinstance(messages, typing.AsyncIterable):
+                    async for message in messages:
+                        yield message
                 else:
-                    await destination.send(msg, allowed_mentions=discord.AllowedMentions.none())
-                    for page in pagify(message.content):
-                        await destination.send(
-                            page,
-                            embeds=message.embeds,
+                    for message in messages:
+                        yield message
+
+            async def produce() -> None:
+                try:
+                    async for message in aiter_messages():
+                        await pending.put(
+                            (
+                                message,
+                                asyncio.create_task(
+                                    self.download_attachments(
+                                        session,
+                                        message=message,
+                                        max_size=max_size,
+                                        semaphore=semaphore,
+                                    )
+                                )
+                                if attach_files and message.attachments
+                                else None,
+                            )
+                        )
+                finally:
+                    await pending.put(None)
+
+            producer = asyncio.create_task(produce())
+            try:
+                while (item := await pending.get()) is not None:
+                    message, download_task = item
+                    files = await download_task if download_task is not None else []
+                    try:
+                        await self.send_message(
+                            message,
+                            destination=destination,
+                            way=way,
                             files=files,
-                            stickers=message.stickers,
-                            allowed_mentions=discord.AllowedMentions(
-                                everyone=False, users=False, roles=False
-                            ),
+                            rate_limiter=rate_limiter,
+                            hook=hook,
                         )
+                    finally:
+                        for file in files:
+                            file.close()
+                    if on_message_sent is not None:
+                        await on_message_sent(message)
+                await producer  # Raise the error of the producer, if any.
+            finally:
+                producer.cancel()
+                while not pending.empty():
+                    if (item := pending.get_nowait()) is not None and item[1] is not None:
+                        item[1].cancel()
+
+    async def transfer_messages(
+        self,
+        ctx: commands.Context,
+        source: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+        destination: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+        way: typing.Literal["webhooks", "embeds", "messages"],
+        **kwargs,
+    ) -> typing.Tuple[int, typing.List[discord.Message]]:
+        """Transfer the messages, and return their count and the list of the messages.
+
+        Without a `limit` or a `number` of messages, the history is streamed oldest first into the
+        pipeline, and the returned list is empty.
+        """
+        if "messages" in kwargs:
+            messages = kwargs["messages"]
+            messages.reverse()
+            await self.send_messages(
+                source=source, destination=destination, way=way, messages=messages
+            )
+            return len(messages), messages
+        if str(destination.id) in await self.config.transfers():
+            raise commands.UserFeedbackCheckFailure(
+                _(
+                    "A transfer to this channel is already in progress or interrupted. Use `{prefix}transferchannel resume` or `{prefix}transferchannel cancel`."
+                ).format(prefix=ctx.clean_prefix)
+            )
+        if kwargs.get("limit") is None and kwargs.get("number") is None:
+            # The messages are fetched during the transfer.
+            messages = []
+            before, after = kwargs.get("before"), kwargs.get("after")
+            # The messages sent after the command aren't transferred.
+            if before is None:
+                before = discord.Object(
+                    discord.utils.time_snowflake(datetime.datetime.now(tz=datetime.timezone.utc))
+                )
+            state = await self.start_transfer(
+                ctx,
+                source=source,
+                destination=destination,
+                way=way,
+                before=before.id,
+                after=after.id if after is not None else 0,
+                user_id=kwargs.get("user_id"),
+                bot=kwargs.get("bot"),
+                exclude_users_and_roles=kwargs.get("exclude_users_and_roles", []),
+            )
+        else:
+            __, messages = await self.get_messages(ctx, channel=source, **kwargs)
+            messages.reverse()
+            state = await self.start_transfer(
+                ctx,
+                source=source,
+                destination=destination,
+                way=way,
+                before=messages[-1].id + 1,
+                after=messages[0].id - 1,
+                total_messages=len(messages),
+                user_id=kwargs.get("user_id"),
+                bot=kwargs.get("bot"),
+                exclude_users_and_roles=kwargs.get("exclude_users_and_roles", []),
+            )
+        if (
+            count_messages := await self.run_transfer_task(
+                state, ctx=ctx, messages=messages or None
+            )
+        ) is None:
+            raise commands.UserFeedbackCheckFailure(_("The transfer has been cancelled."))
+        if count_messages == 0:
+            raise commands.UserFeedbackCheckFailure(_("Sorry. I could not find any messages."))
         return count_messages, messages
 
+    async def start_transfer(
+        self,
+        ctx: commands.Context,
+        source: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+        destination: typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread],
+        way: typing.Literal["webhooks", "embeds", "messages"],
+        before: int,
+        after: int,
+        total_messages: typing.Optional[int] = None,
+        user_id: typing.Optional[int] = None,
+        bot: typing.Optional[bool] = None,
+        exclude_users_and_roles: typing.List[typing.Union[discord.User, discord.Role]] = [],
+    ) -> typing.Dict[str, typing.Any]:
+        state = {
+            "source_id": source.id,
+            "destination_id": destination.id,
+            "channel_id": ctx.channel.id,
+            "author_id": ctx.author.id,
+            "ignored_message_id": ctx.message.id,
+            "way": way,
+            # The range of the messages, to find the remaining ones after a restart.
+            "before": before,
+            "after": after,
+            "user_id": user_id,
+            "bot": bot,
+            "exclude_users_and_roles": [
+                user_or_role.id for user_or_role in exclude_users_and_roles
+            ],
+            "total_messages": total_messages,  # Unknown for a streamed history.
+            "started_at": int(time.time()),
+            "progress_message_id": None,
+            # Checkpoint.
+            "last_message_id": None,
+            "count_messages": 0,
+        }
+        async with self.config.transfers() as transfers:
+            transfers[str(destination.id)] = state
+        return state
+
+    async def run_transfer_task(
+        self,
+        state: typing.Dict[str, typing.Any],
+        ctx: typing.Optional[commands.Context] = None,
+        messages: typing.Optional[typing.List[discord.Message]] = None,
+    ) -> typing.Optional[int]:
+        task = asyncio.create_task(self.run_transfer(state, messages=messages))
+        self.transfers_tasks[state["destination_id"]] = task
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            return None
+        except commands.UserFeedbackCheckFailure:
+            if ctx is not None:
+                raise
+            return None
+        except Exception as e:
+            self.logger.error(
+                f"Error when transferring the messages from {state['source_id']} to {state['destination_id']}, use the `transferchannel resume` command to resume it.",
+                exc_info=e,
+            )
+            if ctx is not None:
+                raise commands.UserFeedbackCheckFailure(
+                    _(
+                        "An error occurred during the transfer. Use `{prefix}transferchannel resume` to resume it from the last transferred message."
+                    ).format(prefix=ctx.clean_prefix)
+                )
+            return None
+        finally:
+            if self.transfers_tasks.get(state["destination_id"]) is task:
+                del self.transfers_tasks[state["destination_id"]]
+        if result is None or ctx is not None:
+            return result
+        # Resumed after a restart: the result is sent in the channel of the command.
+        if (channel := self.bot.get_channel(state["channel_id"])) is not None:
+            await channel.send(
+                _(RESULT_MESSAGE).format(
+                    count_messages=result,
+                    source=self.bot.get_channel(state["source_id"]),
+                    destination=self.bot.get_channel(state["destination_id"]),
+                )
+            )
+        return result
+
+    async def run_transfer(
+        self,
+        state: typing.Dict[str, typing.Any],
+        messages: typing.Optional[typing.List[discord.Message]] = None,
+        max_retries: int = 5,
+    ) -> typing.Optional[int]:
+        """Run a transfer from its last transferred message, and retry from it after a transient error."""
+        retries = 0
+        while True:
+            try:
+                result = await self.stream_transfer(state, messages=messages)
+            except (discord.DiscordServerError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if retries >= max_retries:
+                    raise
+                retries += 1
+                self.logger.warning(
+                    f"Transient error when transferring the messages from {state['source_id']} to {state['destination_id']}, resuming from the last transferred message in {2 ** retries} seconds.",
+                    exc_info=e,
+                )
+                await asyncio.sleep(2**retries)
+                messages = None  # The remaining messages are fetched again.
+                continue
+            async with self.config.transfers() as transfers:
+                transfers.pop(str(state["destination_id"]), None)
+            return result
+
+    async def stream_transfer(
+        self,
+        state: typing.Dict[str, typing.Any],
+        messages: typing.Optional[typing.List[discord.Message]] = None,
+        checkpoint_interval: int = 10,
+    ) -> typing.Optional[int]:
+        """Transfer the remaining messages of a journaled transfer.
+
+        The journal is saved in Config every 10 transferred messages and when the transfer is
+        stopped, so that a resumed transfer doesn't send again the already transferred messages.
+        """
+        if (source := self.bot.get_channel(state["source_id"])) is None or (
+            destination := self.bot.get_channel(state["destination_id"])
+        ) is None:
+            async with self.config.transfers() as transfers:
+                transfers.pop(str(state["destination_id"]), None)
+            return None
+        channel = self.bot.get_channel(state["channel_id"])
+        if messages is None:
+            messages = self.iter_messages(
+                source,
+                before=discord.Object(state["before"]),
+                after=discord.Object(state["last_message_id"] or state["after"]),
+                user_id=state["user_id"],
+                bot=state["bot"],
+                exclude_users_and_roles=[
+                    discord.Object(user_or_role_id)
+                    for user_or_role_id in state["exclude_users_and_roles"]
+                ],
+                ignored_message_id=state["ignored_message_id"],
+            )
+
+        # Without the count of the messages, the progress is estimated with the creation date of
+        # the last transferred message.
+        start_time = (
+            discord.utils.snowflake_time(state["after"]) if state["after"] else source.created_at
+        ).timestamp()
+        end_time = discord.utils.snowflake_time(state["before"]).timestamp()
+        run_start = last_progress = time.monotonic()
+        run_start_ratio, run_count_messages = None, 0
+
+        def get_ratio(message: discord.Message) -> float:
+            if state["total_messages"] is not None:
+                return state["count_messages"] / state["total_messages"]
+            if end_time <= start_time:
+                return 1
+            return min(
+                max((message.created_at.timestamp() - start_time) / (end_time - start_time), 0),
+                1,
+            )
+
+        async def save_checkpoint() -> None:
+            await self.config.transfers.set_raw(str(state["destination_id"]), value=state)
+
+        async def update_progress(message: discord.Message) -> None:
+            nonlocal last_progress
+            if channel is None or time.monotonic() - last_progress < 10:
+                return
+            last_progress = time.monotonic()
+            elapsed = last_progress - run_start
+            ratio = get_ratio(message)
+            eta = (
+                elapsed * (1 - ratio) / (ratio - run_start_ratio)
+                if ratio > run_start_ratio
+                else None
+            )
+            content = _(
+                "Transferring the messages from {source.mention} to {destination.mention}... {count_messages} messages transferred ({percent:.1%}), {rate:.1f} messages/s, ETA: {eta}."
+            ).format(
+                source=source,
+                destination=destination,
+                count_messages=state["count_messages"],
+                percent=ratio,
+                rate=run_count_messages / elapsed,
+                eta=discord.utils.format_dt(
+                    datetime.datetime.now(tz=datetime.timezone.utc)
+                    + datetime.timedelta(seconds=eta),
+                    style="R",
+                )
+                if eta is not None
+                else _("unknown"),
+            )
+            try:
+                if state["progress_message_id"] is not None:
+                    await channel.get_partial_message(state["progress_message_id"]).edit(
+                        content=content
+                    )
+                    return
+            except discord.NotFound:
+                pass
+            state["progress_message_id"] = (await channel.send(content)).id
+
+        async def on_message_sent(message: discord.Message) -> None:
+            nonlocal run_count_messages, run_start_ratio
+            if run_start_ratio is None:  # The ratio before this first transferred message.
+                run_start_ratio = get_ratio(message)
+            state["last_message_id"] = message.id
+            state["count_messages"] += 1
+            run_count_messages += 1
+            if run_count_messages % checkpoint_interval == 0:
+                await save_checkpoint()
+            await update_progress(message)
+
+        try:
+            await self.send_messages(
+                source=source,
+                destination=destination,
+                way=state["way"],
+                messages=messages,
+                on_message_sent=on_message_sent,
+            )
+        finally:
+            if (
+                run_count_messages % checkpoint_interval != 0
+                and str(state["destination_id"]) in await self.config.transfers()
+            ):
+                await save_checkpoint()
+        if channel is not None and state["progress_message_id"] is not None:
+            try:
+                await channel.get_partial_message(state["progress_message_id"]).delete()
+            except discord.HTTPException:
+                pass
+        return state["count_messages"]
+
     @commands.guildowner_or_permissions(administrator=True)
     @commands.hybrid_group(name="transferchannel", aliases=["channeltransfer"])
     async def transferchannel(self, ctx: commands.Context) -> None:
@@ -533,3 +1068,71 @@ async def bot(
                 count_messages=count_messages, source=source, destination=destination
             )
         ).start(ctx)
+
+    @transferchannel.command()
+    async def resume(
+        self,
+        ctx: commands.Context,
+        destination: typing.Optional[
+            typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
+        ] = None,
+    ) -> None:
+        """Resume an interrupted transfer from its last transferred message.
+
+        Specify the destination channel of the transfer.
+        """
+        if destination is None:
+            destination = ctx.channel
+        if (state := (await self.config.transfers()).get(str(destination.id))) is None:
+            raise commands.UserFeedbackCheckFailure(_("No transfer to resume to this channel."))
+        if destination.id in self.transfers_tasks:
+            raise commands.UserFeedbackCheckFailure(
+                _("The transfer to this channel is already in progress.")
+            )
+        if (source := ctx.bot.get_channel(state["source_id"])) is None:
+            raise commands.UserFeedbackCheckFailure(
+                _("The source channel of this transfer doesn't exist anymore.")
+            )
+        await self.check_channels(source=source, destination=destination, way=state["way"])
+        await ctx.send(
+            _("Resuming the transfer from {source.mention} to {destination.mention}...").format(
+                source=source, destination=destination
+            )
+        )
+        if (count_messages := await self.run_transfer_task(state, ctx=ctx)) is None:
+            return
+        await Menu(
+            pages=_(RESULT_MESSAGE).format(
+                count_messages=count_messages, source=source, destination=destination
+            )
+        ).start(ctx)
+
+    @transferchannel.command()
+    async def cancel(
+        self,
+        ctx: commands.Context,
+        destination: typing.Optional[
+            typing.Union[discord.TextChannel, discord.VoiceChannel, discord.Thread]
+        ] = None,
+    ) -> None:
+        """Cancel a transfer in progress or interrupted.
+
+        Specify the destination channel of the transfer.
+        """
+        if destination is None:
+            destination = ctx.channel
+        if str(destination.id) not in await self.config.transfers():
+            raise commands.UserFeedbackCheckFailure(_("No transfer to cancel to this channel."))
+        if (task := self.transfers_tasks.pop(destination.id, None)) is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        async with self.config.transfers() as transfers:
+            state = transfers.pop(str(destination.id), None)
+        await ctx.send(
+            _(
+                "Transfer to {destination.mention} cancelled, after {count_messages} transferred messages."
+            ).format(destination=destination, count_messages=state["count_messages"])
+        )